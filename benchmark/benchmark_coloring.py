@@ -0,0 +1,50 @@
+"""Benchmarks for coloring large, sparse total jacobians."""
+import unittest
+
+import numpy as np
+from scipy.sparse import coo_matrix
+
+from openmdao.utils.coloring import _compute_coloring
+
+
+def _banded_sparsity(n, bandwidth):
+    rows = []
+    cols = []
+    for k in range(-bandwidth, bandwidth + 1):
+        r = np.arange(max(0, -k), min(n, n - k))
+        rows.append(r)
+        cols.append(r + k)
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    return coo_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(n, n))
+
+
+def _random_sparsity(nrows, ncols, nnz_per_row, seed=11):
+    rng = np.random.RandomState(seed)
+    rows = np.repeat(np.arange(nrows), nnz_per_row)
+    cols = rng.randint(0, ncols, rows.size)
+    J = coo_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(nrows, ncols))
+    J.sum_duplicates()
+    return J
+
+
+class BM(unittest.TestCase):
+    """Coloring of large, very sparse total jacobians."""
+
+    def benchmark_banded_10K_fwd(self):
+        _compute_coloring(_banded_sparsity(10000, 3), 'fwd')
+
+    def benchmark_banded_10K_bidir(self):
+        _compute_coloring(_banded_sparsity(10000, 3), 'auto')
+
+    def benchmark_banded_100K_fwd(self):
+        _compute_coloring(_banded_sparsity(100000, 3), 'fwd')
+
+    def benchmark_random_10K_fwd(self):
+        _compute_coloring(_random_sparsity(10000, 10000, 5), 'fwd')
+
+    def benchmark_random_10K_rev(self):
+        _compute_coloring(_random_sparsity(10000, 10000, 5), 'rev')
+
+    def benchmark_random_10K_bidir(self):
+        _compute_coloring(_random_sparsity(10000, 10000, 5), 'auto')
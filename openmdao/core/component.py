@@ -3,6 +3,7 @@
 from __future__ import division
 
 from collections import OrderedDict, Iterable, Counter, defaultdict
+from copy import deepcopy
 from itertools import product
 from six import string_types, iteritems, itervalues
 
@@ -14,6 +15,7 @@ from openmdao.core.system import System, _supported_methods, _DEFAULT_COLORING_M
 from openmdao.approximation_schemes.complex_step import ComplexStep
 from openmdao.approximation_schemes.finite_difference import FiniteDifference
 from openmdao.jacobians.dictionary_jacobian import DictionaryJacobian
+from openmdao.jacobians.jacobian import _stamp_subjac
 from openmdao.vectors.vector import INT_DTYPE
 from openmdao.utils.units import valid_units
 from openmdao.utils.name_maps import rel_key2abs_key, abs_key2rel_key, rel_name2abs_name
@@ -76,6 +78,12 @@ class Component(System):
         Cached storage of user-declared partials.
     _declared_partial_checks : list
         Cached storage of user-declared check partial options.
+    _memo : dict
+        For each kind of memoized call, the values it depended on and its result, saved when
+        the skip_unchanged option is in effect.
+    _memo_hits : Counter
+        Number of calls skipped because the values they depend on were unchanged, for each kind
+        of memoized call.
     """
 
     def __init__(self, **kwargs):
@@ -98,6 +106,9 @@ class Component(System):
         self._declared_partials = defaultdict(dict)
         self._declared_partial_checks = []
 
+        self._memo = {}
+        self._memo_hits = Counter()
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -107,6 +118,10 @@ class Component(System):
         self.options.declare('distributed', types=bool, default=False,
                              desc='True if the component has variables that are distributed '
                                   'across multiple processes.')
+        self.options.declare('compile_jac', types=bool, default=False,
+                             desc='If True, compile the partial derivatives of this component '
+                                  'into sparse operators so that each matrix-vector product is '
+                                  'a single sparse product instead of a loop over sub-jacobians.')
 
     @property
     def distributed(self):
@@ -185,6 +200,8 @@ class Component(System):
         self._mode = mode
         self._subsystems_proc_range = []
         self._first_call_to_linearize = True
+        self._memo = {}
+        self._memo_hits = Counter()
 
         # Clear out old variable information so that we can call setup on the component.
         self._var_rel_names = {'input': [], 'output': []}
@@ -360,7 +377,7 @@ class Component(System):
             Whether to call this method in subsystems.
         """
         self._subjacs_info = {}
-        self._jacobian = DictionaryJacobian(system=self)
+        self._jacobian = DictionaryJacobian(system=self, compile_jac=self.options['compile_jac'])
 
         for key, dct in iteritems(self._declared_partials):
             of, wrt = key
@@ -1247,6 +1264,7 @@ class Component(System):
                 self._check_partials_meta(abs_key, meta['value'],
                                           shape if rows is None else (rows.shape[0], 1))
 
+                _stamp_subjac(meta)
                 self._subjacs_info[abs_key] = meta
 
     def _find_partial_matches(self, of, wrt):
@@ -1318,6 +1336,75 @@ class Component(System):
             meta = subjacs[key]
             self._approx_schemes[meta['method']].add_approximation(key, self, meta)
 
+    def _memo_key(self, outputs=False):
+        """
+        Return copies of the values that a memoized call depends on.
+
+        Parameters
+        ----------
+        outputs : bool
+            If True, the call also depends on the outputs.
+
+        Returns
+        -------
+        list
+            Copies of the input values, followed by the output values if requested.
+        """
+        key = [self._inputs._data.copy()]
+        if self._discrete_inputs:
+            key.append(deepcopy([val for _, val in self._discrete_inputs.items()]))
+        if outputs:
+            key.append(self._outputs._data.copy())
+            if self._discrete_outputs:
+                key.append(deepcopy([val for _, val in self._discrete_outputs.items()]))
+        return key
+
+    def _memo_get(self, kind, outputs=False):
+        """
+        Return the result saved for a call if the values it depends on are unchanged.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of memoized call.
+        outputs : bool
+            If True, the call also depends on the outputs.
+
+        Returns
+        -------
+        list or None
+            The values the call depends on, to be passed to _memo_set, or None if the call is
+            not memoized.
+        object or None
+            The saved result, or None if the call must be made.
+        """
+        if not self._skip_unchanged or self.under_complex_step:
+            return None, None
+
+        key = self._memo_key(outputs)
+        entry = self._memo.get(kind)
+        if entry is not None and _memo_equal(entry[0], key):
+            self._memo_hits[kind] += 1
+            return key, entry[1]
+
+        return key, None
+
+    def _memo_set(self, kind, key, result):
+        """
+        Save the result of a call.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of memoized call.
+        key : list or None
+            The values the call depended on, as returned by _memo_get.
+        result : object
+            The result of the call.
+        """
+        if key is not None:
+            self._memo[kind] = (key, result)
+
     def _guess_nonlinear(self):
         """
         Provide initial guess for states.
@@ -1346,6 +1433,40 @@ class Component(System):
                     self._update_subjac_sparsity(coloring.get_subjac_sparsity())
 
 
+def _memo_equal(old, new):
+    """
+    Return True if two lists of values saved by Component._memo_key are equal.
+
+    Parameters
+    ----------
+    old : list
+        Values saved for the previous call.
+    new : list
+        Current values.
+
+    Returns
+    -------
+    bool
+        True if all the values are equal.
+    """
+    if len(old) != len(new):
+        return False
+
+    for a, b in zip(old, new):
+        if isinstance(a, ndarray):
+            if not np.array_equal(a, b):
+                return False
+        else:
+            try:
+                if not a == b:
+                    return False
+            except ValueError:
+                # discrete values holding arrays can't be compared as a whole.
+                return False
+
+    return True
+
+
 class _DictValues(object):
     """
     A dict-like wrapper for a dict of metadata, where getitem returns 'value' from metadata.
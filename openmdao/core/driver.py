@@ -2,6 +2,7 @@
 from __future__ import print_function
 
 from collections import OrderedDict
+from copy import deepcopy
 import pprint
 import sys
 import os
@@ -91,6 +92,22 @@ class Driver(object):
         Dict of sparse subjacobians for use with certain optimizers, e.g. pyOptSparseDriver.
     _total_jac : _TotalJacInfo or None
         Cached total jacobian handling object.
+    _total_jac_cache : dict
+        Total jacobian handling objects keyed by the arguments they were created with. They are
+        reused until the model vectors are set up again.
+    _total_jac_cache_vectors : dict or None
+        The model's vectors when the objects in _total_jac_cache were created.
+    _totals_memo : dict
+        Totals computed at the current model state, keyed by the arguments of _compute_totals.
+        Only used if the 'memoize_totals' option is True.
+    _totals_memo_state : tuple of ndarray or None
+        Copies of the model input and output vectors at the time the memoized totals were
+        computed.
+    _totals_memo_hits : int
+        Number of _compute_totals calls answered from the memoized totals.
+    _totals_memo_misses : int
+        Number of _compute_totals calls that had to compute the totals while memoization was
+        active.
     """
 
     def __init__(self, **kwargs):
@@ -119,6 +136,10 @@ class Driver(object):
                                   "iteration. Valid items in list are 'desvars', 'ln_cons', "
                                   "'nl_cons', 'objs', 'totals'",
                              default=[])
+        self.options.declare('memoize_totals', types=bool, default=False,
+                             desc='If True, reuse the total derivatives computed at the current '
+                                  'design point and model input state instead of repeating the '
+                                  'linear solves when the same totals are requested again.')
 
         # Case recording options
         self.recording_options = OptionsDictionary(parent_name=type(self).__name__)
@@ -168,6 +189,12 @@ class Driver(object):
         self._total_jac_sparsity = None
         self._res_jacs = {}
         self._total_jac = None
+        self._total_jac_cache = {}
+        self._total_jac_cache_vectors = None
+        self._totals_memo = {}
+        self._totals_memo_state = None
+        self._totals_memo_hits = 0
+        self._totals_memo_misses = 0
 
         self.fail = False
 
@@ -244,6 +271,7 @@ class Driver(object):
         model = problem.model
 
         self._total_jac = None
+        self._invalidate_totals_memo()
 
         self._has_scaling = (
             np.any([r['scaler'] is not None for r in itervalues(self._responses)]) or
@@ -575,6 +603,7 @@ class Driver(object):
             Value for the design variable.
         """
         problem = self._problem
+        self._invalidate_totals_memo()
 
         if (name in self._remote_dvs and
                 problem.model._owning_rank[name] != problem.comm.rank):
@@ -793,7 +822,8 @@ class Driver(object):
         return_format : string
             Format to return the derivatives. Default is a 'flat_dict', which
             returns them in a dictionary whose keys are tuples of form (of, wrt). For
-            the scipy optimizer, 'array' is also supported.
+            the scipy optimizer, 'array' is also supported. 'sparse' and 'sparse_dict' return
+            scipy sparse matrices, storing only the nonzeros when a total coloring is set.
         global_names : bool
             Set to True when passing in global names to skip some translation steps.
 
@@ -804,9 +834,17 @@ class Driver(object):
         """
         problem = self._problem
         total_jac = self._total_jac
+        if total_jac is not None and total_jac.return_format != return_format:
+            total_jac = None
         debug_print = 'totals' in self.options['debug_print'] and (not MPI or
                                                                    MPI.COMM_WORLD.rank == 0)
 
+        memo_key = ('driver', None if of is None else tuple(of),
+                    None if wrt is None else tuple(wrt), global_names, return_format)
+        totals = self._get_memoized_totals(memo_key)
+        if totals is not None:
+            return totals
+
         if debug_print:
             header = 'Driver total derivatives for iteration: ' + str(self.iter_count)
             print(header)
@@ -832,8 +870,8 @@ class Driver(object):
 
         else:
             if total_jac is None:
-                total_jac = _TotalJacInfo(problem, of, wrt, global_names, return_format,
-                                          debug_print=debug_print)
+                total_jac = self._get_total_jac_info(of, wrt, global_names, return_format,
+                                                     debug_print=debug_print)
 
                 # don't cache linear constraint jacobian
                 if not total_jac.has_lin_cons:
@@ -850,8 +888,142 @@ class Driver(object):
             metadata = create_local_meta(self._get_name())
             total_jac.record_derivatives(self, metadata)
 
+        return self._memoize_totals(memo_key, totals)
+
+    def _get_memoized_totals(self, key):
+        """
+        Return the totals memoized under the given key at the current model state.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying the requested totals.
+
+        Returns
+        -------
+        object or None
+            A copy of the memoized totals, or None if memoization is off or there is no valid
+            entry.
+        """
+        if not self.options['memoize_totals']:
+            return None
+
+        if self._check_totals_memo_state() and key in self._totals_memo:
+            self._totals_memo_hits += 1
+            # callers may modify the totals in place, so never hand out the memoized object.
+            return deepcopy(self._totals_memo[key])
+
+        self._totals_memo_misses += 1
+
+    def _memoize_totals(self, key, totals):
+        """
+        Store the given totals under key if memoization is on.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying the computed totals.
+        totals : object
+            Totals computed at the current model state.
+
+        Returns
+        -------
+        object
+            The given totals.
+        """
+        if self.options['memoize_totals']:
+            # store a copy, since the _TotalJacInfo overwrites its jacobian on the next compute
+            # and callers may modify the totals in place.
+            self._totals_memo[key] = deepcopy(totals)
+
         return totals
 
+    def _check_totals_memo_state(self):
+        """
+        Check that the model state matches the one the memoized totals were computed at.
+
+        If it doesn't, the memoized totals are discarded and the current state is saved.
+
+        Returns
+        -------
+        bool
+            True if the memoized totals are still valid for the current model state.
+        """
+        model = self._problem.model
+        state = (model._inputs._data, model._outputs._data)
+        old_state = self._totals_memo_state
+
+        same = old_state is not None and all(np.array_equal(old, new)
+                                             for old, new in zip(old_state, state))
+
+        # every proc must agree, otherwise some would skip the linear solves that others do.
+        comm = self._problem.comm
+        if comm.size > 1:
+            same = comm.allreduce(same, op=MPI.LAND)
+
+        if not same:
+            self._totals_memo.clear()
+            self._totals_memo_state = tuple(vec.copy() for vec in state)
+
+        return same
+
+    def _invalidate_totals_memo(self):
+        """
+        Discard any memoized totals, e.g. because design variables or the model have changed.
+        """
+        self._totals_memo.clear()
+        self._totals_memo_state = None
+
+    def _get_total_jac_info(self, of, wrt, global_names, return_format, debug_print=False,
+                            driver_scaling=True):
+        """
+        Return the object that computes a total jacobian, reusing a cached one if possible.
+
+        Creating the object works out the indexing, relevance and scatters needed by the
+        linear solves. These only depend on the model structure and the arguments, so the object
+        is cached and only the solves are repeated on later calls.
+
+        Parameters
+        ----------
+        of : list of variable name strings or None
+            Variables whose derivatives will be computed.
+        wrt : list of variable name strings or None
+            Variables with respect to which the derivatives will be computed.
+        global_names : bool
+            If True, names in of and wrt are global names.
+        return_format : str
+            Format of the returned derivatives.
+        debug_print : bool
+            Set to True to print out debug and timing information for each derivative solved.
+        driver_scaling : bool
+            If True, scale derivative values by the quantities specified when the desvars
+            and responses were added.
+
+        Returns
+        -------
+        _TotalJacInfo
+            The object that computes the total jacobian.
+        """
+        problem = self._problem
+
+        # The objects refer to the model's vectors, which are replaced whenever the model is set
+        # up again, including reconfiguration with System.resetup.
+        if self._total_jac_cache_vectors is not problem.model._vectors:
+            self._total_jac_cache = {}
+            self._total_jac_cache_vectors = problem.model._vectors
+
+        key = (None if of is None else tuple(of), None if wrt is None else tuple(wrt),
+               global_names, return_format, debug_print, driver_scaling, problem._mode,
+               self._coloring_info['coloring'])
+
+        try:
+            return self._total_jac_cache[key]
+        except KeyError:
+            total_jac = _TotalJacInfo(problem, of, wrt, global_names, return_format,
+                                      debug_print=debug_print, driver_scaling=driver_scaling)
+            self._total_jac_cache[key] = total_jac
+            return total_jac
+
     def record_iteration(self):
         """
         Record an iteration of the current Driver.
@@ -1004,7 +1176,8 @@ class Driver(object):
                          orders=coloring_mod._DEF_COMP_SPARSITY_ARGS['orders'],
                          perturb_size=coloring_mod._DEF_COMP_SPARSITY_ARGS['perturb_size'],
                          show_summary=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_summary'],
-                         show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity']):
+                         show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity'],
+                         select_mode=False):
         """
         Set options for total deriv coloring.
 
@@ -1022,6 +1195,9 @@ class Driver(object):
             If True, display summary information after generating coloring.
         show_sparsity : bool
             If True, display sparsity with coloring info after generating coloring.
+        select_mode : bool
+            If True and the problem mode is 'auto', time some fwd and rev linear solves and use
+            whichever of the fwd, rev or bidirectional colorings is estimated to be cheapest.
         """
         self._coloring_info['num_full_jacs'] = num_full_jacs
         self._coloring_info['tol'] = tol
@@ -1030,6 +1206,7 @@ class Driver(object):
         self._coloring_info['coloring'] = coloring_mod._DYN_COLORING
         self._coloring_info['show_summary'] = show_summary
         self._coloring_info['show_sparsity'] = show_sparsity
+        self._coloring_info['select_mode'] = select_mode
 
     def use_fixed_coloring(self, coloring=coloring_mod._STD_COLORING_FNAME):
         """
@@ -2,6 +2,8 @@
 
 from __future__ import division
 
+from copy import deepcopy
+
 import numpy as np
 from six import itervalues, iteritems
 from six.moves import range
@@ -240,15 +242,7 @@ class ExplicitComponent(Component):
                 # Sign of the residual is minus the sign of the output vector.
                 residuals *= -1.0
 
-                self._inputs.read_only = True
-                try:
-                    if self._discrete_inputs or self._discrete_outputs:
-                        self.compute(self._inputs, self._outputs, self._discrete_inputs,
-                                     self._discrete_outputs)
-                    else:
-                        self.compute(self._inputs, self._outputs)
-                finally:
-                    self._inputs.read_only = False
+                self._compute_wrapper()
 
                 residuals += outputs
                 outputs -= residuals
@@ -262,15 +256,33 @@ class ExplicitComponent(Component):
         with Recording(self.pathname + '._solve_nonlinear', self.iter_count, self):
             with self._unscaled_context(outputs=[self._outputs], residuals=[self._residuals]):
                 self._residuals.set_const(0.0)
-                self._inputs.read_only = True
-                try:
-                    if self._discrete_inputs or self._discrete_outputs:
-                        self.compute(self._inputs, self._outputs, self._discrete_inputs,
-                                     self._discrete_outputs)
-                    else:
-                        self.compute(self._inputs, self._outputs)
-                finally:
-                    self._inputs.read_only = False
+                self._compute_wrapper()
+
+    def _compute_wrapper(self):
+        """
+        Call compute, or restore its previous outputs if the inputs are unchanged.
+        """
+        key, saved = self._memo_get('compute')
+        if saved is not None:
+            self._outputs._data[:] = saved[0]
+            for name, val in iteritems(saved[1]):
+                self._discrete_outputs[name] = deepcopy(val)
+            return
+
+        self._inputs.read_only = True
+        try:
+            if self._discrete_inputs or self._discrete_outputs:
+                self.compute(self._inputs, self._outputs, self._discrete_inputs,
+                             self._discrete_outputs)
+            else:
+                self.compute(self._inputs, self._outputs)
+        finally:
+            self._inputs.read_only = False
+
+        if key is not None:
+            discrete = deepcopy(dict(self._discrete_outputs.items())) \
+                if self._discrete_outputs else {}
+            self._memo_set('compute', key, (self._outputs._data.copy(), discrete))
 
     def _apply_linear(self, jac, vec_names, rel_systems, mode, scope_out=None, scope_in=None):
         """
@@ -402,6 +414,12 @@ class ExplicitComponent(Component):
 
         self._check_first_linearize()
 
+        # the jacobian still holds the partials if the inputs are unchanged.
+        key, saved = self._memo_get('partials')
+        if saved is not None:
+            self._jacobian._update(self)
+            return
+
         with self._unscaled_context(outputs=[self._outputs], residuals=[self._residuals]):
             # Computing the approximation before the call to compute_partials allows users to
             # override FD'd values.
@@ -424,6 +442,9 @@ class ExplicitComponent(Component):
                 finally:
                     self._inputs.read_only = False
 
+        self._memo_set('partials', key, True)
+        self._jacobian._update(self)
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
         Compute outputs given inputs. The model is assumed to be in an unscaled state.
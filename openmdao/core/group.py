@@ -14,6 +14,7 @@ from six.moves import range
 
 import numpy as np
 import networkx as nx
+from scipy.spatial import cKDTree
 
 from openmdao.jacobians.dictionary_jacobian import DictionaryJacobian
 from openmdao.approximation_schemes.complex_step import ComplexStep
@@ -21,7 +22,7 @@ from openmdao.approximation_schemes.finite_difference import FiniteDifference
 from openmdao.core.system import System, INT_DTYPE, get_relevant_vars
 from openmdao.core.component import Component, _DictValues, _full_slice
 from openmdao.proc_allocators.default_allocator import DefaultAllocator, ProcAllocationError
-from openmdao.jacobians.jacobian import SUBJAC_META_DEFAULTS
+from openmdao.jacobians.jacobian import SUBJAC_META_DEFAULTS, _stamp_subjac
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.solvers.nonlinear.nonlinear_runonce import NonlinearRunOnce
 from openmdao.solvers.linear.linear_runonce import LinearRunOnce
@@ -74,6 +75,15 @@ class Group(System):
         Mapping of local subsystem names to their corresponding System.
     _approx_subjac_keys : list
         List of subjacobian keys used for approximated derivatives.
+    _state_cache : OrderedDict
+        Converged states keyed by the bytes of the design point they were computed at, in least
+        recently used order. Each value is a (design point, states) tuple of arrays.
+    _state_cache_tree : (cKDTree, list) or None
+        KD-tree of the design points in _state_cache and the matching cache values, rebuilt
+        after entries are added or removed.
+    _state_cache_names : (list, list, list) or None
+        Names of the inputs and outputs defining the design point and names of the outputs
+        stored in the state cache.
     """
 
     def __init__(self, **kwargs):
@@ -100,6 +110,9 @@ class Group(System):
         self._transfers = {}
         self._discrete_transfers = {}
         self._approx_subjac_keys = None
+        self._state_cache = OrderedDict()
+        self._state_cache_tree = None
+        self._state_cache_names = None
 
         # TODO: we cannot set the solvers with property setters at the moment
         # because our lint check thinks that we are defining new attributes
@@ -109,6 +122,22 @@ class Group(System):
         if not self._linear_solver:
             self._linear_solver = LinearRunOnce()
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super(Group, self)._declare_options()
+
+        self.options.declare('cache_states', types=bool, default=False,
+                             desc='If True, store the outputs of this group after each '
+                             'converged nonlinear solve, and use the outputs stored for the '
+                             'nearest design point as the initial guess of later solves. '
+                             'Any guess_nonlinear methods in this group and its subsystems are '
+                             'applied afterwards, so their guesses take precedence.')
+        self.options.declare('state_cache_size', types=int, default=20, lower=1,
+                             desc='Number of design points kept when cache_states is True. The '
+                             'point that was least recently solved is dropped first.')
+
     def setup(self):
         """
         Build this group.
@@ -287,6 +316,12 @@ class Group(System):
             if subsys.matrix_free:
                 self.matrix_free = True
 
+        if self.options['cache_states']:
+            if self.comm.size > 1:
+                raise RuntimeError("{}: Option 'cache_states' is not supported under "
+                                   "MPI.".format(self.msginfo))
+            self._has_guess = True
+
         self._static_mode = False
         try:
             self.configure()
@@ -563,6 +598,10 @@ class Group(System):
             Whether to call this method in subsystems.
         """
         super(Group, self)._setup_var_data()
+        self._state_cache = OrderedDict()
+        self._state_cache_tree = None
+        self._state_cache_names = None
+
         allprocs_abs_names = self._var_allprocs_abs_names
         allprocs_discrete = self._var_allprocs_discrete
         abs_names = self._var_abs_names
@@ -575,6 +614,7 @@ class Group(System):
 
         for subsys in self._subsystems_myproc:
             if recurse:
+                subsys._skip_unchanged = self._skip_unchanged
                 subsys._setup_var_data(recurse)
                 self._has_output_scaling |= subsys._has_output_scaling
                 self._has_resid_scaling |= subsys._has_resid_scaling
@@ -1165,32 +1205,15 @@ class Group(System):
             If int, perform a partial transfer for linear Gauss--Seidel.
         """
         vec_inputs = self._vectors['input'][vec_name]
+        xfer = self._transfers[vec_name][mode, isub]
 
-        if mode == 'fwd':
-            if self._has_input_scaling:
-                vec_inputs.scale('norm')
-                self._transfers[vec_name][mode, isub]._transfer(vec_inputs,
-                                                                self._vectors['output'][vec_name],
-                                                                mode)
-                vec_inputs.scale('phys')
-            else:
-                self._transfers[vec_name][mode, isub]._transfer(vec_inputs,
-                                                                self._vectors['output'][vec_name],
-                                                                mode)
-            if self._conn_discrete_in2out and vec_name == 'nonlinear':
-                self._discrete_transfer(isub)
-
-        else:  # rev
-            if self._has_input_scaling:
-                vec_inputs.scale('phys')
-                self._transfers[vec_name][mode, isub]._transfer(vec_inputs,
-                                                                self._vectors['output'][vec_name],
-                                                                mode)
-                vec_inputs.scale('norm')
-            else:
-                self._transfers[vec_name][mode, isub]._transfer(vec_inputs,
-                                                                self._vectors['output'][vec_name],
-                                                                mode)
+        if self._has_input_scaling:
+            xfer._scaled_transfer(vec_inputs, self._vectors['output'][vec_name], mode)
+        else:
+            xfer._transfer(vec_inputs, self._vectors['output'][vec_name], mode)
+
+        if mode == 'fwd' and self._conn_discrete_in2out and vec_name == 'nonlinear':
+            self._discrete_transfer(isub)
 
     def _discrete_transfer(self, isub):
         """
@@ -1589,10 +1612,21 @@ class Group(System):
         with Recording(name + '._solve_nonlinear', self.iter_count, self):
             self._nonlinear_solver.solve()
 
+        if self.options['cache_states'] and self._nonlinear_solver._converged and \
+                not self.under_complex_step:
+            self._store_states()
+
     def _guess_nonlinear(self):
         """
         Provide initial guess for states.
         """
+        complex_step = self._inputs._under_complex_step
+
+        # start from the stored states, so that guess_nonlinear methods in this group and below
+        # can still refine or replace them.
+        if self.options['cache_states'] and not complex_step:
+            self._load_states()
+
         # let any lower level systems do their guessing first
         if self._has_guess:
             for ind, sub in enumerate(self._subsystems_myproc):
@@ -1603,8 +1637,6 @@ class Group(System):
 
         # call our own guess_nonlinear method, after the recursion is done to
         # all the lower level systems and the data transfers have happened
-        complex_step = self._inputs._under_complex_step
-
         if complex_step:
             self._inputs.set_complex_step_mode(False, keep_real=True)
             self._residuals.set_complex_step_mode(False, keep_real=True)
@@ -1632,6 +1664,111 @@ class Group(System):
             self._outputs.set_complex_step_mode(True)
             self._outputs._data[:] += imag_cache * 1j
 
+    def _get_state_cache_names(self):
+        """
+        Return the names of the variables used by the state cache.
+
+        Returns
+        -------
+        list of str
+            Inputs connected to outputs outside of this group, or not connected.
+        list of str
+            Outputs of IndepVarComps in this group.
+        list of str
+            All other outputs, which are stored in the cache.
+        """
+        if self._state_cache_names is None:
+            from openmdao.core.indepvarcomp import IndepVarComp
+
+            indeps = set()
+            for comp in self.system_iter(recurse=True, typ=IndepVarComp):
+                indeps.update(comp._var_abs_names['output'])
+
+            prefix = self.pathname + '.' if self.pathname else ''
+            conns = self._conn_global_abs_in2out
+            ext_inputs = [n for n in self._var_abs_names['input']
+                          if n not in conns or not conns[n].startswith(prefix)]
+            outputs = self._var_abs_names['output']
+
+            self._state_cache_names = (ext_inputs, [n for n in outputs if n in indeps],
+                                       [n for n in outputs if n not in indeps])
+
+        return self._state_cache_names
+
+    def _get_design_point(self):
+        """
+        Return the values of the variables that this group's outputs depend on.
+
+        Returns
+        -------
+        ndarray
+            Values of the external inputs and of the independent outputs.
+        """
+        ext_inputs, indep_outputs, _ = self._get_state_cache_names()
+        in_views = self._inputs._views_flat
+        out_views = self._outputs._views_flat
+
+        vals = [in_views[n] for n in ext_inputs]
+        vals.extend(out_views[n] for n in indep_outputs)
+        if vals:
+            return np.concatenate(vals)
+        return np.zeros(0)
+
+    def _store_states(self):
+        """
+        Store the current outputs in the state cache, keyed by the current design point.
+        """
+        _, _, states = self._get_state_cache_names()
+        views = self._outputs._views_flat
+        cache = self._state_cache
+
+        point = self._get_design_point()
+        key = point.tobytes()
+        if states:
+            vals = np.concatenate([views[n] for n in states])
+        else:
+            vals = np.zeros(0)
+
+        if cache.pop(key, None) is None:
+            self._state_cache_tree = None
+        cache[key] = (point, vals)
+
+        while len(cache) > self.options['state_cache_size']:
+            cache.popitem(last=False)
+            self._state_cache_tree = None
+
+    def _load_states(self):
+        """
+        Set the outputs to the states stored for the nearest design point in the state cache.
+        """
+        cache = self._state_cache
+        if not cache:
+            return
+
+        point = self._get_design_point()
+        if point.size == 0:
+            key = next(reversed(cache))
+        else:
+            if self._state_cache_tree is None:
+                keys = list(cache)
+                self._state_cache_tree = (cKDTree(np.array([cache[k][0] for k in keys])), keys)
+
+            tree, keys = self._state_cache_tree
+            key = keys[tree.query(point)[1]]
+
+        # a nearest point doesn't count as a use; the converged solve stores its own point.
+        entry = cache[key]
+
+        _, _, states = self._get_state_cache_names()
+        views = self._outputs._views_flat
+        vals = entry[1]
+        start = 0
+        for name in states:
+            view = views[name]
+            end = start + view.size
+            view[:] = vals[start:end]
+            start = end
+
     def guess_nonlinear(self, inputs, outputs, residuals,
                         discrete_inputs=None, discrete_outputs=None):
         """
@@ -2076,6 +2213,7 @@ class Group(System):
                 shape = (abs2meta[key[0]]['size'], abs2meta[key[1]]['size'])
                 meta['shape'] = shape
                 meta['value'] = np.zeros(shape)
+            _stamp_subjac(meta)
 
             approx.add_approximation(key, self, meta)
 
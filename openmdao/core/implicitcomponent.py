@@ -71,6 +71,11 @@ class ImplicitComponent(Component):
         """
         with self._unscaled_context(outputs=[self._outputs], residuals=[self._residuals]):
             with Recording(self.pathname + '._apply_nonlinear', self.iter_count, self):
+                key, saved = self._memo_get('apply_nonlinear', outputs=True)
+                if saved is not None:
+                    self._residuals._data[:] = saved
+                    return
+
                 self._inputs.read_only = self._outputs.read_only = True
                 try:
                     if self._discrete_inputs or self._discrete_outputs:
@@ -81,6 +86,8 @@ class ImplicitComponent(Component):
                 finally:
                     self._inputs.read_only = self._outputs.read_only = False
 
+                self._memo_set('apply_nonlinear', key, self._residuals._data.copy())
+
     def _solve_nonlinear(self):
         """
         Compute outputs. The model is assumed to be in a scaled state.
@@ -278,22 +285,30 @@ class ImplicitComponent(Component):
         """
         self._check_first_linearize()
 
-        with self._unscaled_context(outputs=[self._outputs]):
-            # Computing the approximation before the call to compute_partials allows users to
-            # override FD'd values.
-            for approximation in itervalues(self._approx_schemes):
-                approximation.compute_approximations(self, jac=self._jacobian)
+        # the jacobian, and any factorization done by linearize, are still valid if the inputs
+        # and outputs are unchanged.
+        key, saved = self._memo_get('partials', outputs=True)
+        if saved is None:
+            with self._unscaled_context(outputs=[self._outputs]):
+                # Computing the approximation before the call to compute_partials allows users to
+                # override FD'd values.
+                for approximation in itervalues(self._approx_schemes):
+                    approximation.compute_approximations(self, jac=self._jacobian)
 
-            self._inputs.read_only = self._outputs.read_only = True
+                self._inputs.read_only = self._outputs.read_only = True
 
-            try:
-                if self._discrete_inputs or self._discrete_outputs:
-                    self.linearize(self._inputs, self._outputs, self._jacobian,
-                                   self._discrete_inputs, self._discrete_outputs)
-                else:
-                    self.linearize(self._inputs, self._outputs, self._jacobian)
-            finally:
-                self._inputs.read_only = self._outputs.read_only = False
+                try:
+                    if self._discrete_inputs or self._discrete_outputs:
+                        self.linearize(self._inputs, self._outputs, self._jacobian,
+                                       self._discrete_inputs, self._discrete_outputs)
+                    else:
+                        self.linearize(self._inputs, self._outputs, self._jacobian)
+                finally:
+                    self._inputs.read_only = self._outputs.read_only = False
+
+            self._memo_set('partials', key, True)
+
+        self._jacobian._update(self)
 
         if (jac is None or jac is self._assembled_jac) and self._assembled_jac is not None:
             self._assembled_jac._update(self)
@@ -20,3 +20,14 @@ class ParallelGroup(Group):
         """
         super(ParallelGroup, self).__init__(**kwargs)
         self._mpi_proc_allocator.parallel = True
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super(ParallelGroup, self)._declare_options()
+
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc='Number of threads used to run the subsystems concurrently '
+                             'when they are not distributed over MPI processes. Subsystems run '
+                             'in threads must not have case recorders attached.')
@@ -625,6 +625,7 @@ class Problem(object):
 
         self.final_setup()
         self.model._clear_iprint()
+        self.driver._invalidate_totals_memo()
         self.model.run_solve_nonlinear()
 
     def run_driver(self, case_prefix=None, reset_iter_counts=True):
@@ -1406,9 +1407,16 @@ class Problem(object):
         # TODO: Once we're tracking iteration counts, run the model if it has not been run before.
 
         # Calculate Total Derivatives
-        total_info = _TotalJacInfo(self, of, wrt, False, return_format='flat_dict',
-                                   driver_scaling=driver_scaling)
-        Jcalc = total_info.compute_totals()
+        memo_key = ('problem', None if of is None else tuple(of),
+                    None if wrt is None else tuple(wrt), 'flat_dict', driver_scaling)
+        Jcalc = self.driver._get_memoized_totals(memo_key)
+        if Jcalc is None:
+            total_info = self.driver._get_total_jac_info(of, wrt, False, 'flat_dict',
+                                                         driver_scaling=driver_scaling)
+            total_info.compute_totals()
+
+            # the cached jacobian is overwritten by later calls, so only return copies of it
+            Jcalc = self.driver._memoize_totals(memo_key, total_info._get_totals_copy())
 
         if step is None:
             if method == 'cs':
@@ -1468,9 +1476,10 @@ class Problem(object):
             Variables with respect to which the derivatives will be computed.
             Default is None, which uses the driver's desvars.
         return_format : string
-            Format to return the derivatives. Can be either 'dict' or 'flat_dict'.
-            Default is a 'flat_dict', which returns them in a dictionary whose keys are
-            tuples of form (of, wrt).
+            Format to return the derivatives. Can be 'dict', 'flat_dict', 'array', 'sparse'
+            or 'sparse_dict'. Default is a 'flat_dict', which returns them in a dictionary whose
+            keys are tuples of form (of, wrt). 'sparse' returns a scipy coo_matrix and
+            'sparse_dict' a nested dict of coo_matrix sub-jacobians.
         debug_print : bool
             Set to True to print out some debug information during linear solve.
         driver_scaling : bool
@@ -1491,9 +1500,19 @@ class Problem(object):
                                        approx=True, driver_scaling=driver_scaling)
             return total_info.compute_totals_approx(initialize=True)
         else:
-            total_info = _TotalJacInfo(self, of, wrt, False, return_format,
-                                       debug_print=debug_print, driver_scaling=driver_scaling)
-            return total_info.compute_totals()
+            memo_key = ('problem', None if of is None else tuple(of),
+                        None if wrt is None else tuple(wrt), return_format, driver_scaling)
+            totals = self.driver._get_memoized_totals(memo_key)
+            if totals is None:
+                total_info = self.driver._get_total_jac_info(of, wrt, False, return_format,
+                                                             debug_print=debug_print,
+                                                             driver_scaling=driver_scaling)
+                total_info.compute_totals()
+
+                # the cached jacobian is overwritten by later calls, so only return copies of it
+                totals = self.driver._memoize_totals(memo_key, total_info._get_totals_copy())
+
+            return totals
 
     def set_solver_print(self, level=2, depth=1e99, type_='all'):
         """
@@ -19,7 +19,7 @@ import numpy as np
 import networkx as nx
 
 import openmdao
-from openmdao.jacobians.assembled_jacobian import DenseJacobian, CSCJacobian
+from openmdao.jacobians.assembled_jacobian import DenseJacobian, CSCJacobian, BSRJacobian
 from openmdao.jacobians.dictionary_jacobian import DictionaryJacobian
 from openmdao.recorders.recording_manager import RecordingManager
 from openmdao.vectors.vector import INT_DTYPE
@@ -48,6 +48,7 @@ _empty_frozen_set = frozenset()
 _asm_jac_types = {
     'csc': CSCJacobian,
     'dense': DenseJacobian,
+    'bsr': BSRJacobian,
 }
 
 # Suppored methods for derivatives
@@ -258,6 +259,9 @@ class System(object):
         Cache for variables in the scope of various mat-vec products.
     _has_guess : bool
         True if this system has or contains a system with a `guess_nonlinear` method defined.
+    _skip_unchanged : bool
+        Value of the skip_unchanged option in effect for this system, after inheriting from the
+        parent group when the option is None.
     _has_output_scaling : bool
         True if this system has output scaling.
     _has_resid_scaling : bool
@@ -314,9 +318,14 @@ class System(object):
         # System options
         self.options = OptionsDictionary(parent_name=type(self).__name__)
 
-        self.options.declare('assembled_jac_type', values=['csc', 'dense'], default='csc',
+        self.options.declare('assembled_jac_type', values=['csc', 'dense', 'bsr'], default='csc',
                              desc='Linear solver(s) in this group, if using an assembled '
                                   'jacobian, will use this type.')
+        self.options.declare('skip_unchanged', types=bool, default=None, allow_none=True,
+                             desc='If True, components skip compute, apply_nonlinear, '
+                                  'compute_partials and linearize when the values they depend on '
+                                  'are unchanged since the last call, and reuse the previous '
+                                  'results. If None, the value of the parent group is used.')
 
         # Case recording options
         self.recording_options = OptionsDictionary(parent_name=type(self).__name__)
@@ -430,6 +439,7 @@ class System(object):
         self.options.update(kwargs)
 
         self._has_guess = False
+        self._skip_unchanged = False
         self._has_output_scaling = False
         self._has_resid_scaling = False
         self._has_input_scaling = False
@@ -1397,6 +1407,12 @@ class System(object):
         recurse : bool
             Whether to call this method in subsystems.
         """
+        # a parent group sets the inherited value before this is called.
+        if self.options['skip_unchanged'] is not None:
+            self._skip_unchanged = self.options['skip_unchanged']
+        elif not self.pathname:
+            self._skip_unchanged = False
+
         self._var_allprocs_abs_names = {'input': [], 'output': []}
         self._var_abs_names = {'input': [], 'output': []}
         self._var_allprocs_prom2abs_list = {'input': OrderedDict(), 'output': OrderedDict()}
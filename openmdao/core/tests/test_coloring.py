@@ -2,6 +2,7 @@ from __future__ import print_function
 
 import os
 import sys
+import json
 import shutil
 import tempfile
 
@@ -22,7 +23,8 @@ except ImportError:
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_rel_error, assert_warning
 from openmdao.utils.general_utils import set_pyoptsparse_opt
-from openmdao.utils.coloring import Coloring, _compute_coloring, array_viz
+from openmdao.utils.coloring import Coloring, _compute_coloring, array_viz, \
+     compute_total_coloring
 from openmdao.utils.mpi import MPI
 from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.test_suite.tot_jac_builder import TotJacBuilder
@@ -722,6 +724,86 @@ class SimulColoringRevScipyTestCase(unittest.TestCase):
                          "Derivative support has been turned off but compute_totals was called.")
 
 
+@use_tempdirs
+class ColoringModeSelectionTestCase(unittest.TestCase):
+
+    def test_select_mode(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False)
+
+        fname = os.path.join(os.getcwd(), 'coloring_files', 'total_coloring.pkl')
+        coloring = compute_total_coloring(p, select_mode=True, fname=fname)
+
+        selection = coloring._meta['mode_selection']
+        costs = selection['costs']
+        self.assertEqual(sorted(costs), ['auto', 'fwd', 'rev'])
+        self.assertEqual(selection['mode'], min(costs, key=lambda mode: costs[mode]))
+        self.assertTrue(selection['solve_times']['fwd'] >= 0.0)
+        self.assertTrue(selection['solve_times']['rev'] >= 0.0)
+        self.assertEqual(coloring.total_solves(), selection['total_solves'][selection['mode']])
+
+        # the decision is saved next to the coloring file
+        with open(os.path.join(os.getcwd(), 'coloring_files', 'total_coloring_mode.json')) as f:
+            saved = json.load(f)
+        self.assertEqual(saved['mode'], selection['mode'])
+
+        # and the selected coloring can be used by the driver
+        p_color = run_opt(om.ScipyOptimizeDriver, 'auto', color_info=fname, optimizer='SLSQP',
+                          disp=False)
+        assert_almost_equal(p_color['circle.area'], np.pi, decimal=7)
+
+    def test_select_mode_fixed_mode(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'fwd', optimizer='SLSQP', disp=False)
+
+        msg = ("Coloring mode selection was requested but the mode is fixed to 'fwd'. "
+               "Set mode='auto' in setup() to allow it.")
+        with assert_warning(UserWarning, msg):
+            coloring = compute_total_coloring(p, select_mode=True)
+
+        self.assertNotIn('mode_selection', coloring._meta)
+        self.assertIsNone(coloring._rev)
+
+
+@use_tempdirs
+class SparseTotalsTestCase(unittest.TestCase):
+
+    def _check_sparse_totals(self, mode):
+        p = run_opt(om.ScipyOptimizeDriver, mode, optimizer='SLSQP', disp=False,
+                    dynamic_total_coloring=True, has_lin_constraint=False)
+        driver = p.driver
+
+        J = driver._compute_totals(return_format='array')
+        J_sparse = driver._compute_totals(return_format='sparse')
+
+        # only the nonzeros from the coloring are stored, with no dense jacobian allocated
+        total_info = driver._get_total_jac_info(None, None, True, 'sparse')
+        self.assertIsNone(total_info.J)
+        self.assertEqual(J_sparse.nnz, driver._coloring_info['coloring']._nzrows.size)
+        assert_almost_equal(J_sparse.toarray(), J, decimal=12)
+
+        J_dict = driver._compute_totals(return_format='dict')
+        J_sparse_dict = driver._compute_totals(return_format='sparse_dict')
+        for of, sub in J_dict.items():
+            for wrt, subjac in sub.items():
+                assert_almost_equal(J_sparse_dict[of][wrt].toarray(), subjac, decimal=12)
+
+    def test_sparse_totals_fwd(self):
+        self._check_sparse_totals('fwd')
+
+    def test_sparse_totals_rev(self):
+        self._check_sparse_totals('rev')
+
+    def test_sparse_totals_bidir(self):
+        self._check_sparse_totals('auto')
+
+    def test_sparse_totals_no_coloring(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'fwd', optimizer='SLSQP', disp=False)
+
+        J = p.driver._compute_totals(return_format='array')
+        J_sparse = p.driver._compute_totals(return_format='sparse')
+
+        assert_almost_equal(J_sparse.toarray(), J, decimal=12)
+
+
 @use_tempdirs
 class SparsityTestCase(unittest.TestCase):
 
@@ -859,6 +941,28 @@ class BidirectionalTestCase(unittest.TestCase):
 
         self.assertEqual(tot_colors, 105)
 
+    @unittest.skipIf(LooseVersion(scipy.__version__) < LooseVersion("0.19.1"), "scipy version too old")
+    def test_can_715_sparse_input(self):
+        # a sparse jacobian should give exactly the same coloring as its dense equivalent
+        matdir = os.path.join(os.path.dirname(openmdao.test_suite.__file__), 'matrices')
+
+        mat = load_npz(os.path.join(matdir, 'can_715.npz'))
+        dense = np.asarray(mat.toarray(), dtype=bool)
+
+        for mode in ('auto', 'fwd', 'rev'):
+            dense_coloring = _compute_coloring(dense, mode)
+            sparse_coloring = _compute_coloring(mat, mode)
+
+            self.assertEqual(dense_coloring._solves_info(), sparse_coloring._solves_info())
+            np.testing.assert_array_equal(dense_coloring._nzrows, sparse_coloring._nzrows)
+            np.testing.assert_array_equal(dense_coloring._nzcols, sparse_coloring._nzcols)
+            for direction in ('fwd', 'rev'):
+                if getattr(dense_coloring, '_' + direction) is None:
+                    self.assertIsNone(getattr(sparse_coloring, '_' + direction))
+                    continue
+                self.assertEqual(list(dense_coloring.color_iter(direction)),
+                                 list(sparse_coloring.color_iter(direction)))
+
 
 def _get_mat(rows, cols):
     if MPI:
@@ -416,6 +416,74 @@ class TestDriver(unittest.TestCase):
         self.assertEqual(output[3], "{'p.x': array([[ 1.,  3.,  4.],")
         self.assertEqual(output[4], '       [ 7.,  2.,  5.]])}')
 
+    def test_memoize_totals(self):
+        prob = Problem()
+        prob.model = model = SellarDerivatives()
+
+        model.add_design_var('z')
+        model.add_objective('obj')
+        model.add_constraint('con1', lower=0)
+        prob.set_solver_print(level=0)
+
+        prob.driver.options['memoize_totals'] = True
+
+        prob.setup()
+        prob.run_model()
+
+        driver = prob.driver
+        J1 = driver._compute_totals(return_format='array')
+        J2 = driver._compute_totals(return_format='array')
+
+        self.assertEqual(driver._totals_memo_misses, 1)
+        self.assertEqual(driver._totals_memo_hits, 1)
+        np.testing.assert_allclose(J1, J2)
+
+        # modifying returned totals doesn't change the memoized ones
+        J2[:] = 0.0
+        np.testing.assert_allclose(driver._compute_totals(return_format='array'), J1)
+        self.assertEqual(driver._totals_memo_hits, 2)
+
+        # a different return format is a separate entry
+        driver._compute_totals(return_format='dict')
+        self.assertEqual(driver._totals_memo_misses, 2)
+
+        # same for compute_totals and check_totals on the problem
+        base = prob.compute_totals(of=['obj', 'con1'], wrt=['z'])
+        prob.compute_totals(of=['obj', 'con1'], wrt=['z'])
+        self.assertEqual(driver._totals_memo_misses, 3)
+        self.assertEqual(driver._totals_memo_hits, 3)
+
+        # changing a design var discards the memoized totals
+        driver.set_design_var('pz.z', np.array([3.0, 1.0]))
+        prob.run_model()
+        derivs = prob.compute_totals(of=['obj', 'con1'], wrt=['z'])
+        self.assertEqual(driver._totals_memo_misses, 4)
+        self.assertEqual(driver._totals_memo_hits, 3)
+        self.assertFalse(np.allclose(base['obj', 'z'], derivs['obj', 'z']))
+
+        # the memoized totals can't be modified through the returned copy
+        derivs['obj', 'z'][:] = 0.0
+        derivs2 = prob.compute_totals(of=['obj', 'con1'], wrt=['z'])
+        self.assertEqual(driver._totals_memo_hits, 4)
+        self.assertTrue(np.all(derivs2['obj', 'z'] != 0.0))
+
+    def test_memoize_totals_off(self):
+        prob = Problem()
+        prob.model = model = SellarDerivatives()
+
+        model.add_design_var('z')
+        model.add_objective('obj')
+        prob.set_solver_print(level=0)
+
+        prob.setup()
+        prob.run_model()
+
+        prob.driver._compute_totals()
+        prob.driver._compute_totals()
+
+        self.assertEqual(prob.driver._totals_memo_hits, 0)
+        self.assertEqual(prob.driver._totals_memo_misses, 0)
+
     def test_unsupported_discrete_desvar(self):
         prob = Problem()
 
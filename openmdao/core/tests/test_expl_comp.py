@@ -908,5 +908,86 @@ class ExplCompTestCase(unittest.TestCase):
         prob['length'] = 111.
 
 
+class CountingRectangle(RectanglePartial):
+
+    def initialize(self):
+        self.counts = {'compute': 0, 'compute_partials': 0}
+
+    def compute(self, inputs, outputs):
+        self.counts['compute'] += 1
+        super(CountingRectangle, self).compute(inputs, outputs)
+
+    def compute_partials(self, inputs, partials):
+        self.counts['compute_partials'] += 1
+        super(CountingRectangle, self).compute_partials(inputs, partials)
+
+
+class ExplCompSkipUnchangedTestCase(unittest.TestCase):
+
+    def _build_model(self, **comp_options):
+        prob = om.Problem()
+        model = prob.model
+
+        indeps = model.add_subsystem('indeps', om.IndepVarComp())
+        indeps.add_output('length', 3.0)
+        indeps.add_output('width', 2.0)
+
+        sub = model.add_subsystem('sub', om.Group(skip_unchanged=True))
+        sub.add_subsystem('comp', CountingRectangle(**comp_options))
+
+        model.connect('indeps.length', 'sub.comp.length')
+        model.connect('indeps.width', 'sub.comp.width')
+
+        prob.setup()
+        return prob
+
+    def test_skip_compute(self):
+        prob = self._build_model()
+        comp = prob.model.sub.comp
+
+        prob.run_model()
+        prob.run_model()
+        self.assertEqual(comp.counts['compute'], 1)
+        self.assertEqual(comp._memo_hits['compute'], 1)
+        assert_rel_error(self, prob['sub.comp.area'], 6.0)
+
+        prob['indeps.width'] = 4.0
+        prob.run_model()
+        self.assertEqual(comp.counts['compute'], 2)
+        assert_rel_error(self, prob['sub.comp.area'], 12.0)
+
+        # the residual of an unchanged explicit component is still computed
+        prob.model.run_apply_nonlinear()
+        self.assertEqual(comp.counts['compute'], 2)
+        assert_rel_error(self, prob.model._residuals.get_norm(), 0.0)
+
+    def test_skip_compute_partials(self):
+        prob = self._build_model()
+        comp = prob.model.sub.comp
+        prob.run_model()
+
+        for i in range(2):
+            J = prob.compute_totals(of=['sub.comp.area'], wrt=['indeps.length', 'indeps.width'])
+            assert_rel_error(self, J['sub.comp.area', 'indeps.length'], [[2.0]])
+            assert_rel_error(self, J['sub.comp.area', 'indeps.width'], [[3.0]])
+
+        self.assertEqual(comp.counts['compute_partials'], 1)
+
+        prob['indeps.length'] = 5.0
+        prob.run_model()
+        J = prob.compute_totals(of=['sub.comp.area'], wrt=['indeps.length', 'indeps.width'])
+        assert_rel_error(self, J['sub.comp.area', 'indeps.width'], [[5.0]])
+        self.assertEqual(comp.counts['compute_partials'], 2)
+
+    def test_component_overrides_group(self):
+        prob = self._build_model(skip_unchanged=False)
+        comp = prob.model.sub.comp
+
+        prob.run_model()
+        prob.run_model()
+        self.assertEqual(comp.counts['compute'], 2)
+        self.assertEqual(comp._memo_hits['compute'], 0)
+
+
 if __name__ == '__main__':
     unittest.main()
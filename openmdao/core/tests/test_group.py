@@ -1101,6 +1101,133 @@ class TestGroup(unittest.TestCase):
         for key, val in iteritems(totals):
             assert_rel_error(self, val['rel error'][0], 0.0, 1e-15)
 
+    def test_cache_states(self):
+
+        class Discipline(om.Group):
+
+            def setup(self):
+                self.add_subsystem('comp0', om.ExecComp('y=x**2'))
+                self.add_subsystem('comp1', om.ExecComp('z=2*external_input'),
+                                   promotes_inputs=['external_input'])
+
+                self.add_subsystem('balance', om.BalanceComp('x', lhs_name='y', rhs_name='z'),
+                                   promotes_outputs=['x'])
+
+                self.connect('comp0.y', 'balance.y')
+                self.connect('comp1.z', 'balance.z')
+
+                self.connect('x', 'comp0.x')
+
+                self.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
+                self.linear_solver = om.DirectSolver()
+
+        iter_counts = {}
+        for cache_states in (False, True):
+            p = om.Problem()
+
+            p.model.add_subsystem('parameters', om.IndepVarComp('input_value', 1.))
+            p.model.add_subsystem('discipline', Discipline(cache_states=cache_states,
+                                                           state_cache_size=2))
+
+            p.model.connect('parameters.input_value', 'discipline.external_input')
+
+            p.setup()
+            p.set_solver_print(level=0)
+
+            counts = iter_counts[cache_states] = []
+            for val in (1., 100., 1.001):
+                p['parameters.input_value'] = val
+                p.run_model()
+                counts.append(p.model.discipline.nonlinear_solver._iter_count)
+
+                assert_rel_error(self, p['discipline.x'], (2. * val) ** .5, 1e-6)
+
+            # the same design point is restored exactly
+            p['parameters.input_value'] = 100.
+            p.run_model()
+            counts.append(p.model.discipline.nonlinear_solver._iter_count)
+
+            if cache_states:
+                self.assertEqual(len(p.model.discipline._state_cache), 2)
+            else:
+                self.assertEqual(len(p.model.discipline._state_cache), 0)
+
+        # nothing is stored before the first solve
+        self.assertEqual(iter_counts[True][:2], iter_counts[False][:2])
+
+        # 1.001 starts from the states at 1 rather than those at 100
+        self.assertLess(iter_counts[True][2], iter_counts[False][2])
+        self.assertEqual(iter_counts[True][3], 0)
+        self.assertGreater(iter_counts[False][3], 0)
+
+    def test_cache_states_nlbgs(self):
+        from openmdao.test_suite.components.sellar import SellarDerivatives
+
+        iter_counts = {}
+        for cache_states in (False, True):
+            nlbgs = om.NonlinearBlockGS(atol=1e-10, rtol=1e-10)
+            p = om.Problem(model=SellarDerivatives(nonlinear_solver=nlbgs,
+                                                   cache_states=cache_states))
+            p.setup()
+            p.set_solver_print(level=0)
+
+            counts = iter_counts[cache_states] = []
+            for x in (1., 5., 1.):
+                p['x'] = x
+                p.run_model()
+                counts.append(p.model.nonlinear_solver._iter_count)
+
+            assert_rel_error(self, p['y1'], 25.58830273, .00001)
+            assert_rel_error(self, p['y2'], 12.05848819, .00001)
+
+        self.assertEqual(iter_counts[True][:2], iter_counts[False][:2])
+
+        # returning to x=1 starts from the states stored there
+        self.assertLess(iter_counts[True][2], iter_counts[False][2])
+
+    def test_cache_states_guess_precedence(self):
+
+        class Discipline(om.Group):
+
+            def setup(self):
+                self.add_subsystem('comp0', om.ExecComp('y=x**2'))
+                self.add_subsystem('comp1', om.ExecComp('z=2*external_input'),
+                                   promotes_inputs=['external_input'])
+
+                self.add_subsystem('balance', om.BalanceComp('x', lhs_name='y', rhs_name='z'),
+                                   promotes_outputs=['x'])
+
+                self.connect('comp0.y', 'balance.y')
+                self.connect('comp1.z', 'balance.z')
+
+                self.connect('x', 'comp0.x')
+
+                self.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
+                self.linear_solver = om.DirectSolver()
+
+            def guess_nonlinear(self, inputs, outputs, residuals):
+                self.guessed_from = outputs['x'].copy()
+                outputs['x'] = np.sqrt(2. * inputs['external_input'])
+
+        p = om.Problem()
+        p.model.add_subsystem('parameters', om.IndepVarComp('input_value', 1.))
+        p.model.add_subsystem('discipline', Discipline(cache_states=True))
+        p.model.connect('parameters.input_value', 'discipline.external_input')
+
+        p.setup()
+        p.set_solver_print(level=0)
+
+        p['discipline.x'] = 7.
+        p.run_model()
+        assert_rel_error(self, p.model.discipline.guessed_from, 7., 1e-10)
+
+        # the guess_nonlinear method sees the stored states and its exact guess is kept
+        p['discipline.x'] = 7.
+        p['parameters.input_value'] = 2.
+        p.run_model()
+        assert_rel_error(self, p.model.discipline.guessed_from, 2. ** .5, 1e-6)
+        self.assertEqual(p.model.discipline.nonlinear_solver._iter_count, 0)
+
 
 class MyComp(om.ExplicitComponent):
     def __init__(self, input_shape, src_indices=None, flat_src_indices=False):
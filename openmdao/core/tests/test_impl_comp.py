@@ -1319,6 +1319,56 @@ class CacheUsingComp(om.ImplicitComponent):
         self.lin_sol_count += 1
 
 
+class ImplicitCompSkipUnchangedTestCase(unittest.TestCase):
+
+    def test_skip_apply_nonlinear_and_linearize(self):
+
+        class CountingQuadratic(QuadraticLinearize):
+
+            def initialize(self):
+                self.counts = {'apply_nonlinear': 0, 'linearize': 0}
+
+            def apply_nonlinear(self, inputs, outputs, residuals):
+                self.counts['apply_nonlinear'] += 1
+                super(CountingQuadratic, self).apply_nonlinear(inputs, outputs, residuals)
+
+            def linearize(self, inputs, outputs, partials):
+                self.counts['linearize'] += 1
+                super(CountingQuadratic, self).linearize(inputs, outputs, partials)
+
+        prob = om.Problem(om.Group(skip_unchanged=True))
+        model = prob.model
+
+        indeps = model.add_subsystem('indeps', om.IndepVarComp())
+        indeps.add_output('a', 1.0)
+        indeps.add_output('b', -4.0)
+        indeps.add_output('c', 3.0)
+        comp = model.add_subsystem('comp', CountingQuadratic())
+        model.connect('indeps.a', 'comp.a')
+        model.connect('indeps.b', 'comp.b')
+        model.connect('indeps.c', 'comp.c')
+
+        prob.setup()
+        prob.run_model()
+
+        model.run_apply_nonlinear()
+        model.run_apply_nonlinear()
+        self.assertEqual(comp.counts['apply_nonlinear'], 1)
+        self.assertEqual(comp._memo_hits['apply_nonlinear'], 1)
+
+        # a change in the outputs is a different point
+        prob['comp.x'] = 2.0
+        model.run_apply_nonlinear()
+        self.assertEqual(comp.counts['apply_nonlinear'], 2)
+        assert_rel_error(self, model._residuals['comp.x'], -1.0)
+
+        prob.run_model()
+        for i in range(2):
+            J = prob.compute_totals(of=['comp.x'], wrt=['indeps.c'])
+            assert_rel_error(self, J['comp.x', 'indeps.c'], [[-0.5]])
+        self.assertEqual(comp.counts['linearize'], 1)
+
+
 class CacheLinSolutionTestCase(unittest.TestCase):
     def test_caching_fwd(self):
         p = om.Problem()
@@ -688,6 +688,76 @@ class MatMatTestCase(unittest.TestCase):
         assert_rel_error(self, J['comp.x', 'p.b'], np.diag(np.array([-0.14644661, -0.1, -0.07421663])), 1e-4)
         assert_rel_error(self, J['comp.x', 'p.c'], np.diag(np.array([-0.35355339, -0.2, -0.13867505])), 1e-4)
 
+    def test_implicit_scipy_krylov(self):
+        for mode in ('fwd', 'rev'):
+            prob = QCVProblem()
+            prob.model.linear_solver = om.ScipyKrylov(atol=1e-12)
+
+            prob.setup(mode=mode)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            J = prob.compute_totals(of=['comp.x'], wrt=['p.a', 'p.b', 'p.c'])
+            assert_rel_error(self, J['comp.x', 'p.a'], np.diag(np.array([-0.06066017, -0.05, -0.03971954])), 1e-4)
+            assert_rel_error(self, J['comp.x', 'p.b'], np.diag(np.array([-0.14644661, -0.1, -0.07421663])), 1e-4)
+            assert_rel_error(self, J['comp.x', 'p.c'], np.diag(np.array([-0.35355339, -0.2, -0.13867505])), 1e-4)
+
+    def test_scipy_krylov_precon(self):
+        for mode in ('fwd', 'rev'):
+            prob = QCVProblem()
+            solver = prob.model.linear_solver = om.ScipyKrylov(atol=1e-12)
+            solver.precon = om.LinearBlockGS()
+
+            prob.setup(mode=mode)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            # the preconditioner is applied to the whole block of columns
+            calls = []
+            apply_precon = solver._apply_precon
+
+            def counting_precon(arr):
+                calls.append(arr.shape)
+                return apply_precon(arr)
+
+            solver._apply_precon = counting_precon
+
+            J = prob.compute_totals(of=['comp.x'], wrt=['p.a', 'p.b', 'p.c'])
+            assert_rel_error(self, J['comp.x', 'p.a'], np.diag(np.array([-0.06066017, -0.05, -0.03971954])), 1e-4)
+            assert_rel_error(self, J['comp.x', 'p.b'], np.diag(np.array([-0.14644661, -0.1, -0.07421663])), 1e-4)
+            assert_rel_error(self, J['comp.x', 'p.c'], np.diag(np.array([-0.35355339, -0.2, -0.13867505])), 1e-4)
+
+            self.assertTrue(any(len(shape) == 2 for shape in calls))
+
+    def test_scipy_krylov_vectorized_bad_solver(self):
+        prob = QCVProblem()
+        prob.model.linear_solver = om.ScipyKrylov(solver='gcrotmk')
+
+        prob.setup(mode='fwd')
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_totals(of=['comp.x'], wrt=['p.a', 'p.b', 'p.c'])
+
+        self.assertEqual(str(cm.exception),
+                         "ScipyKrylov in Group (<model>): Vectorized derivatives can only "
+                         "be solved with the 'gmres' solver, but 'gcrotmk' was selected.")
+
+    def test_phases_multi_scipy_krylov(self):
+        N_PHASES = 4
+        for mode in ('fwd', 'rev'):
+            p, expected = phase_model(order=20, nphases=N_PHASES, vectorize=True)
+            p.model.linear_solver = om.ScipyKrylov(atol=1e-12)
+            p.model.linear_solver.precon = om.LinearBlockGS()
+
+            p.setup(mode=mode)
+
+            p.run_driver()
+
+            for i in range(N_PHASES):
+                assert_rel_error(self, expected, p['p%d.y_lgl' % i], 1.e-5)
+
     def test_apply_multi_linear_inputs_read_only(self):
         class BadComp(QuadraticCompVectorized):
             def apply_multi_linear(self, inputs, outputs, d_inputs, d_outputs, d_residuals, mode):
@@ -285,6 +285,43 @@ class TestParallelGroups(unittest.TestCase):
 
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+class TestParallelGroupsThreaded(unittest.TestCase):
+
+    def test_fan_in_grouped(self):
+        for mode in ('fwd', 'rev'):
+            prob = om.Problem()
+            prob.model = FanInGrouped2()
+            prob.model.sub.options['num_threads'] = 2
+            prob.setup(check=False, mode=mode)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            assert_rel_error(self, prob['c3.y'], 29.0, 1e-6)
+
+            J = prob.compute_totals(of=['c3.y'], wrt=['p1.x', 'p2.x'])
+            assert_rel_error(self, J['c3.y', 'p1.x'][0][0], -6.0, 1e-6)
+            assert_rel_error(self, J['c3.y', 'p2.x'][0][0], 35.0, 1e-6)
+
+            prob.cleanup()
+
+    def test_fan_out_grouped(self):
+        for mode in ('fwd', 'rev'):
+            prob = om.Problem(FanOutGrouped())
+            prob.model.sub.options['num_threads'] = 2
+            prob.setup(check=False, mode=mode)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            assert_rel_error(self, prob['c2.y'], -6.0, 1e-6)
+            assert_rel_error(self, prob['c3.y'], 15.0, 1e-6)
+
+            J = prob.compute_totals(of=['c2.y', 'c3.y'], wrt=['iv.x'])
+            assert_rel_error(self, J['c2.y', 'iv.x'][0][0], -6.0, 1e-6)
+            assert_rel_error(self, J['c3.y', 'iv.x'][0][0], 15.0, 1e-6)
+
+            prob.cleanup()
+
+
 class TestParallelListStates(unittest.TestCase):
 
     N_PROCS = 4
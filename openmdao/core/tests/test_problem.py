@@ -452,6 +452,48 @@ class TestProblem(unittest.TestCase):
 
         assert_rel_error(self, derivs['calc.y', 'des_vars.x'], [[2.0]], 1e-6)
 
+    def test_compute_totals_reuses_setup(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('p1', om.IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('p2', om.IndepVarComp('y', 0.0), promotes=['y'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+
+        prob.setup(check=False, mode='fwd')
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        derivs = prob.compute_totals(of=['f_xy'], wrt=['x', 'y'])
+        self.assertEqual(len(prob.driver._total_jac_cache), 1)
+        total_jac = list(prob.driver._total_jac_cache.values())[0]
+
+        prob['x'] = 1.0
+        prob['y'] = 1.0
+        prob.run_model()
+        new_derivs = prob.compute_totals(of=['f_xy'], wrt=['x', 'y'])
+        self.assertEqual(len(prob.driver._total_jac_cache), 1)
+        self.assertIs(list(prob.driver._total_jac_cache.values())[0], total_jac)
+
+        # earlier results are not overwritten
+        assert_rel_error(self, derivs['f_xy', 'x'], [[-6.0]], 1e-6)
+        assert_rel_error(self, derivs['f_xy', 'y'], [[8.0]], 1e-6)
+        assert_rel_error(self, new_derivs['f_xy', 'x'], [[-3.0]], 1e-6)
+        assert_rel_error(self, new_derivs['f_xy', 'y'], [[11.0]], 1e-6)
+
+        # a different signature gets its own entry
+        prob.compute_totals(of=['f_xy'], wrt=['x'])
+        self.assertEqual(len(prob.driver._total_jac_cache), 2)
+
+        # setup invalidates the cache
+        prob.setup(check=False, mode='rev')
+        prob.run_model()
+
+        derivs = prob.compute_totals(of=['f_xy'], wrt=['x', 'y'])
+        self.assertEqual(len(prob.driver._total_jac_cache), 1)
+        self.assertIsNot(list(prob.driver._total_jac_cache.values())[0], total_jac)
+        assert_rel_error(self, derivs['f_xy', 'x'], [[-6.0]], 1e-6)
+        assert_rel_error(self, derivs['f_xy', 'y'], [[8.0]], 1e-6)
+
     def test_compute_totals_no_args_promoted(self):
         p = om.Problem()
 
@@ -12,6 +12,7 @@ import sys
 import time
 
 import numpy as np
+from scipy.sparse import coo_matrix
 
 try:
     from petsc4py import PETSc
@@ -29,6 +30,9 @@ from openmdao.jacobians.dictionary_jacobian import DictionaryJacobian
 
 _contains_all = ContainsAll()
 
+# return formats that give the total jacobian as scipy sparse matrices.
+_sparse_formats = ('sparse', 'sparse_dict')
+
 
 class _TotalJacInfo(object):
     """
@@ -44,8 +48,9 @@ class _TotalJacInfo(object):
         If True, this total jacobian contains linear constraints.
     idx_iter_dict : dict
         A dict containing an entry for each outer iteration of the total jacobian computation.
-    J : ndarray
-        The dense array form of the total jacobian.
+    J : ndarray or None
+        The dense array form of the total jacobian. None if a sparse return format was requested
+        and a total coloring is available, in which case only the nonzeros are stored.
     J_dict : dict
         Nested or flat dict with views of the jacobian.
     J_final : ndarray or dict
@@ -77,7 +82,7 @@ class _TotalJacInfo(object):
         Cache containing names of desvars or responses for each parallel derivative color.
     return_format : str
         Indicates the desired return format of the total jacobian. Can have value of
-        'array', 'dict', or 'flat_dict'.
+        'array', 'dict', 'flat_dict', 'sparse' or 'sparse_dict'.
     simul_coloring : Coloring or None
         Contains all data necessary to simultaneously solve for groups of total derivatives.
     """
@@ -99,7 +104,7 @@ class _TotalJacInfo(object):
             If True, names in of and wrt are global names.
         return_format : str
             Indicates the desired return format of the total jacobian. Can have value of
-            'array', 'dict', or 'flat_dict'.
+            'array', 'dict', 'flat_dict', 'sparse' or 'sparse_dict'.
         approx : bool
             If True, the object will compute approx total jacobians.
         debug_print : bool
@@ -230,9 +235,16 @@ class _TotalJacInfo(object):
         self.wrt_meta, self.wrt_size = self._get_tuple_map(wrt, design_vars, abs2meta)
         self.out_meta = {'fwd': self.of_meta, 'rev': self.wrt_meta}
 
-        # always allocate a 2D dense array and we can assign views to dict keys later if
-        # return format is 'dict' or 'flat_dict'.
-        self.J = J = np.zeros((self.of_size, self.wrt_size))
+        # for the sparse return formats with a total coloring, only the nonzeros known from the
+        # coloring are stored, so no dense array is allocated at all.
+        if (return_format in _sparse_formats and not approx and self.simul_coloring is not None
+                and self.simul_coloring._shape == (self.of_size, self.wrt_size)):
+            self.J = None
+            self._setup_sparse_J(modes)
+        else:
+            # always allocate a 2D dense array and we can assign views to dict keys later if
+            # return format is 'dict' or 'flat_dict'.
+            self.J = np.zeros((self.of_size, self.wrt_size))
 
         if not approx:
             self.solvec_map = {}
@@ -244,13 +256,18 @@ class _TotalJacInfo(object):
             self.jac_petsc = {}
             self.soln_petsc = {}
             if 'fwd' in modes:
-                self._compute_jac_scatters('fwd', J.shape[0])
+                self._compute_jac_scatters('fwd', self.of_size)
 
             if 'rev' in modes:
-                self._compute_jac_scatters('rev', J.shape[1])
+                self._compute_jac_scatters('rev', self.wrt_size)
+
+        J = self.J
 
         # for dict type return formats, map var names to views of the Jacobian array.
-        if return_format == 'array':
+        if J is None:
+            # sparse storage, J_final is rebuilt from the nonzero data after each computation.
+            self.J_final = self.J_dict = None
+        elif return_format == 'array' or return_format in _sparse_formats:
             self.J_final = J
             if self.has_scaling or approx:
                 # for array return format, create a 'dict' view for scaling or FD, since
@@ -361,6 +378,165 @@ class _TotalJacInfo(object):
 
         return J_dict
 
+    def _setup_sparse_J(self, modes):
+        """
+        Allocate storage for only the nonzeros of the total jacobian known from the coloring.
+
+        The nonzeros are ordered by (of, wrt) pair so that each sub-jacobian owns a contiguous
+        slice of the data array.
+
+        Parameters
+        ----------
+        modes : list of str
+            Derivative solution directions used by the coloring.
+        """
+        coloring = self.simul_coloring
+        nrows, ncols = coloring._shape
+
+        of_starts = np.array([self.of_meta[n][0].start for n in self.of], dtype=INT_DTYPE)
+        wrt_starts = np.array([self.wrt_meta[n][0].start for n in self.wrt], dtype=INT_DTYPE)
+        nzrows = np.asarray(coloring._nzrows, dtype=INT_DTYPE)
+        nzcols = np.asarray(coloring._nzcols, dtype=INT_DTYPE)
+
+        blocks = (np.searchsorted(of_starts, nzrows, side='right') - 1) * len(self.wrt)
+        blocks += np.searchsorted(wrt_starts, nzcols, side='right') - 1
+        order = np.lexsort((nzcols, nzrows, blocks))
+
+        self._sparse_rows = rows = nzrows[order]
+        self._sparse_cols = cols = nzcols[order]
+        self._sparse_data = np.zeros(rows.size)
+        self._sparse_block_starts = np.searchsorted(blocks[order],
+                                                    np.arange(len(self.of) * len(self.wrt) + 1))
+
+        # map each column (fwd) or row (rev) solved by the coloring to its entries in the data
+        # array, along with the matching entries of the reduced derivative vector.
+        flat = rows * ncols + cols
+        srt = np.argsort(flat)
+        flat = flat[srt]
+        self._sparse_jac_idxs = {}
+        for mode in modes:
+            fwd = mode == 'fwd'
+            full = np.arange(nrows if fwd else ncols, dtype=INT_DTYPE)
+            self._sparse_jac_idxs[mode] = idxs = []
+            for i, nzs in enumerate(coloring.get_row_col_map(mode)):
+                if nzs is None:
+                    idxs.append(None)
+                    continue
+                nzs = full[nzs]
+                keys = nzs * ncols + i if fwd else i * ncols + nzs
+                locs = np.searchsorted(flat, keys)
+                locs[locs == flat.size] = 0
+                mask = flat[locs] == keys
+                idxs.append((srt[locs[mask]], nzs[mask]))
+
+        if self.has_scaling:
+            design_vars = self.input_meta['fwd']
+            responses = self.output_meta['fwd']
+            oscale = np.ones(nrows)
+            iscale = np.ones(ncols)
+            for name in self.of:
+                if responses[name]['scaler'] is not None:
+                    oscale[self.of_meta[name][0]] = responses[name]['scaler']
+            for name in self.wrt:
+                if design_vars[name]['scaler'] is not None:
+                    iscale[self.wrt_meta[name][0]] = 1.0 / design_vars[name]['scaler']
+            self._sparse_scaler = oscale[rows] * iscale[cols]
+
+    def _get_sparse_J(self, copy=False):
+        """
+        Return the total jacobian in the requested sparse format.
+
+        Parameters
+        ----------
+        copy : bool
+            If True, the returned matrices don't share their data with this object.
+
+        Returns
+        -------
+        coo_matrix or dict
+            The full sparse jacobian if return_format is 'sparse', else a nested dict of sparse
+            sub-jacobians.
+        """
+        shape = (self.of_size, self.wrt_size)
+
+        if self.J is None:
+            rows = self._sparse_rows
+            cols = self._sparse_cols
+            data = self._sparse_data.copy() if copy else self._sparse_data
+        else:
+            # no coloring is available, so just drop the zeros from the dense jacobian.
+            rows, cols = np.nonzero(self.J)
+            data = self.J[rows, cols]
+
+        if self.return_format == 'sparse':
+            return coo_matrix((data, (rows, cols)), shape=shape)
+
+        if self.J is None:
+            starts = self._sparse_block_starts
+        else:
+            nwrt = len(self.wrt)
+            of_starts = [self.of_meta[n][0].start for n in self.of]
+            wrt_starts = [self.wrt_meta[n][0].start for n in self.wrt]
+            blocks = (np.searchsorted(of_starts, rows, side='right') - 1) * nwrt
+            blocks += np.searchsorted(wrt_starts, cols, side='right') - 1
+            order = np.argsort(blocks, kind='mergesort')
+            rows, cols, data = rows[order], cols[order], data[order]
+            starts = np.searchsorted(blocks[order], np.arange(len(self.of) * nwrt + 1))
+
+        J_dict = OrderedDict()
+        iblock = 0
+        for prom_out, out in zip(self.prom_of, self.of):
+            J_dict[prom_out] = outer = OrderedDict()
+            out_slice = self.of_meta[out][0]
+            for prom_in, inp in zip(self.prom_wrt, self.wrt):
+                in_slice = self.wrt_meta[inp][0]
+                start, end = starts[iblock], starts[iblock + 1]
+                outer[prom_in] = coo_matrix((data[start:end],
+                                             (rows[start:end] - out_slice.start,
+                                              cols[start:end] - in_slice.start)),
+                                            shape=(out_slice.stop - out_slice.start,
+                                                   in_slice.stop - in_slice.start))
+                iblock += 1
+
+        return J_dict
+
+    def _get_totals_copy(self):
+        """
+        Return the most recently computed totals in arrays that later computations don't modify.
+
+        Only the flat jacobian data is copied; the dict formats get new views into the copy.
+
+        Returns
+        -------
+        derivs : object
+            Derivatives in form requested by 'return_format'.
+        """
+        if self.return_format in _sparse_formats:
+            return self._get_sparse_J(copy=True)
+
+        J = self.J.copy()
+        if self.return_format == 'array':
+            return J
+
+        return self._get_dict_J(J, self.wrt, self.prom_wrt, self.of, self.prom_of,
+                                self.wrt_meta, self.of_meta, self.return_format)
+
+    def _get_dense_J(self):
+        """
+        Return the total jacobian as a dense array, expanding the sparse storage if necessary.
+
+        Returns
+        -------
+        ndarray
+            Dense array form of the total jacobian.
+        """
+        if self.J is not None:
+            return self.J
+
+        J = np.zeros((self.of_size, self.wrt_size))
+        J[self._sparse_rows, self._sparse_cols] = self._sparse_data
+        return J
+
     def _create_in_idx_map(self, mode):
         """
         Create a list that maps a global index to a name, col/row range, and other data.
@@ -735,7 +911,7 @@ class _TotalJacInfo(object):
 
         for color, ilist in enumerate(coloring.color_iter(mode)):
             if len(ilist) == 1:
-                if both:
+                if both or self.J is None:
                     yield ilist, input_setter, jac_setter, None
                 else:
                     yield ilist[0], self.single_input_setter, self.single_jac_setter, None
@@ -1105,7 +1281,6 @@ class _TotalJacInfo(object):
         mode : str
             Direction of derivative solution.
         """
-        row_col_map = self.simul_coloring.get_row_col_map(mode)
         fwd = mode == 'fwd'
 
         J = self.J
@@ -1129,6 +1304,15 @@ class _TotalJacInfo(object):
                             self.jac_petsc[mode], addv=False, mode=False)
             reduced_derivs = self.jac_petsc[mode].array
 
+        if J is None:
+            data = self._sparse_data
+            sparse_jac_idxs = self._sparse_jac_idxs[mode]
+            for i in inds:
+                data_idxs, nzs = sparse_jac_idxs[i]
+                data[data_idxs] = reduced_derivs[nzs]
+            return
+
+        row_col_map = self.simul_coloring.get_row_col_map(mode)
         if fwd:
             for i in inds:
                 J[row_col_map[i], i] = reduced_derivs[row_col_map[i]]
@@ -1223,6 +1407,9 @@ class _TotalJacInfo(object):
             vec_doutput[vec_name]._data[:] = 0.0
             vec_dresid[vec_name]._data[:] = 0.0
 
+        if self.J is None:
+            self._sparse_data[:] = 0.0
+
         # Linearize Model
         with model._scaled_context_all():
             model._linearize(model._assembled_jac,
@@ -1265,7 +1452,10 @@ class _TotalJacInfo(object):
 
         # Driver scaling.
         if self.has_scaling:
-            self._do_driver_scaling(self.J_dict)
+            if self.J is None:
+                self._sparse_data *= self._sparse_scaler
+            else:
+                self._do_driver_scaling(self.J_dict)
 
         if debug_print:
             # Debug outputs scaled derivatives.
@@ -1273,6 +1463,9 @@ class _TotalJacInfo(object):
 
         # np.save("total_jac.npy", self.J)
 
+        if self.return_format in _sparse_formats:
+            return self._get_sparse_J()
+
         return self.J_final
 
     def compute_totals_approx(self, initialize=False):
@@ -1348,7 +1541,7 @@ class _TotalJacInfo(object):
                     totals[prom_out, prom_in][:] = _get_subjac(approx_jac[output_name, input_name],
                                                                prom_out, prom_in, of_idx, wrt_idx)
 
-        elif return_format in ('dict', 'array'):
+        elif return_format in ('dict', 'array') or return_format in _sparse_formats:
             for prom_out, output_name in zip(self.prom_of, of):
                 tot = totals[prom_out]
                 for prom_in, input_name in zip(self.prom_wrt, wrt):
@@ -1375,6 +1568,8 @@ class _TotalJacInfo(object):
 
         if return_format == 'array':
             totals = self.J  # change back to array version
+        elif return_format in _sparse_formats:
+            totals = self._get_sparse_J()
 
         return totals
 
@@ -1435,7 +1630,7 @@ class _TotalJacInfo(object):
         desvars = self.prom_design_vars
         responses = self.prom_responses
 
-        if self.return_format in ('dict', 'array'):
+        if self.return_format in ('dict', 'array') or self.return_format in _sparse_formats:
             for prom_out, odict in iteritems(J):
                 oscaler = responses[prom_out]['scaler']
 
@@ -1464,8 +1659,8 @@ class _TotalJacInfo(object):
                 if iscaler is not None:
                     val *= 1.0 / iscaler
         else:
-            raise RuntimeError("Derivative scaling by the driver only supports the 'dict' and "
-                               "'array' formats at present.")
+            raise RuntimeError("Derivative scaling by the driver only supports the 'dict', "
+                               "'array' and sparse formats at present.")
 
     def _print_derivatives(self):
         """
@@ -1477,7 +1672,7 @@ class _TotalJacInfo(object):
                 for wrt in self.wrt:
                     pprint.pprint({(of, wrt): J[of][wrt]})
         else:
-            J = self.J
+            J = self._get_dense_J()
             for i, of in enumerate(self.of):
                 out_slice = self.of_meta[of][0]
                 for j, wrt in enumerate(self.wrt):
@@ -1500,8 +1695,9 @@ class _TotalJacInfo(object):
         self._recording_iter.stack.append((requester._get_name(), requester.iter_count))
 
         try:
-            totals = self._get_dict_J(self.J, self.wrt, self.prom_wrt, self.of, self.prom_of,
-                                      self.wrt_meta, self.of_meta, 'flat_dict_structured_key')
+            totals = self._get_dict_J(self._get_dense_J(), self.wrt, self.prom_wrt, self.of,
+                                      self.prom_of, self.wrt_meta, self.of_meta,
+                                      'flat_dict_structured_key')
             requester._rec_mgr.record_derivatives(requester, totals, metadata)
 
         finally:
@@ -15,7 +15,7 @@ import traceback
 from six import iteritems, itervalues, string_types, reraise
 
 import numpy as np
-from scipy.sparse import coo_matrix
+from scipy.sparse import coo_matrix, issparse
 
 from pyoptsparse import Optimization
 
@@ -499,10 +499,14 @@ class pyOptSparseDriver(Driver):
 
         try:
 
+            # with known total sparsity, ask for sparse sub-jacobians so that the dense
+            # total jacobian is never allocated when a total coloring is available.
+            res_jacs = self._res_jacs
             try:
                 sens_dict = self._compute_totals(of=self._quantities,
                                                  wrt=self._indep_list,
-                                                 return_format='dict')
+                                                 return_format='sparse_dict' if res_jacs
+                                                 else 'dict')
             # Let the optimizer try to handle the error
             except AnalysisError:
                 prob.model._clear_iprint()
@@ -523,7 +527,6 @@ class pyOptSparseDriver(Driver):
                 # conversion of our dense array into a fully dense 'coo', which is bad.
                 # TODO: look into getting rid of all of these conversions!
                 new_sens = OrderedDict()
-                res_jacs = self._res_jacs
                 for okey in func_dict:
                     new_sens[okey] = newdv = OrderedDict()
                     for ikey in dv_dict:
@@ -531,10 +534,16 @@ class pyOptSparseDriver(Driver):
                             arr = sens_dict[okey][ikey]
                             coo = res_jacs[okey][ikey]
                             row, col, data = coo['coo']
-                            coo['coo'][2] = arr[row, col].flatten()
+                            if issparse(arr):
+                                coo['coo'][2] = np.asarray(arr.tocsr()[row, col]).ravel()
+                            else:
+                                coo['coo'][2] = arr[row, col].flatten()
                             newdv[ikey] = coo
                         elif okey in sens_dict:
-                            newdv[ikey] = sens_dict[okey][ikey]
+                            if issparse(sens_dict[okey][ikey]):
+                                newdv[ikey] = sens_dict[okey][ikey].toarray()
+                            else:
+                                newdv[ikey] = sens_dict[okey][ikey]
                 sens_dict = new_sens
 
         except Exception as msg:
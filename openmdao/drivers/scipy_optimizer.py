@@ -100,6 +100,9 @@ class ScipyOptimizeDriver(Driver):
     _grad_cache : OrderedDict
         Cached result of nonlinear constraint derivatives because scipy asks for them in a separate
         function.
+    _sparse_totals : bool
+        If True, total derivatives are computed in sparse form and handed to the optimizer as
+        sparse rows. Only used by 'trust-constr' when a total coloring is available.
     _exc_info : 3 item tuple
         Storage for exception and traceback information.
     _obj_and_nlcons : list
@@ -139,6 +142,7 @@ class ScipyOptimizeDriver(Driver):
 
         self.result = None
         self._grad_cache = None
+        self._sparse_totals = False
         self._con_cache = None
         self._con_idx = {}
         self._obj_and_nlcons = None
@@ -425,6 +429,11 @@ class ScipyOptimizeDriver(Driver):
                 coloring_mod.dynamic_total_coloring(self, run_model=False,
                                                     fname=self._get_total_coloring_fname())
 
+        # trust-constr accepts sparse constraint jacobians, so with a total coloring we can skip
+        # the dense total jacobian entirely.
+        self._sparse_totals = (opt in _supports_new_style and _use_new_style and
+                               isinstance(self._coloring_info['coloring'], coloring_mod.Coloring))
+
         # optimize
         try:
             if opt in _optimizers:
@@ -679,8 +688,12 @@ class ScipyOptimizeDriver(Driver):
             Gradient of objective with respect to parameter array.
         """
         try:
-            grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
-                                        return_format='array')
+            if self._sparse_totals:
+                grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
+                                            return_format='sparse').tocsr()
+            else:
+                grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
+                                            return_format='array')
             self._grad_cache = grad
 
         except Exception as msg:
@@ -691,6 +704,9 @@ class ScipyOptimizeDriver(Driver):
         # print(x_new)
         # print(grad[0, :])
 
+        if self._sparse_totals:
+            return grad[0].toarray().ravel()
+
         return grad[0, :]
 
     def _congradfunc(self, x_new, name, dbl, idx):
@@ -724,6 +740,8 @@ class ScipyOptimizeDriver(Driver):
         if meta['linear']:
             grad = self._lincongrad_cache
         else:
+            # when _sparse_totals is set this is a csr matrix, so the rows returned below stay
+            # sparse, which trust-constr handles directly.
             grad = self._grad_cache
         grad_idx = self._con_idx[name] + idx
 
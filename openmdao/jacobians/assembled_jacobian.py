@@ -13,6 +13,7 @@ from openmdao.matrices.dense_matrix import DenseMatrix
 from openmdao.matrices.coo_matrix import COOMatrix
 from openmdao.matrices.csr_matrix import CSRMatrix
 from openmdao.matrices.csc_matrix import CSCMatrix
+from openmdao.matrices.bsr_matrix import BSRMatrix
 from openmdao.utils.units import get_conversion
 from openmdao.utils.array_utils import _flatten_src_indices
 
@@ -43,6 +44,11 @@ class AssembledJacobian(Jacobian):
         Column ranges for inputs.
     _out_ranges : dict
         Row ranges for outputs.
+    _int_stamps : dict
+        Stamp of each subjac at the time it was last copied into _int_mtx.
+    _ext_stamps : dict
+        Stamp of each subjac at the time it was last copied into _ext_mtx, keyed by system
+        pathname.
     """
 
     def __init__(self, matrix_class, system):
@@ -68,6 +74,8 @@ class AssembledJacobian(Jacobian):
         self._matrix_class = matrix_class
         self._in_ranges = None
         self._out_ranges = None
+        self._int_stamps = {}
+        self._ext_stamps = defaultdict(dict)
 
         self._subjac_iters = defaultdict(lambda: None)
         self._init_ranges(system)
@@ -100,6 +108,7 @@ class AssembledJacobian(Jacobian):
         all_meta = system._var_allprocs_abs2meta
 
         self._int_mtx = int_mtx = self._matrix_class(system.comm)
+        self._int_stamps = {}
         ext_mtx = self._matrix_class(system.comm)
 
         iproc = system.comm.rank
@@ -177,6 +186,7 @@ class AssembledJacobian(Jacobian):
             ext_mtx = None
 
         self._ext_mtx[system.pathname] = ext_mtx
+        self._ext_stamps[system.pathname] = {}
 
     def _init_view(self, system):
         """
@@ -248,6 +258,7 @@ class AssembledJacobian(Jacobian):
             ext_mtx = None
 
         self._ext_mtx[system.pathname] = ext_mtx
+        self._ext_stamps[system.pathname] = {}
 
     def _get_subjac_iters(self, system):
         global _empty_dict
@@ -324,19 +335,35 @@ class AssembledJacobian(Jacobian):
         if ext_mtx is not None:
             ext_mtx._pre_update()
 
+        int_stamps = self._int_stamps
+        ext_stamps = self._ext_stamps[system.pathname]
+
         if self._randomize:
             for key in iters:
                 int_mtx._update_submat(key, self._randomize_subjac(subjacs[key]['value'], key))
 
             for key in iters_in_ext:
                 ext_mtx._update_submat(key, self._randomize_subjac(subjacs[key]['value'], key))
-        else:
 
+            # make sure the random values get replaced on the next real update
+            int_stamps.clear()
+            ext_stamps.clear()
+        else:
+            # only copy subjacs that have changed since they were last copied.  Subjacs without
+            # a stamp can't be tracked, so they're always copied.
             for key in iters:
-                int_mtx._update_submat(key, subjacs[key]['value'])
+                meta = subjacs[key]
+                stamp = meta.get('stamp')
+                if stamp is None or int_stamps.get(key) != stamp:
+                    int_mtx._update_submat(key, meta['value'])
+                    int_stamps[key] = stamp
 
             for key in iters_in_ext:
-                ext_mtx._update_submat(key, subjacs[key]['value'])
+                meta = subjacs[key]
+                stamp = meta.get('stamp')
+                if stamp is None or ext_stamps.get(key) != stamp:
+                    ext_mtx._update_submat(key, meta['value'])
+                    ext_stamps[key] = stamp
 
         int_mtx._post_update()
         if ext_mtx is not None:
@@ -488,3 +515,20 @@ class CSCJacobian(AssembledJacobian):
             Parent system to this jacobian.
         """
         super(CSCJacobian, self).__init__(CSCMatrix, system=system)
+
+
+class BSRJacobian(AssembledJacobian):
+    """
+    Assemble sparse global <Jacobian> in Block Sparse Row format.
+    """
+
+    def __init__(self, system):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        system : System
+            Parent system to this jacobian.
+        """
+        super(BSRJacobian, self).__init__(BSRMatrix, system=system)
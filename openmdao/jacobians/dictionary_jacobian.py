@@ -2,9 +2,11 @@
 from __future__ import division
 
 import numpy as np
+from six import iteritems, itervalues
 from six.moves import range
 
 from openmdao.jacobians.jacobian import Jacobian
+from openmdao.matrices.csc_matrix import CSCMatrix
 
 
 _full_slice = slice(None)
@@ -18,10 +20,15 @@ class DictionaryJacobian(Jacobian):
     ----------
     _iter_keys : list of (vname, vname) tuples
         List of tuples of variable names that match subjacs in the this Jacobian.
-
+    _compile : bool
+        If True, subjacs are compiled into sparse operators that perform the matrix-vector
+        products instead of looping over the subjacs.
+    _compiled_ops : dict
+        Compiled (output matrix, input matrix, identity names) keyed by the vector name and
+        the sets of active input, output and residual names.
     """
 
-    def __init__(self, system, **kwargs):
+    def __init__(self, system, compile_jac=False, **kwargs):
         """
         Initialize all attributes.
 
@@ -29,11 +36,15 @@ class DictionaryJacobian(Jacobian):
         ----------
         system : System
             Parent system to this jacobian.
+        compile_jac : bool
+            If True, compile the subjacs into sparse operators for matrix-vector products.
         **kwargs : dict
             options dictionary.
         """
         super(DictionaryJacobian, self).__init__(system, **kwargs)
         self._iter_keys = {}
+        self._compile = compile_jac
+        self._compiled_ops = {}
 
     def _iter_abs_keys(self, system, vec_name):
         """
@@ -86,6 +97,10 @@ class DictionaryJacobian(Jacobian):
         mode : str
             'fwd' or 'rev'.
         """
+        if self._compile and not self._randomize:
+            self._apply_compiled(system, d_inputs, d_outputs, d_residuals, mode)
+            return
+
         # avoid circular import
         from openmdao.core.explicitcomponent import ExplicitComponent
 
@@ -163,3 +178,191 @@ class DictionaryJacobian(Jacobian):
                                 rflat[res_name] += subjac.dot(iflat[other_name])
                             else:  # rev
                                 iflat[other_name] += subjac.T.dot(rflat[res_name])
+
+    def _apply_compiled(self, system, d_inputs, d_outputs, d_residuals, mode):
+        """
+        Compute matrix-vector product using the compiled sparse operators.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+        d_inputs : Vector
+            inputs linear vector.
+        d_outputs : Vector
+            outputs linear vector.
+        d_residuals : Vector
+            residuals linear vector.
+        mode : str
+            'fwd' or 'rev'.
+        """
+        op_key = (d_residuals._name, d_inputs._names, d_outputs._names, d_residuals._names)
+        try:
+            out_mtx, in_mtx, ident_names = self._compiled_ops[op_key]
+        except KeyError:
+            out_mtx, in_mtx, ident_names = self._compiled_ops[op_key] = \
+                self._compile_ops(system, d_inputs, d_outputs, d_residuals)
+
+        if not np.iscomplexobj(d_residuals._data):
+            # subjacs may have been returned to real values after complex step without a
+            # call to _update, so make sure we don't apply stale complex operators.
+            for mtx in (out_mtx, in_mtx):
+                if mtx is not None and np.iscomplexobj(mtx._coo.data):
+                    self._update_op(mtx)
+
+        rflat = d_residuals._views_flat
+        oflat = d_outputs._views_flat
+
+        with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+            if mode == 'fwd':
+                if out_mtx is not None:
+                    d_residuals._data += out_mtx._prod(d_outputs._data, mode, None)
+                if in_mtx is not None:
+                    d_residuals._data += in_mtx._prod(d_inputs._data, mode, None)
+                for name in ident_names:
+                    rflat[name] -= oflat[name]
+            else:  # rev
+                if out_mtx is not None:
+                    d_outputs._data += out_mtx._prod(d_residuals._data, mode, None)
+                if in_mtx is not None:
+                    d_inputs._data += in_mtx._prod(d_residuals._data, mode, None)
+                for name in ident_names:
+                    oflat[name] -= rflat[name]
+
+    def _compile_ops(self, system, d_inputs, d_outputs, d_residuals):
+        """
+        Build the sparse operators for the subjacs that are active in the given vectors.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+        d_inputs : Vector
+            inputs linear vector.
+        d_outputs : Vector
+            outputs linear vector.
+        d_residuals : Vector
+            residuals linear vector.
+
+        Returns
+        -------
+        CSCMatrix or None
+            Operator mapping d_outputs to d_residuals, or None if there are no such subjacs.
+        CSCMatrix or None
+            Operator mapping d_inputs to d_residuals, or None if there are no such subjacs.
+        list of str
+            Names of outputs with identity subjacs, which are applied without a product.
+        """
+        # avoid circular import
+        from openmdao.core.explicitcomponent import ExplicitComponent
+
+        vec_name = d_residuals._name
+        is_explicit = isinstance(system, ExplicitComponent)
+        subjacs_info = self._subjacs_info
+        d_res_names = d_residuals._names
+        d_out_names = d_outputs._names
+        d_inp_names = d_inputs._names
+
+        # local offsets of each variable within the vector data arrays
+        iproc = system.comm.rank
+        abs2idx = system._var_allprocs_abs2idx[vec_name]
+        sizes = system._var_sizes[vec_name]
+        offsets = {}
+        for type_, offs in iteritems(system._get_var_offsets()[vec_name]):
+            if offs.size > 0:
+                offs = offs[iproc] - offs[iproc, 0]
+            offsets[type_] = offs
+
+        out_mtx = CSCMatrix(system.comm)
+        in_mtx = CSCMatrix(system.comm)
+        ident_names = []
+
+        for abs_key in self._iter_abs_keys(system, vec_name):
+            res_name, other_name = abs_key
+            if res_name not in d_res_names:
+                continue
+
+            if other_name in d_out_names:
+                if res_name is other_name and is_explicit:
+                    ident_names.append(res_name)
+                    continue
+                mtx = out_mtx
+                type_ = 'output'
+            elif other_name in d_inp_names:
+                mtx = in_mtx
+                type_ = 'input'
+            else:
+                continue
+
+            ires = abs2idx[res_name]
+            iother = abs2idx[other_name]
+            shape = (sizes['output'][iproc, ires], sizes[type_][iproc, iother])
+            mtx._add_submat(abs_key, subjacs_info[abs_key], offsets['output'][ires],
+                            offsets[type_][iother], None, shape)
+
+        nrows = d_residuals._data.shape[0]
+        for mtx, ncols in ((out_mtx, d_outputs._data.shape[0]),
+                           (in_mtx, d_inputs._data.shape[0])):
+            if mtx._submats:
+                mtx._build(nrows, ncols, None, None)
+                self._update_op(mtx)
+
+        return (out_mtx if out_mtx._submats else None,
+                in_mtx if in_mtx._submats else None,
+                ident_names)
+
+    def _update_op(self, mtx):
+        """
+        Copy the current subjac values into the given compiled operator.
+
+        Parameters
+        ----------
+        mtx : CSCMatrix
+            Compiled operator to update.
+        """
+        subjacs_info = self._subjacs_info
+
+        # subjacs become complex during complex step, so the operator data must follow
+        cplx = False
+        for key in mtx._submats:
+            if np.iscomplexobj(subjacs_info[key]['value']):
+                cplx = True
+                break
+        if cplx != np.iscomplexobj(mtx._coo.data):
+            mtx.set_complex_step_mode(cplx)
+
+        mtx._pre_update()
+        for key in mtx._submats:
+            mtx._update_submat(key, subjacs_info[key]['value'])
+        mtx._post_update()
+
+    def _update(self, system):
+        """
+        Refresh the data of any compiled operators from the user's sub-Jacobians.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+        """
+        for ops in itervalues(self._compiled_ops):
+            for mtx in ops[:2]:
+                if mtx is not None:
+                    self._update_op(mtx)
+
+    def set_complex_step_mode(self, active):
+        """
+        Turn on or off complex stepping mode.
+
+        When turned on, the value in each subjac is cast as complex, and when turned
+        off, they are returned to real values.
+
+        Parameters
+        ----------
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
+        """
+        super(DictionaryJacobian, self).set_complex_step_mode(active)
+
+        # the subjac arrays have been replaced, so refresh the compiled operators
+        self._update(self._system)
@@ -4,6 +4,7 @@ import numpy as np
 from numpy.random import rand
 
 from collections import OrderedDict, defaultdict
+from itertools import count
 from scipy.sparse import issparse
 from six import itervalues, iteritems
 
@@ -19,6 +20,23 @@ SUBJAC_META_DEFAULTS = {
 
 _full_slice = slice(None)
 
+# Every change to a subjac value is tagged with a new stamp (stored in the subjac metadata under
+# 'stamp') so that jacobians that copy subjac values into their own storage can skip the ones
+# that haven't changed since they last looked.
+_subjac_stamps = count(1)
+
+
+def _stamp_subjac(meta):
+    """
+    Mark the value of the given subjac as changed.
+
+    Parameters
+    ----------
+    meta : dict
+        Metadata dict of the subjac.
+    """
+    meta['stamp'] = next(_subjac_stamps)
+
 
 class Jacobian(object):
     """
@@ -122,7 +140,10 @@ class Jacobian(object):
         """
         abs_key = self._get_abs_key(key)
         if abs_key in self._subjacs_info:
-            return self._subjacs_info[abs_key]['value']
+            meta = self._subjacs_info[abs_key]
+            # the caller may modify the returned array in place
+            _stamp_subjac(meta)
+            return meta['value']
         else:
             msg = '{}: Variable name pair ("{}", "{}") not found.'
             raise KeyError(msg.format(self.msginfo, key[0], key[1]))
@@ -147,6 +168,7 @@ class Jacobian(object):
                 raise KeyError(msg.format(self.msginfo, key[0], key[1]))
 
             subjacs_info = self._subjacs_info[abs_key]
+            _stamp_subjac(subjacs_info)
 
             if issparse(subjac):
                 subjacs_info['value'] = subjac
@@ -390,5 +412,6 @@ class Jacobian(object):
                 meta['value'] = meta['value'].astype(np.complex)
             else:
                 meta['value'] = meta['value'].real
+            _stamp_subjac(meta)
 
         self._under_complex_step = active
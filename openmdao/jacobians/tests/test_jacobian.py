@@ -7,13 +7,16 @@ from six import assertRaisesRegex
 from six.moves import range
 
 import numpy as np
-from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse import coo_matrix, csr_matrix, csc_matrix
 
 from openmdao.api import IndepVarComp, Group, Problem, \
                          ExplicitComponent, ImplicitComponent, ExecComp, \
                          NewtonSolver, ScipyKrylov, \
                          LinearBlockGS, DirectSolver
-from openmdao.utils.assert_utils import assert_rel_error
+from openmdao.utils.assert_utils import assert_rel_error, assert_warning
+from openmdao.matrices.coo_matrix import _sub_matrix
+from openmdao.matrices.csc_matrix import CSCMatrix
+from openmdao.matrices.bsr_matrix import _find_block_size
 from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
      SellarDis2withDerivatives
@@ -968,5 +971,429 @@ class MaskingTestCase(unittest.TestCase):
         np.testing.assert_allclose(totals, expected)
 
 
+class ConstPartialsComp(ExplicitComponent):
+    def setup(self):
+        self.add_input('x', np.zeros(2))
+        self.add_output('y', np.zeros(2))
+
+        self.declare_partials('y', 'x', val=np.array([[2.0, 1.0], [0.0, 3.0]]))
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = np.array([2.0*inputs['x'][0] + inputs['x'][1], 3.0*inputs['x'][1]])
+
+
+class IncrementalUpdateTestCase(unittest.TestCase):
+
+    def _setup_model(self, jac_type, src_indices=None):
+        p = Problem()
+        model = p.model
+        model.add_subsystem('indeps', IndepVarComp('x', np.array([1.0, 2.0])))
+        model.add_subsystem('C1', ConstPartialsComp())
+        model.add_subsystem('C2', MyDenseComp())
+
+        model.connect('indeps.x', 'C1.x')
+        model.connect('indeps.x', 'C2.x', src_indices=src_indices)
+        model.connect('C1.y', 'C2.y')
+
+        model.options['assembled_jac_type'] = jac_type
+        model.linear_solver = DirectSolver(assemble_jac=True)
+        p.set_solver_print(level=0)
+        p.setup()
+        p.run_model()
+        return p
+
+    def _get_matrix(self, p):
+        mtx = p.model._assembled_jac._int_mtx._matrix
+        return mtx if isinstance(mtx, np.ndarray) else mtx.toarray()
+
+    @parameterized.expand(itertools.product(['csc', 'dense'], [None, [1, 1]]),
+                          name_func=lambda f, n, p: 'test_only_changed_subjacs_copied_{}_{}'.format(
+                              p.args[0], 'dups' if p.args[1] else 'nodups'))
+    def test_only_changed_subjacs_copied(self, jac_type, src_indices):
+        p = self._setup_model(jac_type, src_indices)
+        p.model.run_linearize()
+
+        int_mtx = p.model._assembled_jac._int_mtx
+        updated = []
+        update_submat = int_mtx._update_submat
+
+        def _update_submat(key, jac):
+            updated.append(key)
+            update_submat(key, jac)
+
+        int_mtx._update_submat = _update_submat
+
+        p['indeps.x'] = np.array([3.0, -1.0])
+        p.run_model()
+        p.model.run_linearize()
+
+        # the constant partials are only written the first time
+        self.assertEqual(sorted(updated), [('C2.z', 'C2.x'), ('C2.z', 'C2.y')])
+
+        # the partially updated matrix must match one assembled from scratch
+        fresh = self._setup_model(jac_type, src_indices)
+        fresh['indeps.x'] = np.array([3.0, -1.0])
+        fresh.run_model()
+        fresh.model.run_linearize()
+
+        np.testing.assert_allclose(self._get_matrix(p), self._get_matrix(fresh))
+
+        J = p.compute_totals(of=['C2.z'], wrt=['indeps.x'], return_format='array')
+        Jfresh = fresh.compute_totals(of=['C2.z'], wrt=['indeps.x'], return_format='array')
+        np.testing.assert_allclose(J, Jfresh)
+
+    @parameterized.expand(['csc', 'dense'],
+                          name_func=lambda f, n, p: 'test_in_place_subjac_change_' + p.args[0])
+    def test_in_place_subjac_change(self, jac_type):
+        p = self._setup_model(jac_type)
+        p.model.run_linearize()
+
+        # modifying a constant subjac in place through the jacobian must still be picked up
+        p.model.C1._jacobian['y', 'x'][0, 1] = 5.0
+        p.model.run_linearize()
+
+        self.assertEqual(self._get_matrix(p)[2, 1], 5.0)
+
+
+class SubOperatorTestCase(unittest.TestCase):
+
+    def _get_coo(self):
+        rows = np.array([0, 4, 2, 1, 3, 4, 0, 2, 3, 1])
+        cols = np.array([0, 0, 1, 2, 2, 3, 4, 4, 5, 5])
+        data = np.arange(1., rows.size + 1)
+        return coo_matrix((data, (rows, cols)), shape=(5, 6))
+
+    @parameterized.expand(itertools.product(['coo', 'csc', 'csr'], [False, True], [False, True]),
+                          name_func=lambda f, n, p: 'test_sub_matrix_{}{}{}'.format(
+                              p.args[0], '_ranges' if p.args[1] else '',
+                              '_mask' if p.args[2] else ''))
+    def test_sub_matrix(self, fmt, use_ranges, use_mask):
+        mat = getattr(self._get_coo(), 'to' + fmt)()
+        full = mat.tocoo()
+
+        ranges = (1, 4, 2, 6) if use_ranges else None
+        mask = np.zeros(mat.data.size, dtype=bool)
+        if use_mask:
+            mask[::3] = True
+
+        sub, idxs = _sub_matrix(mat, ranges, mask if use_mask else None)
+        self.assertEqual(sub.format, mat.format)
+
+        # build the expected result from the entries of the parent that weren't left out
+        expected = mat.toarray()
+        if use_mask:
+            expected -= coo_matrix((mat.data * mask, (full.row, full.col)),
+                                   shape=mat.shape).toarray()
+        if use_ranges:
+            expected = expected[1:4, 2:6]
+
+        np.testing.assert_array_equal(sub.toarray(), expected)
+        np.testing.assert_array_equal(sub.data, mat.data[idxs])
+
+    def test_masked_operator_refresh(self):
+        mtx = CSCMatrix(None)
+        mtx._matrix = self._get_coo().tocsc()
+        mask = np.zeros(mtx._matrix.data.size, dtype=bool)
+        mask[[1, 4]] = True
+
+        vec = np.arange(1., 7.)
+
+        def expected():
+            data = mtx._matrix.data.copy()
+            data[mask] = 0.
+            mat = csc_matrix((data, mtx._matrix.indices, mtx._matrix.indptr),
+                             shape=mtx._matrix.shape)
+            return mat.dot(vec)
+
+        np.testing.assert_allclose(mtx._prod(vec, 'fwd', None, mask), expected())
+        op = mtx._mask_op_cache[id(mask)][0]
+
+        # operator is reused as long as the data doesn't change
+        mtx._prod(vec, 'fwd', None, mask)
+        self.assertIs(mtx._mask_op_cache[id(mask)][0], op)
+
+        # new data is copied into the same operator
+        mtx._matrix.data *= 2.
+        mtx._data_version += 1
+        data = mtx._matrix.data.copy()
+        np.testing.assert_allclose(mtx._prod(vec, 'fwd', None, mask), expected())
+        self.assertIs(mtx._mask_op_cache[id(mask)][0], op)
+
+        # parent data is untouched by the masked product
+        np.testing.assert_array_equal(mtx._matrix.data, data)
+
+
+class BlockComp(ImplicitComponent):
+    # vectorized over nodes, with a dense 3x3 block per node in every partial
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+
+    def setup(self):
+        n = self.options['num_nodes']
+        self.add_input('x', np.ones((n, 3)))
+        self.add_output('y', np.ones((n, 3)))
+
+        rows = np.repeat(np.arange(3 * n), 3)
+        cols = np.tile(np.arange(3), 3 * n) + 3 * (np.arange(3 * n * 3) // 9)
+        self.declare_partials('y', 'x', rows=rows, cols=cols)
+        self.declare_partials('y', 'y', rows=rows, cols=cols)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['y'] = np.einsum('nij,nj->ni', self._blocks(inputs), outputs['y']) - \
+            inputs['x'] ** 2
+
+    def solve_nonlinear(self, inputs, outputs):
+        outputs['y'] = np.linalg.solve(self._blocks(inputs), inputs['x'] ** 2)
+
+    def linearize(self, inputs, outputs, partials):
+        n = self.options['num_nodes']
+        x = inputs['x']
+        y = outputs['y']
+
+        # d(A(x) y)/dx, where A[i, j] = 4 (i == j) + x[i] * x[j]
+        dAy = np.einsum('ni,nj->nij', x, y) + np.einsum('ij,nk,nk->nij', np.eye(3), x, y)
+        partials['y', 'x'] = (dAy - 2.0 * np.einsum('ij,ni->nij', np.eye(3), x)).ravel()
+        partials['y', 'y'] = self._blocks(inputs).ravel()
+
+    def _blocks(self, inputs):
+        x = inputs['x']
+        return 4.0 * np.eye(3) + np.einsum('ni,nj->nij', x, x)
+
+
+class BSRJacobianTestCase(unittest.TestCase):
+
+    def test_find_block_size(self):
+        # 2x2 dense blocks on the diagonal
+        rows = np.repeat(np.arange(8), 2)
+        cols = np.tile([0, 1], 8) + 2 * (np.arange(16) // 4)
+        self.assertEqual(_find_block_size(rows, cols, 8, 8), (2, 2))
+
+        # a plain diagonal doesn't benefit from blocks
+        self.assertEqual(_find_block_size(np.arange(8), np.arange(8), 8, 8), (1, 1))
+
+        # the number of rows and columns of the blocks only have to divide their own dimension
+        self.assertEqual(_find_block_size(rows, cols, 8, 9), (2, 1))
+        self.assertEqual(_find_block_size(rows, cols, 9, 9), (1, 1))
+
+    def _setup_model(self, jac_type, mode, src_indices=None, sub_solver=False):
+        n = 5
+        p = Problem()
+        model = p.model
+        model.add_subsystem('indeps', IndepVarComp('x', np.random.random((n, 3)) + 0.5))
+
+        if sub_solver:
+            # the group with the assembled jacobian gets its input from outside,
+            # so it also has an external matrix
+            parent = model.add_subsystem('sub', Group())
+            parent.linear_solver = DirectSolver(assemble_jac=True)
+            parent.options['assembled_jac_type'] = jac_type
+            model.linear_solver = ScipyKrylov()
+            model.connect('indeps.x', 'sub.blk.x', src_indices=src_indices,
+                          flat_src_indices=True)
+        else:
+            parent = model
+            model.linear_solver = DirectSolver(assemble_jac=True)
+            model.options['assembled_jac_type'] = jac_type
+            model.connect('indeps.x', 'blk.x', src_indices=src_indices, flat_src_indices=True)
+
+        parent.add_subsystem('blk', BlockComp(num_nodes=n))
+
+        p.set_solver_print(level=0)
+        p.setup(mode=mode, force_alloc_complex=True)
+        p.run_model()
+        return p
+
+    @parameterized.expand(itertools.product(['fwd', 'rev'], [False, True], [False, True]),
+                          name_func=lambda f, n, p: 'test_bsr_totals_{}{}{}'.format(
+                              p.args[0], '_dups' if p.args[1] else '',
+                              '_sub' if p.args[2] else ''))
+    def test_bsr_totals(self, mode, dups, sub_solver):
+        src_indices = None
+        if dups:
+            src_indices = np.arange(15).reshape(5, 3)
+            src_indices[:, 2] = src_indices[:, 1]
+
+        p = self._setup_model('bsr', mode, src_indices, sub_solver)
+        blk = 'sub.blk' if sub_solver else 'blk'
+
+        J = p.compute_totals(of=[blk + '.y'], wrt=['indeps.x'], return_format='array')
+
+        if not dups:
+            jac = (p.model.sub if sub_solver else p.model)._assembled_jac
+            self.assertEqual(jac._int_mtx._matrix.blocksize, (3, 3))
+        p['indeps.x'] = p['indeps.x'] * 1.5
+        p.run_model()
+        J2 = p.compute_totals(of=[blk + '.y'], wrt=['indeps.x'], return_format='array')
+
+        expected = self._setup_model('csc', mode, src_indices, sub_solver)
+        expected['indeps.x'] = p['indeps.x'] / 1.5
+        expected.run_model()
+        Jcsc = expected.compute_totals(of=[blk + '.y'], wrt=['indeps.x'],
+                                       return_format='array')
+        expected['indeps.x'] = p['indeps.x']
+        expected.run_model()
+        Jcsc2 = expected.compute_totals(of=[blk + '.y'], wrt=['indeps.x'],
+                                        return_format='array')
+
+        assert_rel_error(self, J, Jcsc, 1e-10)
+        assert_rel_error(self, J2, Jcsc2, 1e-10)
+
+        data = p.check_totals(of=[blk + '.y'], wrt=['indeps.x'], method='cs', out_stream=None)
+        for val in data.values():
+            assert_rel_error(self, val['rel error'][0], 0.0, 1e-8)
+
+
+    def test_mixed_scalar_vector(self):
+        # the scalar output makes the number of rows of the jacobian prime, so no block shape fits
+        n = 5
+        p = Problem()
+        model = p.model
+        model.add_subsystem('indeps', IndepVarComp('x', np.random.random((n, 3)) + 0.5))
+        model.add_subsystem('blk', BlockComp(num_nodes=n))
+        model.add_subsystem('total', ExecComp('z = sum(y)', y=np.ones((n, 3))))
+        model.connect('indeps.x', 'blk.x')
+        model.connect('blk.y', 'total.y')
+        model.linear_solver = DirectSolver(assemble_jac=True)
+        model.options['assembled_jac_type'] = 'bsr'
+
+        p.set_solver_print(level=0)
+        p.setup()
+        p.run_model()
+
+        # the matrix is built when the jacobian is first assembled
+        msg = "No block structure was found in the 31x31 jacobian, so BSRMatrix uses 1x1 " \
+              "blocks, which is less efficient than CSCMatrix or CSRMatrix."
+        with assert_warning(UserWarning, msg):
+            p.compute_totals(of=['total.z'], wrt=['indeps.x'])
+
+        self.assertEqual(model._assembled_jac._int_mtx._matrix.blocksize, (1, 1))
+
+        data = p.check_totals(of=['total.z'], wrt=['indeps.x'], out_stream=None)
+        for val in data.values():
+            assert_rel_error(self, val['rel error'][0], 0.0, 1e-5)
+
+
+class CompiledJacTestCase(unittest.TestCase):
+
+    def _setup_model(self, comp_jac_class, compile_jac, mode='fwd', vectorize=False):
+        prob = Problem()
+        model = prob.model
+
+        indep = model.add_subsystem('indep', IndepVarComp())
+        indep.add_output('a', val=np.ones(3))
+        indep.add_output('b', val=np.ones(2))
+
+        model.add_subsystem('C1', MyExplicitComp(comp_jac_class))
+        model.add_subsystem('C2', MyExplicitComp2(comp_jac_class))
+        model.connect('indep.a', 'C1.x', src_indices=[2, 0])
+        model.connect('indep.b', 'C1.y')
+        model.connect('indep.a', 'C2.w', src_indices=[0, 2, 1])
+        model.connect('C1.f', 'C2.z', src_indices=[1])
+
+        model.C1.options['compile_jac'] = compile_jac
+        model.C2.options['compile_jac'] = compile_jac
+
+        model.add_design_var('indep.a', vectorize_derivs=vectorize)
+        model.add_design_var('indep.b', vectorize_derivs=vectorize)
+        model.add_constraint('C1.f', lower=0., vectorize_derivs=vectorize)
+        # C2.f is scalar, so it can't be vectorized in rev mode
+        model.add_constraint('C2.f', lower=0.)
+
+        prob.set_solver_print(level=0)
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        return prob
+
+    @parameterized.expand(itertools.product(
+        [np.array, coo_matrix, csr_matrix, inverted_coo, inverted_csr, arr2list, arr2revlist],
+        ), name_func=lambda f, n, p: 'test_compiled_apply_linear_' + p.args[0].__name__
+    )
+    def test_compiled_apply_linear(self, comp_jac_class):
+        prob = self._setup_model(comp_jac_class, True, mode='auto')
+        prob.model.run_linearize()
+
+        self.assertTrue(prob.model.C1._jacobian._compile)
+
+        # same checks as TestJacobian.test_src_indices, but through the compiled operators
+        fwd_check = np.array([-1.0, -1.0, -1.0, -1.0, -1.0, 24., 74., 8.])
+        rev_check = np.array([35., 5., -9., 63., 3., -1., 6., -1.])
+
+        d_inputs, d_outputs, d_residuals = prob.model.get_linear_vectors()
+
+        d_outputs.set_const(1.0)
+        prob.model.run_apply_linear(['linear'], 'fwd')
+        assert_rel_error(self, d_residuals._data, fwd_check, 1e-15)
+
+        d_residuals.set_const(1.0)
+        prob.model.run_apply_linear(['linear'], 'rev')
+        assert_rel_error(self, d_outputs._data, rev_check, 1e-15)
+
+        self.assertTrue(prob.model.C1._jacobian._compiled_ops)
+
+    @parameterized.expand(itertools.product(
+        [np.array, csr_matrix, arr2list],
+        ['fwd', 'rev'],
+        [False, True],
+        ), name_func=lambda f, n, p: '_'.join(['test_compiled_totals', p.args[0].__name__,
+                                               p.args[1], str(p.args[2])])
+    )
+    def test_compiled_totals(self, comp_jac_class, mode, vectorize):
+        expected = self._setup_model(comp_jac_class, False, mode, vectorize).compute_totals()
+
+        prob = self._setup_model(comp_jac_class, True, mode, vectorize)
+        J = prob.compute_totals()
+        for key, val in expected.items():
+            assert_rel_error(self, J[key], val, 1e-15)
+
+        # change the inputs so that the compiled operators must be refreshed
+        prob['indep.a'] = np.array([3., -2., 5.])
+        prob['indep.b'] = np.array([.5, 7.])
+        prob.run_model()
+        J = prob.compute_totals()
+
+        ref = self._setup_model(comp_jac_class, False, mode, vectorize)
+        ref['indep.a'] = np.array([3., -2., 5.])
+        ref['indep.b'] = np.array([.5, 7.])
+        ref.run_model()
+        expected = ref.compute_totals()
+        for key, val in expected.items():
+            assert_rel_error(self, J[key], val, 1e-15)
+
+    def test_compiled_implicit(self):
+        from openmdao.test_suite.components.sellar import SellarImplicitDis1
+
+        def build(compile_jac):
+            prob = Problem()
+            model = prob.model
+            model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+            model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+            model.add_subsystem('py2', IndepVarComp('y2', 5.0), promotes=['y2'])
+            comp = model.add_subsystem('d1', SellarImplicitDis1(), promotes=['*'])
+            comp.options['compile_jac'] = compile_jac
+            model.add_subsystem('obj_cmp', ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                    z=np.array([0.0, 0.0]), x=0.0),
+                                promotes=['obj', 'x', 'z', 'y1', 'y2'])
+            model.nonlinear_solver = NewtonSolver()
+            model.linear_solver = ScipyKrylov(atol=1e-12)
+            prob.set_solver_print(level=0)
+            prob.setup(force_alloc_complex=True)
+            prob.run_model()
+            return prob
+
+        expected = build(False).compute_totals(of=['obj', 'y1'], wrt=['x', 'z'])
+        prob = build(True)
+        J = prob.compute_totals(of=['obj', 'y1'], wrt=['x', 'z'])
+        for key, val in expected.items():
+            assert_rel_error(self, J[key], val, 1e-12)
+
+        self.assertTrue(prob.model.d1._jacobian._compiled_ops)
+
+        # operators are rebuilt with complex data under complex step
+        data = prob.check_totals(of=['obj', 'y1'], wrt=['x', 'z'], method='cs', out_stream=None)
+        for key, val in data.items():
+            assert_rel_error(self, val['rel error'][0], 0.0, 1e-8)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,211 @@
+"""Define the BSRmatrix class."""
+
+import numpy as np
+from scipy.sparse import bsr_matrix
+from six import iteritems
+
+from openmdao.matrices.coo_matrix import COOMatrix
+from openmdao.utils.general_utils import simple_warning
+
+# largest block size considered when looking for block structure
+_MAX_BLOCK_SIZE = 8
+
+
+def _find_block_size(rows, cols, num_rows, num_cols, max_size=_MAX_BLOCK_SIZE):
+    """
+    Find the block shape that stores the given nonzero entries in the least memory.
+
+    The number of rows and columns of the blocks are chosen separately, so each only has to
+    divide its own dimension of the matrix.
+
+    Parameters
+    ----------
+    rows : ndarray of int
+        Row index of each nonzero entry.
+    cols : ndarray of int
+        Column index of each nonzero entry.
+    num_rows : int
+        Number of rows in the matrix.
+    num_cols : int
+        Number of columns in the matrix.
+    max_size : int
+        Largest number of rows or columns of a block to consider.
+
+    Returns
+    -------
+    (int, int)
+        Number of rows and columns of the blocks.
+    """
+    row_sizes = [size for size in range(1, max_size + 1) if num_rows % size == 0]
+    col_sizes = [size for size in range(1, max_size + 1) if num_cols % size == 0]
+
+    best_size = (1, 1)
+    best_bytes = None
+    for nr in row_sizes:
+        block_rows = rows // nr
+        for nc in col_sizes:
+            nblocks = np.unique(block_rows * (num_cols // nc) + cols // nc).size
+
+            # 8 bytes per stored value plus one column index per block
+            nbytes = nblocks * (nr * nc * 8 + 4)
+            if best_bytes is None or nbytes <= best_bytes:
+                best_size = (nr, nc)
+                best_bytes = nbytes
+
+    return best_size
+
+
+class BSRMatrix(COOMatrix):
+    """
+    Sparse matrix in Block Sparse Row format.
+
+    The block shape is chosen automatically when the matrix is built, based on the locations of
+    the nonzero entries.  A warning is issued if no block structure is found.
+
+    Attributes
+    ----------
+    _coo2bsr : ndarray of int
+        Index into the flattened BSR data array for each entry in the COO data array.
+    _has_dups : bool
+        True if more than one COO entry maps to the same BSR entry.
+    _bsr_idxs : dict
+        Flattened BSR data indices for each sub-jacobian.  Only used when there are no
+        duplicate entries.
+    _dirty : bool
+        If True, the BSR data must be recomputed from the COO data in _post_update.
+    """
+
+    def __init__(self, comm):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the top-level system that owns the <Jacobian>.
+        """
+        super(BSRMatrix, self).__init__(comm)
+        self._coo2bsr = None
+        self._has_dups = False
+        self._bsr_idxs = {}
+        self._dirty = False
+
+    def _build(self, num_rows, num_cols, in_ranges, out_ranges):
+        """
+        Allocate the matrix.
+
+        Parameters
+        ----------
+        num_rows : int
+            number of rows in the matrix.
+        num_cols : int
+            number of cols in the matrix.
+        in_ranges : dict
+            Maps input var name to column range.
+        out_ranges : dict
+            Maps output var name to row range.
+        """
+        super(BSRMatrix, self)._build(num_rows, num_cols, in_ranges, out_ranges)
+        coo = self._coo
+
+        nr, nc = _find_block_size(coo.row, coo.col, num_rows, num_cols)
+        if nr == nc == 1 and coo.nnz > 0:
+            simple_warning("No block structure was found in the {}x{} jacobian, so BSRMatrix "
+                           "uses 1x1 blocks, which is less efficient than CSCMatrix or "
+                           "CSRMatrix.".format(num_rows, num_cols))
+        num_block_cols = num_cols // nc
+
+        block_ids = (coo.row // nr) * num_block_cols + coo.col // nc
+        ublock_ids = np.unique(block_ids)
+        block_rows = ublock_ids // num_block_cols
+
+        # where each COO entry lands in the flattened (nblocks, nr, nc) data array
+        self._coo2bsr = coo2bsr = (np.searchsorted(ublock_ids, block_ids) * (nr * nc) +
+                                   (coo.row % nr) * nc + coo.col % nc)
+
+        indptr = np.searchsorted(block_rows, np.arange(num_rows // nr + 1))
+        self._matrix = bsr_matrix((np.zeros((ublock_ids.size, nr, nc)),
+                                   ublock_ids % num_block_cols, indptr),
+                                  shape=(num_rows, num_cols))
+
+        self._has_dups = np.unique(coo2bsr).size < coo2bsr.size
+        if self._has_dups:
+            self._bsr_idxs = {}
+        else:
+            self._bsr_idxs = {key: coo2bsr[idxs] for key, (idxs, _, _) in
+                              iteritems(self._metadata)}
+        self._dirty = False
+
+    def _update_submat(self, key, jac):
+        """
+        Update the values of a sub-jacobian.
+
+        Parameters
+        ----------
+        key : (str, str)
+            the global output and input variable names.
+        jac : ndarray or scipy.sparse or tuple
+            the sub-jacobian, the same format with which it was declared.
+        """
+        super(BSRMatrix, self)._update_submat(key, jac)
+
+        if self._has_dups:
+            # overlapping entries have to be summed, so defer to _post_update
+            self._dirty = True
+        else:
+            self._matrix.data.reshape(-1)[self._bsr_idxs[key]] = \
+                self._coo.data[self._metadata[key][0]]
+
+    def _post_update(self):
+        """
+        Do anything that needs to be done at the end of AssembledJacobian._update.
+        """
+        if self._dirty:
+            # this will add any repeated entries together
+            coo_data = self._coo.data
+            coo2bsr = self._coo2bsr
+            flat = self._matrix.data.reshape(-1)
+            if np.iscomplexobj(coo_data):
+                flat[:] = np.bincount(coo2bsr, coo_data.real, flat.size) + \
+                    1j * np.bincount(coo2bsr, coo_data.imag, flat.size)
+            else:
+                flat[:] = np.bincount(coo2bsr, coo_data, flat.size)
+            self._dirty = False
+
+    def set_complex_step_mode(self, active):
+        """
+        Turn on or off complex stepping mode.
+
+        When turned on, the value in each subjac is cast as complex, and when turned
+        off, they are returned to real values.
+
+        Parameters
+        ----------
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
+        """
+        super(BSRMatrix, self).set_complex_step_mode(active)
+
+        if active:
+            self._matrix.data = self._matrix.data.astype(np.complex)
+        else:
+            self._matrix.data = self._matrix.data.real.copy()
+
+    def _convert_mask(self, mask):
+        """
+        Convert the mask to the format of this sparse matrix (CSC, etc.) from COO.
+
+        Parameters
+        ----------
+        mask : ndarray
+            The mask of indices to zero out.
+
+        Returns
+        -------
+        ndarray
+            The converted mask array.
+        """
+        # a BSR entry is masked if any of the COO entries summed into it are masked
+        bsr_mask = np.zeros(self._matrix.data.size, dtype=bool)
+        bsr_mask[self._coo2bsr[mask]] = True
+        return bsr_mask
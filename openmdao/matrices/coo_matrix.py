@@ -4,7 +4,7 @@ from __future__ import division, print_function
 from collections import Counter, defaultdict
 import numpy as np
 from numpy import ndarray
-from scipy.sparse import coo_matrix
+from scipy.sparse import coo_matrix, csc_matrix, csr_matrix, bsr_matrix
 
 from six import iteritems
 from six.moves import range
@@ -21,10 +21,16 @@ class COOMatrix(Matrix):
     Attributes
     ----------
     _mat_range_cache : dict
-        Dictionary of cached CSC matrices needed for solving on a sub-range of the
-        parent CSC matrix.
+        Dictionary of cached matrices needed for solving on a sub-range of the
+        parent matrix, keyed by range.
+    _mask_op_cache : dict
+        Dictionary of cached matrices containing only the unmasked entries of the parent matrix,
+        keyed by the id of the mask.
     _coo : coo_matrix
         COO matrix. Used as a basis for conversion to CSC, CSR, Dense in inherited classes.
+    _data_version : int
+        Incremented whenever the matrix data changes, so that cached sub-matrices know when
+        they need to be refreshed.
     """
 
     def __init__(self, comm):
@@ -38,7 +44,9 @@ class COOMatrix(Matrix):
         """
         super(COOMatrix, self).__init__(comm)
         self._mat_range_cache = {}
+        self._mask_op_cache = {}
         self._coo = None
+        self._data_version = 0
 
     def _build_sparse(self, num_rows, num_cols):
         """
@@ -179,13 +187,16 @@ class COOMatrix(Matrix):
                             "the type (%s) used at init time." % (key,
                                                                   type(jac).__name__,
                                                                   jac_type.__name__))
+        self._data_version += 1
+
+        data = self._coo.data
         if isinstance(jac, ndarray):
-            self._matrix.data[idxs] = jac.flat
+            data[idxs] = jac.flat
         else:  # sparse
-            self._matrix.data[idxs] = jac.data
+            data[idxs] = jac.data
 
         if factor is not None:
-            self._matrix.data[idxs] *= factor
+            data[idxs] *= factor
 
     def _prod(self, in_vec, mode, ranges, mask=None):
         """
@@ -215,52 +226,63 @@ class COOMatrix(Matrix):
         if ranges is not None:
             rstart, rend, cstart, cend = ranges
             if rstart != 0 or cstart != 0 or rend != mat.shape[0] or cend != mat.shape[1]:
-                if ranges in self._mat_range_cache:
-                    mat, idxs = self._mat_range_cache[ranges]
-
-                    # update the data array of our smaller cached matrix with current data from
-                    # self._matrix
-                    mat.data[:] = self._matrix.data[idxs]
-                else:
-                    rstart, rend, cstart, cend = ranges
-                    rmat = mat.tocoo()
-
-                    # find all row and col indices that are within the desired range
-                    ridxs = np.nonzero(np.logical_and(rmat.row >= rstart, rmat.row < rend))[0]
-                    cidxs = np.nonzero(np.logical_and(rmat.col >= cstart, rmat.col < cend))[0]
-
-                    # take the intersection since both rows and cols must be within range
-                    idxs = np.intersect1d(ridxs, cidxs, assume_unique=True)
-
-                    # create a new smaller csc matrix using only the parts of self._matrix that
-                    # are within range
-                    mat = coo_matrix((rmat.data[idxs], (rmat.row[idxs] - rstart,
-                                                        rmat.col[idxs] - cstart)),
-                                     shape=(rend - rstart, cend - cstart))
-                    mat = mat.tocsc()
-                    self._mat_range_cache[ranges] = mat, idxs
+                mat = self._get_sub_operator(self._mat_range_cache, ranges, ranges=ranges)
 
         # NOTE: both mask and ranges will never be defined at the same time.  ranges applies only
         #       to int_mtx and mask applies only to ext_mtx.
+        elif mask is not None:
+            # masks come from the jacobian's mask cache, so each one is a persistent object
+            # corresponding to one set of active inputs.
+            mat = self._get_sub_operator(self._mask_op_cache, id(mask), mask=mask)
 
         if mode == 'fwd':
-            if mask is None:
-                return mat.dot(in_vec)
-            else:
-                save = mat.data[mask]
-                mat.data[mask] = 0.0
-                val = mat.dot(in_vec)
-                mat.data[mask] = save
-                return val
+            return mat.dot(in_vec)
         else:  # rev
-            if mask is None:
-                return mat.T.dot(in_vec)
-            else:
-                save = mat.data[mask]
-                mat.data[mask] = 0.0
-                val = mat.T.dot(in_vec)
-                mat.data[mask] = save
-                return val
+            return mat.T.dot(in_vec)
+
+    def _get_sub_operator(self, cache, key, ranges=None, mask=None):
+        """
+        Return a cached matrix made up of a subset of the entries of this matrix.
+
+        The cached matrix is created on first use and its data is refreshed in place only when
+        the data of this matrix has changed since the last call.
+
+        Parameters
+        ----------
+        cache : dict
+            Cache dict where the sub-matrix is stored.
+        key : hashable
+            Key of the sub-matrix in the cache.
+        ranges : (int, int, int, int) or None
+            Min row, max row, min col, max col of the sub-matrix.
+        mask : ndarray of type bool, or None
+            Array indicating which entries of the data array to leave out.
+
+        Returns
+        -------
+        coo_matrix or csc_matrix or csr_matrix
+            The sub-matrix.
+        """
+        data = self._matrix.data
+        try:
+            mat, idxs, owner, version = cache[key]
+        except KeyError:
+            pass
+        else:
+            # make sure a recycled id isn't fooling us
+            if owner is mask:
+                if version != self._data_version:
+                    if mat.data.dtype == data.dtype:
+                        np.take(data, idxs, out=mat.data)
+                    else:  # switched in or out of complex step mode
+                        mat.data = np.take(data, idxs)
+                    cache[key] = (mat, idxs, owner, self._data_version)
+                return mat
+
+        mat, idxs = _sub_matrix(self._matrix, ranges, mask)
+        cache[key] = (mat, idxs, mask, self._data_version)
+
+        return mat
 
     def _create_mask_cache(self, d_inputs):
         """
@@ -302,6 +324,8 @@ class COOMatrix(Matrix):
         active : bool
             Complex mode flag; set to True prior to commencing complex step.
         """
+        self._data_version += 1
+
         if active:
             self._coo.data = self._coo.data.astype(np.complex)
             self._coo.dtype = np.complex
@@ -324,3 +348,79 @@ class COOMatrix(Matrix):
             The converted mask array.
         """
         return mask
+
+
+def _sub_matrix(mat, ranges=None, mask=None):
+    """
+    Create a matrix containing a subset of the entries of a sparse matrix.
+
+    The entries keep their relative order, so the data array of the new matrix can later be
+    refreshed from the data array of the parent matrix using the returned indices.
+
+    Parameters
+    ----------
+    mat : coo_matrix or csc_matrix or csr_matrix or bsr_matrix
+        The parent matrix.
+    ranges : (int, int, int, int) or None
+        If not None, min row, max row, min col, max col of the sub-matrix.
+    mask : ndarray of type bool, or None
+        If not None, array indicating which entries of the data array to leave out.
+
+    Returns
+    -------
+    coo_matrix or csc_matrix or csr_matrix
+        The sub-matrix, in the same format as the parent, except that a BSR parent gives a COO
+        sub-matrix.
+    ndarray of int
+        Index into the (flattened) data array of the parent for each entry of the sub-matrix.
+    """
+    if ranges is None:
+        rstart = cstart = 0
+        shape = mat.shape
+    else:
+        rstart, rend, cstart, cend = ranges
+        shape = (rend - rstart, cend - cstart)
+
+    if isinstance(mat, coo_matrix):
+        rows = mat.row
+        cols = mat.col
+    elif isinstance(mat, bsr_matrix):
+        # every entry of every block, in the order of the flattened data array
+        nrow, ncol = mat.blocksize
+        block_rows = np.repeat(np.arange(mat.indptr.size - 1), np.diff(mat.indptr))
+        rows = (block_rows[:, None, None] * nrow + np.arange(nrow)[None, :, None] +
+                np.zeros(ncol, dtype=int)).ravel()
+        cols = (mat.indices[:, None, None] * ncol + np.zeros((nrow, 1), dtype=int) +
+                np.arange(ncol)).ravel()
+    else:  # compressed format
+        major = np.repeat(np.arange(mat.indptr.size - 1), np.diff(mat.indptr))
+        if isinstance(mat, csc_matrix):
+            rows, cols = mat.indices, major
+        else:
+            rows, cols = major, mat.indices
+
+    if ranges is None:
+        keep = np.ones(mat.data.size, dtype=bool)
+    else:
+        keep = (rows >= rstart) & (rows < rend) & (cols >= cstart) & (cols < cend)
+
+    if mask is not None:
+        keep &= ~mask
+
+    idxs = np.nonzero(keep)[0]
+    data = np.take(mat.data, idxs)
+
+    if isinstance(mat, (coo_matrix, bsr_matrix)):
+        return coo_matrix((data, (rows[idxs] - rstart, cols[idxs] - cstart)), shape=shape), idxs
+
+    # entries of the compressed format stay sorted, so the new index pointer is just the
+    # number of kept entries that precede each of the old pointers.
+    nkept = np.zeros(keep.size + 1, dtype=int)
+    np.cumsum(keep, out=nkept[1:])
+
+    if isinstance(mat, csc_matrix):
+        indptr = nkept[mat.indptr[cstart:cstart + shape[1] + 1]]
+        return csc_matrix((data, rows[idxs] - rstart, indptr), shape=shape), idxs
+    else:
+        indptr = nkept[mat.indptr[rstart:rstart + shape[0] + 1]]
+        return csr_matrix((data, cols[idxs] - cstart, indptr), shape=shape), idxs
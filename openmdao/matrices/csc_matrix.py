@@ -2,6 +2,7 @@
 
 import numpy as np
 from scipy.sparse import csc_matrix
+from six import iteritems
 
 from openmdao.matrices.coo_matrix import COOMatrix
 
@@ -9,8 +10,34 @@ from openmdao.matrices.coo_matrix import COOMatrix
 class CSCMatrix(COOMatrix):
     """
     Sparse matrix in Compressed Col Storage format.
+
+    Attributes
+    ----------
+    _coo2csc : ndarray of int
+        Index into the CSC data array for each entry in the COO data array.
+    _has_dups : bool
+        True if more than one COO entry maps to the same CSC entry.
+    _csc_idxs : dict
+        CSC data indices for each sub-jacobian.  Only used when there are no duplicate entries.
+    _dirty : bool
+        If True, the CSC data must be recomputed from the COO data in _post_update.
     """
 
+    def __init__(self, comm):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the top-level system that owns the <Jacobian>.
+        """
+        super(CSCMatrix, self).__init__(comm)
+        self._coo2csc = None
+        self._has_dups = False
+        self._csc_idxs = {}
+        self._dirty = False
+
     def _build(self, num_rows, num_cols, in_ranges, out_ranges):
         """
         Allocate the matrix.
@@ -27,24 +54,90 @@ class CSCMatrix(COOMatrix):
             Maps output var name to row range.
         """
         super(CSCMatrix, self)._build(num_rows, num_cols, in_ranges, out_ranges)
-        self._coo = self._matrix
+        coo = self._coo
+
+        # Compute where each COO entry lands in the CSC data array so that later updates can
+        # be written in place instead of converting the whole COO matrix every time.
+        # NOTE: The CSC matrix is built by hand instead of using self._coo.tocsc() because on
+        # older versions of scipy, self._coo.tocsc() reuses the row/col arrays and the result is
+        # that self._coo.row and self._coo.col get scrambled after csc conversion.
+        order = np.lexsort((coo.row, coo.col))
+        srows = coo.row[order]
+        scols = coo.col[order]
+
+        first = np.ones(order.size, dtype=bool)
+        first[1:] = (srows[1:] != srows[:-1]) | (scols[1:] != scols[:-1])
+
+        self._coo2csc = coo2csc = np.empty(order.size, dtype=int)
+        coo2csc[order] = np.cumsum(first) - 1
+
+        indices = srows[first]
+        indptr = np.searchsorted(scols[first], np.arange(num_cols + 1))
+
+        self._matrix = csc_matrix((np.zeros(indices.size), indices, indptr),
+                                  shape=(num_rows, num_cols))
+
+        self._has_dups = indices.size < order.size
+        if self._has_dups:
+            self._csc_idxs = {}
+        else:
+            self._csc_idxs = {key: coo2csc[idxs] for key, (idxs, _, _) in
+                              iteritems(self._metadata)}
+        self._dirty = False
 
-    def _pre_update(self):
+    def _update_submat(self, key, jac):
         """
-        Do anything that needs to be done at the start of AssembledJacobian._update.
+        Update the values of a sub-jacobian.
+
+        Parameters
+        ----------
+        key : (str, str)
+            the global output and input variable names.
+        jac : ndarray or scipy.sparse or tuple
+            the sub-jacobian, the same format with which it was declared.
         """
-        self._matrix = self._coo
+        super(CSCMatrix, self)._update_submat(key, jac)
+
+        if self._has_dups:
+            # overlapping entries have to be summed, so defer to _post_update
+            self._dirty = True
+        else:
+            self._matrix.data[self._csc_idxs[key]] = self._coo.data[self._metadata[key][0]]
 
     def _post_update(self):
         """
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
-        coo = self._coo
-        # this will add any repeated entries together
-        # NOTE: The CSC matrix was created in the following way instead of using self._coo.tocsc()
-        # because on older versions of scipy, self._coo.tocsc() reuses the row/col arrays and the
-        # result is that self._coo.row and self._coo.col get scrambled after csc conversion.
-        self._matrix = csc_matrix((coo.data, (coo.row, coo.col)), shape=coo.shape)
+        if self._dirty:
+            # this will add any repeated entries together
+            coo_data = self._coo.data
+            coo2csc = self._coo2csc
+            size = self._matrix.data.size
+            if np.iscomplexobj(coo_data):
+                self._matrix.data[:] = np.bincount(coo2csc, coo_data.real, size) + \
+                    1j * np.bincount(coo2csc, coo_data.imag, size)
+            else:
+                self._matrix.data[:] = np.bincount(coo2csc, coo_data, size)
+            self._dirty = False
+
+    def set_complex_step_mode(self, active):
+        """
+        Turn on or off complex stepping mode.
+
+        When turned on, the value in each subjac is cast as complex, and when turned
+        off, they are returned to real values.
+
+        Parameters
+        ----------
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
+        """
+        super(CSCMatrix, self).set_complex_step_mode(active)
+
+        if active:
+            self._matrix.data = self._matrix.data.astype(np.complex)
+        else:
+            self._matrix.data = self._matrix.data.real.copy()
 
     def _convert_mask(self, mask):
         """
@@ -60,6 +153,7 @@ class CSCMatrix(COOMatrix):
         ndarray
             The converted mask array.
         """
-        coo = self._coo
-        csc = csc_matrix((mask, (coo.row, coo.col)), shape=coo.shape)
-        return csc.data
+        # a CSC entry is masked if any of the COO entries summed into it are masked
+        csc_mask = np.zeros(self._matrix.data.size, dtype=bool)
+        csc_mask[self._coo2csc[mask]] = True
+        return csc_mask
@@ -17,8 +17,35 @@ from openmdao.matrices.coo_matrix import COOMatrix
 class DenseMatrix(COOMatrix):
     """
     Dense global matrix.
+
+    Attributes
+    ----------
+    _coo2flat : ndarray of int
+        Index into the flattened dense matrix for each entry in the COO data array.
+    _has_dups : bool
+        True if more than one COO entry maps to the same dense matrix entry.
+    _flat_idxs : dict
+        Flattened dense matrix indices for each sub-jacobian.  Only used when there are no
+        duplicate entries.
+    _dirty : bool
+        If True, the dense matrix must be recomputed from the COO data in _post_update.
     """
 
+    def __init__(self, comm):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the top-level system that owns the <Jacobian>.
+        """
+        super(DenseMatrix, self).__init__(comm)
+        self._coo2flat = None
+        self._has_dups = False
+        self._flat_idxs = {}
+        self._dirty = False
+
     def _build(self, num_rows, num_cols, in_ranges, out_ranges):
         """
         Allocate the matrix.
@@ -35,7 +62,37 @@ class DenseMatrix(COOMatrix):
             Maps output var name to row range.
         """
         super(DenseMatrix, self)._build(num_rows, num_cols, in_ranges, out_ranges)
-        self._coo = self._matrix
+        coo = self._coo
+
+        self._coo2flat = coo2flat = coo.row * num_cols + coo.col
+        self._matrix = np.zeros((num_rows, num_cols))
+
+        self._has_dups = np.unique(coo2flat).size < coo2flat.size
+        if self._has_dups:
+            self._flat_idxs = {}
+        else:
+            self._flat_idxs = {key: coo2flat[idxs] for key, (idxs, _, _) in
+                               iteritems(self._metadata)}
+        self._dirty = False
+
+    def _update_submat(self, key, jac):
+        """
+        Update the values of a sub-jacobian.
+
+        Parameters
+        ----------
+        key : (str, str)
+            the global output and input variable names.
+        jac : ndarray or scipy.sparse or tuple
+            the sub-jacobian, the same format with which it was declared.
+        """
+        super(DenseMatrix, self)._update_submat(key, jac)
+
+        if self._has_dups:
+            # overlapping entries have to be summed, so defer to _post_update
+            self._dirty = True
+        else:
+            self._matrix.ravel()[self._flat_idxs[key]] = self._coo.data[self._metadata[key][0]]
 
     def _prod(self, in_vec, mode, ranges, mask=None):
         """
@@ -116,15 +173,30 @@ class DenseMatrix(COOMatrix):
 
             return mask
 
-    def _pre_update(self):
+    def _post_update(self):
         """
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
-        self._matrix = self._coo
+        if self._dirty:
+            # this will add any repeated entries together
+            self._matrix[:] = self._coo.toarray()
+            self._dirty = False
 
-    def _post_update(self):
+    def set_complex_step_mode(self, active):
         """
-        Do anything that needs to be done at the end of AssembledJacobian._update.
+        Turn on or off complex stepping mode.
+
+        When turned on, the value in each subjac is cast as complex, and when turned
+        off, they are returned to real values.
+
+        Parameters
+        ----------
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
         """
-        # this will add any repeated entries together
-        self._matrix = self._coo.toarray()
+        super(DenseMatrix, self).set_complex_step_mode(active)
+
+        if active:
+            self._matrix = self._matrix.astype(np.complex)
+        else:
+            self._matrix = self._matrix.real.copy()
@@ -1,13 +1,16 @@
 """Management of iteration stack for recording."""
+from threading import local
+
 from openmdao.utils.mpi import MPI
 
 
-class _RecIteration(object):
+class _RecIteration(local):
     """
     A class that encapsulates the iteration stack.
 
     Some tests needed to reset the stack and this avoids issues
-    with data left over from other tests.
+    with data left over from other tests.  The stack is kept separately for each thread, so
+    that subsystems run in a thread pool record their own iteration coordinates.
 
     Attributes
     ----------
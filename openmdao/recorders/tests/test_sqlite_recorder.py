@@ -1835,7 +1835,8 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(set(metadata.keys()), {'name', 'type', 'options', 'opt_settings'})
         self.assertEqual(metadata['name'], 'DOEDriver')
         self.assertEqual(metadata['type'], 'doe')
-        self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
+        self.assertEqual(metadata['options'], {'debug_print': [], 'memoize_totals': False,
+                                               'generator': 'UniformGenerator',
                                                'run_parallel': False, 'procs_per_model': 1})
 
         # Optimization
@@ -1854,7 +1855,8 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(set(metadata.keys()), {'name', 'type', 'options', 'opt_settings'})
         self.assertEqual(metadata['name'], 'ScipyOptimizeDriver')
         self.assertEqual(metadata['type'], 'optimization')
-        self.assertEqual(metadata['options'], {"debug_print": [], "optimizer": "SLSQP",
+        self.assertEqual(metadata['options'], {"debug_print": [], "memoize_totals": False,
+                                               "optimizer": "SLSQP",
                                                "tol": 1e-03, "maxiter": 200, "disp": True,
                                                "dynamic_simul_derivs": False, "dynamic_derivs_repeats": 3})
         self.assertEqual(metadata['opt_settings'], {"ACC": 1e-06})
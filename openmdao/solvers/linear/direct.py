@@ -4,18 +4,29 @@ from __future__ import division, print_function
 
 import sys
 import warnings
+from collections import deque
+from multiprocessing.pool import ThreadPool
 from six import reraise, PY2
 from six.moves import range
 
 import numpy as np
 import scipy.linalg
 import scipy.sparse.linalg
+from scipy.sparse import csc_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+try:
+    from scipy.sparse.csgraph import maximum_bipartite_matching
+except ImportError:
+    maximum_bipartite_matching = None
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.matrices.coo_matrix import COOMatrix
 from openmdao.matrices.csr_matrix import CSRMatrix
 from openmdao.matrices.csc_matrix import CSCMatrix
 from openmdao.matrices.dense_matrix import DenseMatrix
+from openmdao.matrices.bsr_matrix import BSRMatrix
+from openmdao.utils.coloring import _compute_coloring
 
 
 def format_singular_error(err, system, mtx):
@@ -152,13 +163,210 @@ def format_nan_error(system, matrix):
     return msg.format(system.msginfo, ', '.join(varname))
 
 
+def _same_matrix(mtx1, mtx2):
+    """
+    Return True if the two matrices have identical structure and values.
+
+    Parameters
+    ----------
+    mtx1 : ndarray or spmatrix or None
+        First matrix.
+    mtx2 : ndarray or spmatrix
+        Second matrix.
+
+    Returns
+    -------
+    bool
+        True if the matrices are identical.
+    """
+    if mtx1 is None or type(mtx1) is not type(mtx2) or mtx1.shape != mtx2.shape or \
+            mtx1.dtype != mtx2.dtype:
+        return False
+
+    if scipy.sparse.issparse(mtx1):
+        return (np.array_equal(mtx1.indptr, mtx2.indptr) and
+                np.array_equal(mtx1.indices, mtx2.indices) and
+                np.array_equal(mtx1.data, mtx2.data))
+
+    return np.array_equal(mtx1, mtx2)
+
+
+def _get_diag_blocks(matrix, min_size=1):
+    """
+    Find the diagonal blocks of a permutation of the matrix to block lower triangular form.
+
+    Rows and columns are permuted so that the diagonal has no structural zeros, and the strongly
+    connected components of the resulting graph are ordered so that each block only depends on
+    the blocks before it.  Consecutive blocks are merged until they have at least min_size rows.
+
+    Parameters
+    ----------
+    matrix : ndarray or spmatrix
+        Square matrix.
+    min_size : int
+        Minimum number of rows in a block.
+
+    Returns
+    -------
+    list of (ndarray, ndarray) or None
+        Rows and matching columns of each diagonal block, in solution order, or None if the
+        matrix does not have more than one block.
+    """
+    if maximum_bipartite_matching is None:
+        return None
+
+    pattern = csr_matrix(matrix)
+    pattern = csr_matrix((np.ones(pattern.indices.size), pattern.indices, pattern.indptr),
+                         shape=pattern.shape)
+
+    # column matched to each row, so that the matched entries form a zero-free diagonal
+    match = maximum_bipartite_matching(pattern, perm_type='column')
+    if np.any(match < 0):  # structurally singular
+        return None
+
+    nblocks, labels = connected_components(pattern[:, match], directed=True, connection='strong')
+    if nblocks == 1:
+        return None
+
+    # block of row i depends on block of col j if entry (i, match[j]) is nonzero
+    coo = pattern[:, match].tocoo()
+    row_labels = labels[coo.row]
+    col_labels = labels[coo.col]
+    mask = row_labels != col_labels
+    edges = np.unique(row_labels[mask] * nblocks + col_labels[mask])
+    dependents = [[] for i in range(nblocks)]
+    num_deps = np.zeros(nblocks, dtype=int)
+    for dependent, dep in zip(edges // nblocks, edges % nblocks):
+        dependents[dep].append(dependent)
+        num_deps[dependent] += 1
+
+    # topological sort of the blocks
+    order = []
+    ready = deque(np.nonzero(num_deps == 0)[0])
+    while ready:
+        block = ready.popleft()
+        order.append(block)
+        for dependent in dependents[block]:
+            num_deps[dependent] -= 1
+            if num_deps[dependent] == 0:
+                ready.append(dependent)
+
+    sorted_rows = np.argsort(labels, kind='mergesort')
+    starts = np.searchsorted(labels[sorted_rows], np.arange(nblocks + 1))
+
+    blocks = []
+    current = []
+    size = 0
+    for block in order:
+        current.append(sorted_rows[starts[block]:starts[block + 1]])
+        size += current[-1].size
+        if size >= min_size:
+            blocks.append(np.concatenate(current))
+            current = []
+            size = 0
+
+    if current:
+        if blocks:
+            current.insert(0, blocks.pop())
+        blocks.append(np.concatenate(current))
+
+    if len(blocks) == 1:
+        return None
+
+    return [(rows, match[rows]) for rows in blocks]
+
+
+def _factor_block(matrix):
+    """
+    Return the LU factorization of a diagonal block.
+
+    Parameters
+    ----------
+    matrix : ndarray or spmatrix
+        The diagonal block.
+
+    Returns
+    -------
+    tuple or SuperLU
+        The dense or sparse LU factorization.
+    """
+    if isinstance(matrix, np.ndarray):
+        return scipy.linalg.lu_factor(matrix)
+    return scipy.sparse.linalg.splu(matrix)
+
+
+def _get_int_matrix(mtx, ranges):
+    """
+    Return the part of an assembled internal matrix seen by the solving system.
+
+    Parameters
+    ----------
+    mtx : <Matrix>
+        The internal matrix of the assembled jacobian.
+    ranges : (int, int, int, int)
+        Min row, max row, min col, max col for the solving system.
+
+    Returns
+    -------
+    ndarray or spmatrix
+        The matrix to be factorized.
+    """
+    matrix = mtx._matrix
+    if isinstance(mtx, BSRMatrix):
+        # scipy's sparse LU only accepts CSC, and BSR matrices can't be sliced.
+        matrix = matrix.tocsc()
+    return matrix[ranges[0]:ranges[1], ranges[0]:ranges[1]]
+
+
 class DirectSolver(LinearSolver):
     """
     LinearSolver that uses linalg.solve or LU factor/solve.
+
+    Attributes
+    ----------
+    _mtx_coloring : Coloring or None
+        Column coloring of the matrix built by matrix-vector-product when color_mtx is True.
+    _mtx_color_info : list of (ndarray, ndarray, ndarray)
+        Columns, nonzero rows and CSC data indices for each color of _mtx_coloring.
+    _mtx_struct : (ndarray, ndarray) or None
+        CSC row indices and column pointers of the nonzero entries of the colored matrix.
+    _factor_mtx : ndarray or spmatrix or None
+        Copy of the matrix built by matrix-vector-product that the current factorization was
+        computed from, kept only when compare_mtx is True.
+    _factor_version : (Matrix, int) or None
+        Assembled matrix and its data version when the current factorization was computed.
+    factor_hits : int
+        Number of times the existing factorization was reused because the matrix was unchanged.
+    factor_misses : int
+        Number of times the matrix was factorized.
+    _blocks : list or None
+        For each diagonal block of the block triangular form of the matrix, its rows, columns,
+        LU factorization and the off-diagonal entries coupling it to the other blocks.  None
+        if the matrix was factorized as a whole.
     """
 
     SOLVER = 'LN: Direct'
 
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super(DirectSolver, self).__init__(**kwargs)
+
+        self._mtx_coloring = None
+        self._mtx_color_info = []
+        self._mtx_struct = None
+        self._factor_mtx = None
+        self._factor_version = None
+        self.factor_hits = 0
+        self.factor_misses = 0
+        self._blocks = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -167,6 +375,30 @@ class DirectSolver(LinearSolver):
 
         self.options.declare('err_on_singular', types=bool, default=True,
                              desc="Raise an error if LU decomposition is singular.")
+        self.options.declare('color_mtx', types=bool, default=False,
+                             desc="When assemble_jac is False, compute the sparsity of the matrix "
+                             "once and build it using column coloring, needing only one "
+                             "matrix-vector-product per color.")
+        self.options.declare('sparse_mtx', types=bool, default=False,
+                             desc="When assemble_jac is False, build a CSC matrix and factorize it "
+                             "with a sparse LU instead of a dense one.")
+        self.options.declare('reuse_factorization', types=bool, default=True,
+                             desc="If True, skip the factorization when the assembled jacobian "
+                             "has not been updated since it was last factorized.")
+        self.options.declare('compare_mtx', types=bool, default=False,
+                             desc="When assemble_jac is False, keep a copy of the matrix built "
+                             "by matrix-vector-product and skip the factorization when the next "
+                             "one is identical to it.")
+        self.options.declare('factor_blocks', types=bool, default=False,
+                             desc="If True, permute the matrix to block triangular form and "
+                             "factorize each diagonal block separately.")
+        self.options.declare('min_block_size', types=int, default=32, lower=1,
+                             desc="Smallest diagonal block factorized separately when "
+                             "factor_blocks is True. Smaller blocks are merged with their "
+                             "neighbors.")
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc="Number of threads used to factorize the diagonal blocks when "
+                             "factor_blocks is True.")
 
         # this solver does not iterate
         self.options.undeclare("maxiter")
@@ -190,13 +422,36 @@ class DirectSolver(LinearSolver):
         """
         return False
 
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super(DirectSolver, self)._setup_solvers(system, depth)
+
+        # sizes may have changed, so the coloring and factorization have to be recomputed
+        self._mtx_coloring = None
+        self._mtx_color_info = []
+        self._mtx_struct = None
+        self._factor_mtx = None
+        self._factor_version = None
+        self.factor_hits = 0
+        self.factor_misses = 0
+        self._blocks = None
+
     def _build_mtx(self):
         """
         Assemble a Jacobian matrix by matrix-vector-product with columns of identity.
 
         Returns
         -------
-        ndarray
+        ndarray or csc_matrix
             Jacobian matrix.
         """
         system = self._system
@@ -207,9 +462,41 @@ class DirectSolver(LinearSolver):
         b_data = bvec._data.copy()
         x_data = xvec._data.copy()
 
-        nmtx = x_data.size
+        if not self.options['color_mtx']:
+            mtx = self._build_full_mtx()
+        elif self._mtx_coloring is None:
+            mtx = self._compute_mtx_coloring()
+        else:
+            mtx = self._build_colored_mtx()
+
+        # Restore the backed-up vectors
+        bvec._data[:] = b_data
+        xvec._data[:] = x_data
+
+        if self.options['sparse_mtx']:
+            if not isinstance(mtx, csc_matrix):
+                mtx = csc_matrix(mtx)
+        elif isinstance(mtx, csc_matrix):
+            mtx = mtx.toarray()
+
+        return mtx
+
+    def _build_full_mtx(self):
+        """
+        Assemble a dense Jacobian matrix by running each column of identity through apply_linear.
+
+        Returns
+        -------
+        ndarray
+            Jacobian matrix.
+        """
+        system = self._system
+        bvec = system._vectors['residual']['linear']
+        xvec = system._vectors['output']['linear']
+
+        nmtx = xvec._data.size
         eye = np.eye(nmtx)
-        mtx = np.empty((nmtx, nmtx), dtype=b_data.dtype)
+        mtx = np.empty((nmtx, nmtx), dtype=bvec._data.dtype)
         scope_out, scope_in = system._get_scope()
         vnames = ['linear']
 
@@ -225,9 +512,94 @@ class DirectSolver(LinearSolver):
             # put new value in out_vec
             mtx[:, i] = bvec._data
 
-        # Restore the backed-up vectors
-        bvec._data[:] = b_data
-        xvec._data[:] = x_data
+        return mtx
+
+    def _build_colored_mtx(self):
+        """
+        Assemble a CSC Jacobian matrix using one apply_linear per color of the column coloring.
+
+        Returns
+        -------
+        csc_matrix
+            Jacobian matrix.
+        """
+        system = self._system
+        bvec = system._vectors['residual']['linear']
+        xvec = system._vectors['output']['linear']
+        indices, indptr = self._mtx_struct
+        nmtx = xvec._data.size
+
+        data = np.zeros(indices.size, dtype=bvec._data.dtype)
+        scope_out, scope_in = system._get_scope()
+        vnames = ['linear']
+
+        # columns of the same color have no nonzero rows in common, so a single product with
+        # the sum of their identity columns gives all of their entries.
+        for cols, rows, data_idxs in self._mtx_color_info:
+            xvec._data[:] = 0.0
+            xvec._data[cols] = 1.0
+
+            system._apply_linear(self._assembled_jac, vnames, self._rel_systems, 'fwd',
+                                 scope_out, scope_in)
+
+            data[data_idxs] = bvec._data[rows]
+
+        return csc_matrix((data, indices, indptr), shape=(nmtx, nmtx))
+
+    def _compute_mtx_coloring(self):
+        """
+        Compute the sparsity and column coloring of the matrix built by matrix-vector-product.
+
+        The sparsity is taken from a build with randomized sub-jacobians combined with a build
+        using the actual values, which is returned.
+
+        Returns
+        -------
+        ndarray
+            Jacobian matrix.
+        """
+        system = self._system
+
+        randomized = []
+        for subsys in system.system_iter(recurse=True, include_self=True):
+            if subsys.matrix_free:
+                raise RuntimeError("%s: option 'color_mtx' does not currently work with matrix "
+                                   "free components." % self.msginfo)
+
+            jac = subsys._assembled_jac
+            if jac is None:
+                jac = subsys._jacobian
+            if jac is not None and not jac._randomize:
+                jac._randomize = True
+                randomized.append(jac)
+
+        try:
+            sparsity = self._build_full_mtx() != 0.0
+        finally:
+            for jac in randomized:
+                jac._randomize = False
+
+        # assembled jacobians below us only see randomized values when they are updated, so
+        # include the nonzeros of the actual matrix too.
+        mtx = self._build_full_mtx()
+        sparsity |= mtx != 0.0
+
+        coloring = _compute_coloring(sparsity, 'fwd')
+
+        struct = csc_matrix(sparsity)
+        indptr = struct.indptr
+        col2rows = coloring.get_row_col_map('fwd')
+
+        info = []
+        for cols in coloring.color_iter('fwd'):
+            cols = np.asarray(cols, dtype=int)
+            rows = np.concatenate([col2rows[c] for c in cols])
+            data_idxs = np.concatenate([np.arange(indptr[c], indptr[c + 1]) for c in cols])
+            info.append((cols, rows, data_idxs))
+
+        self._mtx_coloring = coloring
+        self._mtx_color_info = info
+        self._mtx_struct = (struct.indices, indptr)
 
         return mtx
 
@@ -241,7 +613,19 @@ class DirectSolver(LinearSolver):
 
             mtx = self._assembled_jac._int_mtx
             ranges = self._assembled_jac._view_ranges[system.pathname]
-            matrix = mtx._matrix[ranges[0]:ranges[1], ranges[0]:ranges[1]]
+
+            version = (mtx, mtx._data_version)
+            if self._factor_version is not None and self.options['reuse_factorization'] and \
+                    self._factor_version[0] is mtx and self._factor_version[1] == version[1]:
+                self.factor_hits += 1
+                return
+
+            matrix = _get_int_matrix(mtx, ranges)
+
+            if isinstance(mtx, (DenseMatrix, CSRMatrix, CSCMatrix, BSRMatrix)) and \
+                    self._factor_blocks(matrix):
+                self._save_factored_matrix(matrix, version)
+                return
 
             # Perform dense or sparse lu factorization.
             if isinstance(mtx, DenseMatrix):
@@ -258,7 +642,7 @@ class DirectSolver(LinearSolver):
                     except ValueError as err:
                         raise RuntimeError(format_nan_error(system, matrix))
 
-            elif isinstance(mtx, (CSRMatrix, CSCMatrix)):
+            elif isinstance(mtx, (CSRMatrix, CSCMatrix, BSRMatrix)):
                 try:
                     self._lu = scipy.sparse.linalg.splu(matrix)
                 except RuntimeError as err:
@@ -276,24 +660,182 @@ class DirectSolver(LinearSolver):
                 raise RuntimeError("Direct solver not implemented for matrix type %s"
                                    " in %s." % (type(mtx), system.msginfo))
 
+            self._save_factored_matrix(matrix, version)
+
         else:
             mtx = self._build_mtx()
+            if self._reuse_factorization(mtx):
+                return
 
-            # During LU decomposition, detect singularities and warn user.
-            with warnings.catch_warnings():
-
-                if self.options['err_on_singular']:
-                    warnings.simplefilter('error', RuntimeWarning)
+            if self._factor_blocks(mtx):
+                self._save_factored_matrix(mtx)
+                return
 
+            if self.options['sparse_mtx']:
                 try:
-                    self._lup = scipy.linalg.lu_factor(mtx)
+                    self._lu = scipy.sparse.linalg.splu(mtx)
+                except RuntimeError as err:
+                    if 'exactly singular' in str(err):
+                        raise RuntimeError(format_singular_csc_error(system, mtx))
+                    else:
+                        reraise(*sys.exc_info())
 
-                except RuntimeWarning as err:
-                    raise RuntimeError(format_singular_error(err, system, mtx))
+            else:
+                # During LU decomposition, detect singularities and warn user.
+                with warnings.catch_warnings():
 
-                # NaN in matrix.
-                except ValueError as err:
-                    raise RuntimeError(format_nan_error(system, mtx))
+                    if self.options['err_on_singular']:
+                        warnings.simplefilter('error', RuntimeWarning)
+
+                    try:
+                        self._lup = scipy.linalg.lu_factor(mtx)
+
+                    except RuntimeWarning as err:
+                        raise RuntimeError(format_singular_error(err, system, mtx))
+
+                    # NaN in matrix.
+                    except ValueError as err:
+                        raise RuntimeError(format_nan_error(system, mtx))
+
+            self._save_factored_matrix(mtx)
+
+    def _factor_blocks(self, matrix):
+        """
+        Factorize the diagonal blocks of the block triangular form of the matrix.
+
+        Parameters
+        ----------
+        matrix : ndarray or spmatrix
+            The matrix to be factorized.
+
+        Returns
+        -------
+        bool
+            True if the matrix was factorized by blocks.  False if the factor_blocks option is
+            off, the matrix has a single block, or a block is singular, in which case the whole
+            matrix must be factorized.
+        """
+        self._blocks = None
+
+        if not self.options['factor_blocks']:
+            return False
+
+        blocks = _get_diag_blocks(matrix, self.options['min_block_size'])
+        if blocks is None:
+            return False
+
+        if isinstance(matrix, np.ndarray):
+            diags = [matrix[np.ix_(rows, cols)] for rows, cols in blocks]
+            by_row = csr_matrix(matrix)
+            by_col = by_row.tocsc()
+        else:
+            by_row = matrix.tocsr()
+            by_col = matrix.tocsc()
+            diags = [by_row[rows][:, cols].tocsc() for rows, cols in blocks]
+
+        nthreads = min(self.options['num_threads'], len(blocks))
+
+        # singular blocks are left to the factorization of the whole matrix, which reports them
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            try:
+                if nthreads > 1:
+                    pool = ThreadPool(nthreads)
+                    try:
+                        lus = pool.map(_factor_block, diags)
+                    finally:
+                        pool.close()
+                        pool.join()
+                else:
+                    lus = [_factor_block(diag) for diag in diags]
+            except (RuntimeWarning, RuntimeError, ValueError):
+                return False
+
+        self._blocks = []
+        for (rows, cols), lu in zip(blocks, lus):
+            # entries in the block rows outside of the block columns, and vice versa
+            sub = by_row[rows]
+            ext_cols = np.setdiff1d(sub.indices, cols)
+            sub_t = by_col[:, cols]
+            ext_rows = np.setdiff1d(sub_t.indices, rows)
+
+            self._blocks.append((rows, cols, lu, ext_cols, sub[:, ext_cols].tocsr(),
+                                 ext_rows, sub_t[ext_rows].T.tocsr()))
+
+        return True
+
+    def _block_solve(self, b, trans):
+        """
+        Solve using the factorized diagonal blocks by block forward or back substitution.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right hand side.
+        trans : bool
+            If True, solve the transposed system.
+
+        Returns
+        -------
+        ndarray
+            Solution.
+        """
+        x = np.zeros(b.size, dtype=b.dtype)
+
+        if trans:
+            for rows, cols, lu, _, _, ext_rows, off_t in reversed(self._blocks):
+                rhs = b[cols] - off_t.dot(x[ext_rows])
+                if isinstance(lu, tuple):
+                    x[rows] = scipy.linalg.lu_solve(lu, rhs, trans=1)
+                else:
+                    x[rows] = lu.solve(rhs, 'T')
+        else:
+            for rows, cols, lu, ext_cols, off, _, _ in self._blocks:
+                rhs = b[rows] - off.dot(x[ext_cols])
+                if isinstance(lu, tuple):
+                    x[cols] = scipy.linalg.lu_solve(lu, rhs)
+                else:
+                    x[cols] = lu.solve(rhs)
+
+        return x
+
+    def _reuse_factorization(self, matrix):
+        """
+        Return True if the current factorization was computed from an identical matrix.
+
+        Parameters
+        ----------
+        matrix : ndarray or spmatrix
+            The matrix built by matrix-vector-product.
+
+        Returns
+        -------
+        bool
+            True if the existing factorization can be reused.
+        """
+        if self.options['compare_mtx'] and _same_matrix(self._factor_mtx, matrix):
+            self.factor_hits += 1
+            return True
+
+        return False
+
+    def _save_factored_matrix(self, matrix, version=None):
+        """
+        Record what the current factorization was computed from.
+
+        Parameters
+        ----------
+        matrix : ndarray or spmatrix
+            The matrix that was factorized.
+        version : (Matrix, int) or None
+            Assembled matrix and its data version, if the matrix came from an assembled jacobian.
+        """
+        self.factor_misses += 1
+        if version is not None:
+            if self.options['reuse_factorization']:
+                self._factor_version = version
+        elif self.options['compare_mtx']:
+            self._factor_mtx = matrix.copy()
 
     def _inverse(self):
         """
@@ -313,7 +855,7 @@ class DirectSolver(LinearSolver):
 
             mtx = self._assembled_jac._int_mtx
             ranges = self._assembled_jac._view_ranges[system.pathname]
-            matrix = mtx._matrix[ranges[0]:ranges[1], ranges[0]:ranges[1]]
+            matrix = _get_int_matrix(mtx, ranges)
 
             # Dense and Sparse matrices have their own inverse method.
             if isinstance(mtx, DenseMatrix):
@@ -330,7 +872,7 @@ class DirectSolver(LinearSolver):
                     except ValueError as err:
                         raise RuntimeError(format_nan_error(system, matrix))
 
-            elif isinstance(mtx, (CSRMatrix, CSCMatrix)):
+            elif isinstance(mtx, (CSRMatrix, CSCMatrix, BSRMatrix)):
                 try:
                     inv_jac = scipy.sparse.linalg.inv(matrix)
                 except RuntimeError as err:
@@ -344,6 +886,8 @@ class DirectSolver(LinearSolver):
 
         else:
             mtx = self._build_mtx()
+            if self.options['sparse_mtx']:
+                mtx = mtx.toarray()
 
             # During inversion detect singularities and warn user.
             with warnings.catch_warnings():
@@ -405,7 +949,9 @@ class DirectSolver(LinearSolver):
             # AssembledJacobians are unscaled.
             if self._assembled_jac is not None:
                 with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
-                    if isinstance(self._assembled_jac._int_mtx, DenseMatrix):
+                    if self._blocks is not None:
+                        x_vec._data[:] = self._block_solve(b_vec._data, mode == 'rev')
+                    elif isinstance(self._assembled_jac._int_mtx, DenseMatrix):
                         x_vec._data[:] = scipy.linalg.lu_solve(self._lup, b_vec._data,
                                                                trans=trans_lu)
                     else:
@@ -413,4 +959,9 @@ class DirectSolver(LinearSolver):
 
             # MVP-generated jacobians are scaled.
             else:
-                x_vec._data[:] = scipy.linalg.lu_solve(self._lup, b_vec._data, trans=trans_lu)
+                if self._blocks is not None:
+                    x_vec._data[:] = self._block_solve(b_vec._data, mode == 'rev')
+                elif self.options['sparse_mtx']:
+                    x_vec._data[:] = self._lu.solve(b_vec._data, trans_splu)
+                else:
+                    x_vec._data[:] = scipy.linalg.lu_solve(self._lup, b_vec._data, trans=trans_lu)
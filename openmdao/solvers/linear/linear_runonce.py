@@ -31,8 +31,13 @@ class LinearRunOnce(LinearBlockGS):
 
         self._update_rhs_vecs()
 
-        # Single iteration of GS
-        self._single_iteration()
+        num_threads = self._parallel_num_threads()
+
+        # Single iteration of Jacobi over the subsystems of a threaded parallel group, else of GS
+        if num_threads > 1:
+            self._jacobi_iter(num_threads)
+        else:
+            self._single_iteration()
 
     def _declare_options(self):
         """
@@ -347,6 +347,8 @@ class PETScKrylov(LinearSolver):
         maxiter = options['maxiter']
         atol = options['atol']
         rtol = options['rtol']
+        if self._forcing_term is not None:
+            rtol = self._forcing_term
 
         for vec_name in vec_names:
 
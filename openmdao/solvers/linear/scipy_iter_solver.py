@@ -3,12 +3,15 @@
 from __future__ import division, print_function
 
 from distutils.version import LooseVersion
+from six import itervalues
 import numpy as np
 import scipy
-from scipy.sparse.linalg import LinearOperator, gmres
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import LinearOperator, gmres, gcrotmk, spilu
 
 from openmdao.solvers.solver import LinearSolver
-from openmdao.utils.general_utils import warn_deprecation
+from openmdao.solvers.linear.direct import _get_int_matrix
+from openmdao.utils.general_utils import warn_deprecation, ContainsAll
 
 _SOLVER_TYPES = {
     # 'bicg': bicg,
@@ -16,6 +19,7 @@ _SOLVER_TYPES = {
     # 'cg': cg,
     # 'cgs': cgs,
     'gmres': gmres,
+    'gcrotmk': gcrotmk,
 }
 
 
@@ -27,6 +31,16 @@ class ScipyKrylov(LinearSolver):
     ----------
     precon : Solver
         Preconditioner for linear solve. Default is None for no preconditioner.
+    _recycle_spaces : dict
+        For each (vec_name, mode), the relevant systems of the last solve and the list of (c, u)
+        vector pairs spanning the subspace recycled by gcrotmk.
+    _rhs : ndarray or None
+        Right hand side of the current solve, used to compute residuals for printing.
+    _ilu : SuperLU or None
+        Incomplete LU factorization of the assembled matrix, used as preconditioner when the
+        use_ilu option is True.
+    _ilu_version : (Matrix, int) or None
+        Assembled matrix and its data version when _ilu was computed.
     """
 
     SOLVER = 'LN: SCIPY'
@@ -45,6 +59,11 @@ class ScipyKrylov(LinearSolver):
         # initialize preconditioner to None
         self.precon = None
 
+        self._recycle_spaces = {}
+        self._rhs = None
+        self._ilu = None
+        self._ilu_version = None
+
     def _assembled_jac_solver_iter(self):
         """
         Return a generator of linear solvers using assembled jacs.
@@ -67,7 +86,31 @@ class ScipyKrylov(LinearSolver):
         self.options.declare('restart', default=20, types=int,
                              desc='Number of iterations between restarts. Larger values increase '
                                   'iteration cost, but may be necessary for convergence. This '
-                                  'option applies only to gmres.')
+                                  'option applies to gmres and gcrotmk.')
+
+        self.options.declare('recycle', default=True, types=bool,
+                             desc='If True, keep the subspace recycled by gcrotmk between solves, '
+                                  'including solves for other right hand sides and after the '
+                                  'model is linearized again. This option applies only to '
+                                  'gcrotmk.')
+
+        self.options.declare('recycle_size', default=None, types=int, allow_none=True,
+                             desc='Number of vectors in the subspace recycled by gcrotmk. The '
+                                  'default is the value of the restart option. This option '
+                                  'applies only to gcrotmk.')
+
+        self.options.declare('use_ilu', default=False, types=bool,
+                             desc='If True, precondition with an incomplete LU factorization of '
+                                  'the assembled jacobian, computed once per linearization. '
+                                  'Requires assemble_jac to be True.')
+
+        self.options.declare('ilu_fill_factor', default=10.0, lower=1.0,
+                             desc='Upper bound on the ratio of nonzeros in the incomplete LU '
+                                  'factors to nonzeros in the assembled jacobian.')
+
+        self.options.declare('ilu_drop_tol', default=1e-4, lower=0.0,
+                             desc='Entries of the incomplete LU factors smaller than this, '
+                                  'relative to their column, are dropped.')
 
         # changing the default maxiter from the base class
         self.options['maxiter'] = 1000
@@ -89,6 +132,9 @@ class ScipyKrylov(LinearSolver):
         if self.precon is not None:
             self.precon._setup_solvers(self._system, self._depth + 1)
 
+        self._ilu = None
+        self._ilu_version = None
+
     def _set_solver_print(self, level=2, type_='all'):
         """
         Control printing for solvers and subsolvers in the model.
@@ -126,6 +172,95 @@ class ScipyKrylov(LinearSolver):
         if self.precon is not None:
             self.precon._linearize()
 
+        if self.options['use_ilu']:
+            self._linearize_ilu()
+
+        # The recycled vectors remain valid, but their images under the new operator must be
+        # recomputed.
+        for _, cu in itervalues(self._recycle_spaces):
+            cu[:] = [(None, u) for _, u in cu]
+
+    def _linearize_ilu(self):
+        """
+        Compute the incomplete LU factorization of the assembled jacobian.
+        """
+        if self.precon is not None:
+            raise RuntimeError("{}: Option 'use_ilu' cannot be used with a user "
+                               "supplied preconditioner.".format(self.msginfo))
+        if self._assembled_jac is None:
+            raise RuntimeError("{}: Option 'use_ilu' requires the 'assemble_jac' option "
+                               "to be True.".format(self.msginfo))
+
+        mtx = self._assembled_jac._int_mtx
+        if self._ilu_version is not None and self._ilu_version[0] is mtx and \
+                self._ilu_version[1] == mtx._data_version:
+            return
+
+        ranges = self._assembled_jac._view_ranges[self._system.pathname]
+        matrix = csc_matrix(_get_int_matrix(mtx, ranges))
+
+        self._ilu = spilu(matrix, drop_tol=self.options['ilu_drop_tol'],
+                          fill_factor=self.options['ilu_fill_factor'])
+        self._ilu_version = (mtx, mtx._data_version)
+
+    def _apply_ilu(self, in_arr):
+        """
+        Apply the incomplete LU preconditioner.
+
+        Parameters
+        ----------
+        in_arr : ndarray
+            Incoming vector, or block of vectors.
+
+        Returns
+        -------
+        ndarray
+            The preconditioned vector, or block of vectors.
+        """
+        # rev mode solves with the transpose of the jacobian.
+        return self._ilu.solve(in_arr, trans='N' if self._mode == 'fwd' else 'T')
+
+    def _set_complex_step_mode(self, active):
+        """
+        Turn on or off complex stepping mode.
+
+        Parameters
+        ----------
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
+        """
+        super(ScipyKrylov, self)._set_complex_step_mode(active)
+        self._recycle_spaces = {}
+
+    def _get_recycle_space(self, vec_name):
+        """
+        Return the list of vector pairs recycled by gcrotmk for the current solve.
+
+        Parameters
+        ----------
+        vec_name : str
+            Name of the right-hand-side vector.
+
+        Returns
+        -------
+        list
+            List of (c, u) vector pairs, modified in place by gcrotmk.
+        """
+        key = (vec_name, self._mode)
+        try:
+            space = self._recycle_spaces[key]
+        except KeyError:
+            space = self._recycle_spaces[key] = [self._rel_systems, []]
+
+        # A different set of relevant systems changes the operator.
+        old, new = space[0], self._rel_systems
+        if old is not new and old != new and \
+                not (isinstance(old, ContainsAll) and isinstance(new, ContainsAll)):
+            space[0] = new
+            space[1][:] = [(None, u) for _, u in space[1]]
+
+        return space[1]
+
     def _mat_vec(self, in_arr):
         """
         Compute matrix-vector product.
@@ -180,6 +315,21 @@ class ScipyKrylov(LinearSolver):
         self._mpi_print(self._iter_count, norm, norm / self._norm0)
         self._iter_count += 1
 
+    def _monitor_solution(self, x):
+        """
+        Print the residual and iteration number (callback from SciPy solvers passing the solution).
+
+        Parameters
+        ----------
+        x : ndarray
+            the current solution vector.
+        """
+        # Only pay for the extra product when the residual is printed.
+        if self.options['iprint'] == 2:
+            self._monitor(self._rhs - self._mat_vec(x))
+        else:
+            self._iter_count += 1
+
     def solve(self, vec_names, mode, rel_systems=None):
         """
         Run the solver.
@@ -199,40 +349,95 @@ class ScipyKrylov(LinearSolver):
 
         system = self._system
         solver = _SOLVER_TYPES[self.options['solver']]
-        if solver is gmres:
+        if solver is gmres or solver is gcrotmk:
             restart = self.options['restart']
 
         maxiter = self.options['maxiter']
         atol = self.options['atol']
+        if self._forcing_term is not None:
+            # the 'legacy' tolerance is relative to the norm of the right hand side, which is
+            # what an inexact Newton forcing term expects.
+            atol = self._forcing_term
 
         fail = False
 
+        if self._mode == 'fwd':
+            x_vecs = system._vectors['output']
+            b_vecs = system._vectors['residual']
+        else:  # rev
+            x_vecs = system._vectors['residual']
+            b_vecs = system._vectors['output']
+
+        # The preconditioner may write into the vectors of every vec_name, so grab all of the
+        # right hand sides before any of them are solved.
+        rhs = {vec_name: b_vecs[vec_name]._data.copy() for vec_name in self._vec_names}
+
         for vec_name in self._vec_names:
 
             self._vec_name = vec_name
 
-            if self._mode == 'fwd':
-                x_vec = system._vectors['output'][vec_name]
-                b_vec = system._vectors['residual'][vec_name]
-            else:  # rev
-                x_vec = system._vectors['residual'][vec_name]
-                b_vec = system._vectors['output'][vec_name]
+            x_vec = x_vecs[vec_name]
+            b_vec = b_vecs[vec_name]
+            b_vec._data[:] = rhs[vec_name]
 
             x_vec_combined = x_vec._data
+
+            # Multiple columns from vectorized derivatives are solved together with block GMRES,
+            # which applies the preconditioner to the whole block of columns.
+            if x_vec_combined.ndim > 1:
+                if solver is not gmres:
+                    raise RuntimeError("{}: Vectorized derivatives can only be solved with the "
+                                       "'gmres' solver, but '{}' was "
+                                       "selected.".format(self.msginfo, self.options['solver']))
+                self._iter_count = 0
+                x, info = self._block_gmres(rhs[vec_name], x_vec_combined.copy(),
+                                            self.options['restart'], maxiter, atol)
+                fail |= (info != 0)
+                x_vec._data[:] = x
+                continue
+
             size = x_vec_combined.size
-            linop = LinearOperator((size, size), dtype=float,
-                                   matvec=self._mat_vec)
+            if solver is gcrotmk:
+                # gcrotmk keeps the products, so they can't be views of the residual vector.
+                linop = LinearOperator((size, size), dtype=float,
+                                       matvec=lambda arr: self._mat_vec(arr).copy())
+            else:
+                linop = LinearOperator((size, size), dtype=float,
+                                       matvec=self._mat_vec)
 
             # Support a preconditioner
             if self.precon:
                 M = LinearOperator((size, size),
                                    matvec=self._apply_precon,
                                    dtype=float)
+            elif self._ilu is not None:
+                M = LinearOperator((size, size),
+                                   matvec=self._apply_ilu,
+                                   dtype=float)
             else:
                 M = None
 
             self._iter_count = 0
-            if solver is gmres:
+            if solver is gcrotmk:
+                self._rhs = b_vec._data.copy()
+                if self.options['recycle']:
+                    CU = self._get_recycle_space(vec_name)
+                else:
+                    CU = None
+
+                # unlike gmres, gcrotmk has no 'legacy' atol, so the absolute tolerance is given
+                # as a floor under the tolerance relative to the right hand side.
+                kwargs = {}
+                if LooseVersion(scipy.__version__) >= LooseVersion("1.1"):
+                    kwargs['atol'] = self.options['atol']
+
+                x, info = solver(linop, self._rhs.copy(), M=M, m=restart,
+                                 k=self.options['recycle_size'], CU=CU,
+                                 x0=x_vec_combined, maxiter=maxiter, tol=atol,
+                                 callback=self._monitor_solution, **kwargs)
+                self._rhs = None
+
+            elif solver is gmres:
                 if LooseVersion(scipy.__version__) < LooseVersion("1.1"):
                     x, info = solver(linop, b_vec._data.copy(), M=M, restart=restart,
                                      x0=x_vec_combined, maxiter=maxiter, tol=atol,
@@ -249,6 +454,96 @@ class ScipyKrylov(LinearSolver):
             fail |= (info != 0)
             x_vec._data[:] = x
 
+    def _block_gmres(self, b, x, restart, maxiter, tol):
+        """
+        Solve for all columns of a multi-column right hand side with restarted block GMRES.
+
+        Each iteration applies the linear operator and the preconditioner to a whole block of
+        columns at once. Convergence is reached when the norm of the residual is below tol times
+        the norm of the right hand side.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right hand side, with one column per vectorized derivative.
+        x : ndarray
+            Initial guess, same shape as b.
+        restart : int
+            Number of block iterations between restarts.
+        maxiter : int
+            Maximum total number of block iterations.
+        tol : float
+            Tolerance relative to the norm of b.
+
+        Returns
+        -------
+        ndarray
+            Solution.
+        int
+            0 if converged, otherwise the number of iterations performed.
+        """
+        n, ncol = b.shape
+        dtype = np.result_type(b, x)
+        if self.precon:
+            precon = self._apply_precon
+        elif self._ilu is not None:
+            precon = self._apply_ilu
+        else:
+            def precon(arr):
+                return arr
+
+        b_norm = np.linalg.norm(b)
+        if b_norm == 0.0:
+            return np.zeros((n, ncol), dtype=dtype), 0
+        target = tol * b_norm
+
+        total = 0
+        while True:
+            r = b - self._mat_vec(x)
+            res_norm = np.linalg.norm(r)
+            if total == 0:
+                self._monitor(res_norm)
+            if res_norm <= target:
+                return x, 0
+            if total >= maxiter:
+                return x, total
+
+            # block Arnoldi process, preconditioned on the right
+            q, s = np.linalg.qr(r)
+            basis = [q]
+            z_blocks = []
+            hess = np.zeros(((restart + 1) * ncol, restart * ncol), dtype=dtype)
+            e1_s = np.zeros(((restart + 1) * ncol, ncol), dtype=dtype)
+            e1_s[:ncol] = s
+
+            for j in range(restart):
+                z = precon(basis[j])
+                z_blocks.append(z)
+                w = self._mat_vec(z).copy()
+
+                cols = slice(j * ncol, (j + 1) * ncol)
+                for i, v in enumerate(basis):
+                    h = v.conj().T.dot(w)
+                    hess[i * ncol:(i + 1) * ncol, cols] = h
+                    w -= v.dot(h)
+
+                q, h = np.linalg.qr(w)
+                hess[(j + 1) * ncol:(j + 2) * ncol, cols] = h
+                basis.append(q)
+
+                nrows = (j + 2) * ncol
+                y = np.linalg.lstsq(hess[:nrows, :(j + 1) * ncol], e1_s[:nrows], rcond=-1)[0]
+                res_norm = np.linalg.norm(e1_s[:nrows] - hess[:nrows, :(j + 1) * ncol].dot(y))
+
+                total += 1
+                self._monitor(res_norm)
+
+                if res_norm <= target or total >= maxiter:
+                    break
+
+            for i, z in enumerate(z_blocks):
+                x = x + z.dot(y[i * ncol:(i + 1) * ncol])
+
     def _apply_precon(self, in_vec):
         """
         Apply preconditioner.
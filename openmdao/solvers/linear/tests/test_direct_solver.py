@@ -6,8 +6,10 @@ import unittest
 from six import assertRaisesRegex, iteritems
 
 import numpy as np
+from scipy import sparse
 
 import openmdao.api as om
+from openmdao.solvers.linear.direct import _same_matrix, _get_diag_blocks
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
 from openmdao.test_suite.components.expl_comp_simple import TestExplCompSimpleJacVec
 from openmdao.test_suite.components.sellar import SellarDerivatives
@@ -626,6 +628,396 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
             prob.run_model()
 
 
+class TestColoredMatrixBuild(unittest.TestCase):
+
+    def _build_model(self, n=10, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('x', np.arange(1, n + 1, dtype=float))
+
+        model.add_subsystem('c1', om.ExecComp('y = 2.0 * x + sin(z)', x=np.ones(n), y=np.ones(n),
+                                              z=np.ones(n), has_diag_partials=True))
+        model.add_subsystem('c2', om.ExecComp('y = 0.5 * x', x=np.ones(n), y=np.ones(n),
+                                              has_diag_partials=True))
+        model.add_subsystem('c3', om.ExecComp('y = sum(x) + x', x=np.ones(n), y=np.ones(n)))
+
+        model.connect('ivc.x', 'c1.x')
+        model.connect('c1.y', 'c2.x')
+        model.connect('c2.y', 'c1.z')
+        model.connect('c2.y', 'c3.x')
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=20, rtol=1e-12)
+        model.linear_solver = om.DirectSolver(assemble_jac=False, **options)
+
+        prob.set_solver_print(level=0)
+        return prob
+
+    def _check(self, mode, **options):
+        expected = self._build_model()
+        expected.setup(mode=mode)
+        expected.run_model()
+        J_expected = expected.compute_totals(of=['c3.y'], wrt=['ivc.x'])
+
+        prob = self._build_model(color_mtx=True, **options)
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        assert_rel_error(self, prob['c3.y'], expected['c3.y'], 1e-10)
+        J = prob.compute_totals(of=['c3.y'], wrt=['ivc.x'])
+        assert_rel_error(self, J['c3.y', 'ivc.x'], J_expected['c3.y', 'ivc.x'], 1e-10)
+
+        return prob
+
+    def test_fwd(self):
+        self._check('fwd')
+
+    def test_rev(self):
+        self._check('rev')
+
+    def test_sparse_fwd(self):
+        self._check('fwd', sparse_mtx=True)
+
+    def test_sparse_rev(self):
+        self._check('rev', sparse_mtx=True)
+
+    def test_sparse_no_coloring(self):
+        prob = self._check('fwd', sparse_mtx=True)
+        J_colored = prob.compute_totals(of=['c3.y'], wrt=['ivc.x'])
+
+        solver = prob.model.linear_solver
+        solver.options['color_mtx'] = False
+        prob.run_model()
+        J = prob.compute_totals(of=['c3.y'], wrt=['ivc.x'])
+
+        self.assertTrue(sparse.isspmatrix_csc(solver._build_mtx()))
+        assert_rel_error(self, J['c3.y', 'ivc.x'], J_colored['c3.y', 'ivc.x'], 1e-10)
+
+    def test_num_products(self):
+        prob = self._build_model()
+        prob.setup(mode='fwd')
+        prob.final_setup()
+
+        model = prob.model
+        solver = model.linear_solver
+        solver.options['color_mtx'] = True
+
+        calls = []
+        apply_linear = model._apply_linear
+
+        def counting_apply_linear(*args, **kwargs):
+            calls.append(1)
+            return apply_linear(*args, **kwargs)
+
+        model._apply_linear = counting_apply_linear
+
+        # the first linearization determines the sparsity, using two full builds
+        solver._linearize()
+        nmtx = model._vectors['output']['linear']._data.size
+        self.assertEqual(len(calls), 2 * nmtx)
+
+        ncolors = len(list(solver._mtx_coloring.color_iter('fwd')))
+        self.assertLess(ncolors, nmtx)
+
+        del calls[:]
+        solver._linearize()
+        self.assertEqual(len(calls), ncolors)
+
+    def test_assembled_subgroup(self):
+        n = 5
+        prob = om.Problem()
+        model = prob.model
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('x', np.arange(1, n + 1, dtype=float))
+
+        sub = model.add_subsystem('sub', om.Group())
+        sub.add_subsystem('c1', om.ExecComp('y = 2.0 * x', x=np.ones(n), y=np.ones(n),
+                                            has_diag_partials=True))
+        sub.add_subsystem('c2', om.ExecComp('y = 3.0 * x ** 2', x=np.ones(n), y=np.ones(n),
+                                            has_diag_partials=True))
+        sub.connect('c1.y', 'c2.x')
+        sub.linear_solver = om.DirectSolver()
+
+        model.connect('ivc.x', 'sub.c1.x')
+        model.linear_solver = om.DirectSolver(assemble_jac=False, color_mtx=True)
+
+        prob.setup(mode='rev')
+        prob.run_model()
+
+        J = prob.compute_totals(of=['sub.c2.y'], wrt=['ivc.x'])
+        x = np.arange(1, n + 1, dtype=float)
+        assert_rel_error(self, J['sub.c2.y', 'ivc.x'], np.diag(24.0 * x), 1e-10)
+
+    def test_matrix_free_error(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('x_param', om.IndepVarComp('length', 3.0),
+                            promotes=['length'])
+        model.add_subsystem('mycomp', TestExplCompSimpleJacVec(),
+                            promotes=['length', 'width', 'area'])
+
+        model.linear_solver = om.DirectSolver(assemble_jac=False, color_mtx=True)
+        prob.setup(check=False, mode='fwd')
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_totals(of=['area'], wrt=['length'])
+
+        self.assertEqual(str(cm.exception),
+                         "DirectSolver in Group (<model>): option 'color_mtx' does not "
+                         "currently work with matrix free components.")
+
+
+class TestFactorizationReuse(unittest.TestCase):
+
+    def _build_model(self, linear=True, jac_type='csc', **options):
+        n = 5
+        prob = om.Problem()
+        model = prob.model
+        model.options['assembled_jac_type'] = jac_type
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('x', np.arange(1, n + 1, dtype=float))
+
+        expr = 'y = 2.0 * x - 0.5 * z' if linear else 'y = 2.0 * x - 0.5 * sin(z)'
+        model.add_subsystem('c1', om.ExecComp(expr, x=np.ones(n), y=np.ones(n), z=np.ones(n),
+                                              has_diag_partials=True))
+        model.add_subsystem('c2', om.ExecComp('y = 0.5 * x', x=np.ones(n), y=np.ones(n),
+                                              has_diag_partials=True))
+        model.connect('ivc.x', 'c1.x')
+        model.connect('c1.y', 'c2.x')
+        model.connect('c2.y', 'c1.z')
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, rtol=1e-12)
+        model.linear_solver = om.DirectSolver(**options)
+
+        prob.set_solver_print(level=0)
+        prob.setup()
+        return prob
+
+    def _check_reuse(self, **options):
+        prob = self._build_model(**options)
+        solver = prob.model.linear_solver
+
+        prob.run_model()
+        J1 = prob.compute_totals(of=['c2.y'], wrt=['ivc.x'])
+        prob.run_model()
+        J2 = prob.compute_totals(of=['c2.y'], wrt=['ivc.x'])
+
+        # all partials are constant, so only the first linearization needs a factorization
+        self.assertEqual(solver.factor_misses, 1)
+        self.assertGreater(solver.factor_hits, 1)
+
+        expected = np.eye(5) * 0.8
+        assert_rel_error(self, J1['c2.y', 'ivc.x'], expected, 1e-12)
+        assert_rel_error(self, J2['c2.y', 'ivc.x'], expected, 1e-12)
+
+    def _check_reuse_assembled(self, jac_type):
+        prob = self._build_model(jac_type=jac_type)
+        solver = prob.model.linear_solver
+
+        prob.run_model()
+        prob.compute_totals(of=['c2.y'], wrt=['ivc.x'])
+        misses = solver.factor_misses
+
+        # the assembled jacobian has not been updated, so the factorization is reused
+        solver._linearize()
+        self.assertEqual(solver.factor_misses, misses)
+        self.assertEqual(solver.factor_hits, 1)
+
+        # only the version of the assembled matrix is kept, never a copy of it
+        self.assertIsNone(solver._factor_mtx)
+
+        # updating the assembled jacobian requires a new factorization
+        J = prob.compute_totals(of=['c2.y'], wrt=['ivc.x'])
+        self.assertEqual(solver.factor_misses, misses + 1)
+        assert_rel_error(self, J['c2.y', 'ivc.x'], np.eye(5) * 0.8, 1e-12)
+
+    def test_reuse_csc(self):
+        self._check_reuse_assembled('csc')
+
+    def test_reuse_dense(self):
+        self._check_reuse_assembled('dense')
+
+    def test_reuse_mvp(self):
+        self._check_reuse(assemble_jac=False, compare_mtx=True)
+
+    def test_reuse_mvp_sparse(self):
+        self._check_reuse(assemble_jac=False, sparse_mtx=True, compare_mtx=True)
+
+    def test_mvp_no_compare(self):
+        prob = self._build_model(assemble_jac=False)
+        solver = prob.model.linear_solver
+
+        prob.run_model()
+        prob.compute_totals(of=['c2.y'], wrt=['ivc.x'])
+
+        # without compare_mtx, the built matrix is neither copied nor compared
+        self.assertIsNone(solver._factor_mtx)
+        self.assertEqual(solver.factor_hits, 0)
+        self.assertGreater(solver.factor_misses, 1)
+
+    def test_nonlinear(self):
+        prob = self._build_model(linear=False, assemble_jac=False, compare_mtx=True)
+        solver = prob.model.linear_solver
+
+        prob.run_model()
+        misses = solver.factor_misses
+        self.assertGreater(misses, 1)
+
+        # linearizing again at the same point reuses the factorization
+        prob.compute_totals(of=['c2.y'], wrt=['ivc.x'])
+        misses = solver.factor_misses
+        prob.compute_totals(of=['c2.y'], wrt=['ivc.x'])
+        self.assertEqual(solver.factor_misses, misses)
+
+        prob['ivc.x'] = 3.0
+        prob.run_model()
+        self.assertGreater(solver.factor_misses, misses)
+
+    def test_no_reuse(self):
+        prob = self._build_model(reuse_factorization=False)
+        solver = prob.model.linear_solver
+
+        prob.run_model()
+        prob.compute_totals(of=['c2.y'], wrt=['ivc.x'])
+
+        self.assertEqual(solver.factor_hits, 0)
+        self.assertGreater(solver.factor_misses, 1)
+
+    def test_same_matrix(self):
+        mtx = np.arange(9, dtype=float).reshape((3, 3))
+
+        self.assertTrue(_same_matrix(mtx, mtx.copy()))
+        self.assertFalse(_same_matrix(None, mtx))
+        self.assertFalse(_same_matrix(mtx, mtx.astype(complex)))
+        self.assertFalse(_same_matrix(mtx, sparse.csc_matrix(mtx)))
+
+        changed = mtx.copy()
+        changed[1, 2] += 1e-12
+        self.assertFalse(_same_matrix(mtx, changed))
+
+        csc = sparse.csc_matrix(mtx)
+        self.assertTrue(_same_matrix(csc, csc.copy()))
+        changed = csc.copy()
+        changed.data[0] = -1.0
+        self.assertFalse(_same_matrix(csc, changed))
+
+
+class TestBlockFactorization(unittest.TestCase):
+
+    def test_get_diag_blocks(self):
+        np.random.seed(11)
+        sizes = [5, 10, 3, 12]
+        starts = np.cumsum([0] + sizes)
+        n = starts[-1]
+
+        # block lower triangular matrix with scrambled rows and columns
+        mtx = np.zeros((n, n))
+        for i, size in enumerate(sizes):
+            mtx[starts[i]:starts[i + 1], starts[i]:starts[i + 1]] = np.random.random((size, size))
+            mtx[starts[i]:starts[i + 1], :starts[i]] = \
+                np.random.random((size, starts[i])) > 0.8
+        mtx = mtx[np.random.permutation(n)][:, np.random.permutation(n)]
+
+        for matrix in (mtx, sparse.csc_matrix(mtx)):
+            blocks = _get_diag_blocks(matrix)
+            self.assertEqual([rows.size for rows, _ in blocks], sizes)
+
+            # permuted matrix must be block lower triangular
+            rows = np.concatenate([r for r, _ in blocks])
+            cols = np.concatenate([c for _, c in blocks])
+            permuted = mtx[rows][:, cols]
+            for i in range(len(sizes)):
+                self.assertFalse(np.any(permuted[starts[i]:starts[i + 1], starts[i + 1]:]))
+
+        # small blocks are merged
+        blocks = _get_diag_blocks(mtx, min_size=6)
+        self.assertEqual([rows.size for rows, _ in blocks], [15, 15])
+        self.assertIsNone(_get_diag_blocks(mtx, min_size=20))
+
+        # a single strongly connected block
+        self.assertIsNone(_get_diag_blocks(np.random.random((4, 4))))
+
+    def _build_model(self, npts=3, n=8, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('x', np.arange(1, n + 1, dtype=float))
+
+        total = om.ExecComp('y = ' + ' + '.join('x%d' % i for i in range(npts)),
+                            y=np.ones(n), **dict(('x%d' % i, np.ones(n)) for i in range(npts)))
+
+        # independent coupled points that feed a single output
+        for i in range(npts):
+            pt = model.add_subsystem('pt%d' % i, om.Group())
+            pt.add_subsystem('c1', om.ExecComp('y = %d.0 * x - 0.5 * sin(z)' % (i + 2),
+                                               x=np.ones(n), y=np.ones(n), z=np.ones(n),
+                                               has_diag_partials=True))
+            pt.add_subsystem('c2', om.ExecComp('y = 0.5 * x + 0.01 * sum(x)', x=np.ones(n),
+                                               y=np.ones(n)))
+            pt.connect('c1.y', 'c2.x')
+            pt.connect('c2.y', 'c1.z')
+            model.connect('ivc.x', 'pt%d.c1.x' % i)
+            model.connect('pt%d.c2.y' % i, 'total.x%d' % i)
+
+        model.add_subsystem('total', total)
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, rtol=1e-12)
+        model.linear_solver = om.DirectSolver(**options)
+
+        prob.set_solver_print(level=0)
+        return prob
+
+    def _check(self, mode, **options):
+        expected = self._build_model(**options)
+        expected.setup(mode=mode)
+        expected.run_model()
+        J_expected = expected.compute_totals(of=['total.y'], wrt=['ivc.x'])
+
+        prob = self._build_model(factor_blocks=True, min_block_size=8, **options)
+        prob.setup(mode=mode)
+        prob.run_model()
+        J = prob.compute_totals(of=['total.y'], wrt=['ivc.x'])
+
+        # one block per point plus the blocks for the independent and summed outputs
+        self.assertEqual(len(prob.model.linear_solver._blocks), 5)
+
+        assert_rel_error(self, prob['total.y'], expected['total.y'], 1e-10)
+        assert_rel_error(self, J['total.y', 'ivc.x'], J_expected['total.y', 'ivc.x'], 1e-10)
+
+    def test_csc(self):
+        self._check('fwd')
+        self._check('rev')
+
+    def test_dense(self):
+        self._check('fwd', assemble_jac=False)
+        self._check('rev', assemble_jac=False)
+
+    def test_sparse_mvp(self):
+        self._check('fwd', assemble_jac=False, sparse_mtx=True)
+        self._check('rev', assemble_jac=False, sparse_mtx=True)
+
+    def test_threads(self):
+        self._check('fwd', num_threads=3)
+        self._check('rev', num_threads=3)
+
+    def test_singular_block(self):
+        prob = self._build_model(factor_blocks=True, min_block_size=4)
+        prob.model.add_subsystem('singular', SingularComp())
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception),
+                         "Singular entry found in Group (<model>) for row associated with "
+                         "state/residual 'singular.y'.")
+
+
 class TestDirectSolverFeature(unittest.TestCase):
 
     def test_specify_solver(self):
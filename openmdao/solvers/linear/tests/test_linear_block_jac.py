@@ -33,6 +33,36 @@ class TestLinearBlockJacSolver(LinearSolverTests.LinearSolverTestCase):
             self.assertEqual(str(context.exception),
                              "Linear solver 'LN: LNBJ' doesn't support assembled jacobians.")
 
+    def test_threads(self):
+        for mode in ('fwd', 'rev'):
+            totals = []
+            for linear_solver in (om.DirectSolver(),
+                                  om.LinearBlockJac(num_threads=2, maxiter=100,
+                                                    atol=1e-14, rtol=1e-14)):
+                prob = om.Problem()
+                model = prob.model
+
+                model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+                model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])),
+                                    promotes=['z'])
+                model.add_subsystem('d1', SellarDis1withDerivatives(),
+                                    promotes=['x', 'z', 'y1', 'y2'])
+                model.add_subsystem('d2', SellarDis2withDerivatives(),
+                                    promotes=['z', 'y1', 'y2'])
+
+                model.nonlinear_solver = om.NonlinearBlockGS()
+                model.linear_solver = linear_solver
+
+                prob.setup(mode=mode)
+                prob.set_solver_print(level=0)
+                prob.run_model()
+
+                totals.append(prob.compute_totals(of=['y1', 'y2'], wrt=['x', 'z']))
+                prob.cleanup()
+
+            for key in totals[0]:
+                assert_rel_error(self, totals[1][key], totals[0][key], 1e-10)
+
 
 class TestBJacSolverFeature(unittest.TestCase):
 
@@ -210,6 +210,180 @@ class TestScipyKrylov(LinearSolverTests.LinearSolverTestCase):
         self.assertTrue(icount2 < icount1)
 
 
+class LinearSystemComp(om.ImplicitComponent):
+    """Solves A x = b for a fixed matrix with eigenvalues spread over [1, n]."""
+
+    def initialize(self):
+        self.options.declare('size', types=int, default=60)
+
+    def setup(self):
+        n = self.options['size']
+
+        np.random.seed(7)
+        self.A = np.diag(np.arange(1.0, n + 1.0)) + 0.1 * np.random.random((n, n))
+
+        self.add_input('b', np.ones(n))
+        self.add_output('x', np.ones(n))
+
+        self.declare_partials('x', 'x', val=self.A)
+        self.declare_partials('x', 'b', rows=np.arange(n), cols=np.arange(n), val=-1.0)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['x'] = self.A.dot(outputs['x']) - inputs['b']
+
+    def solve_nonlinear(self, inputs, outputs):
+        outputs['x'] = np.linalg.solve(self.A, inputs['b'])
+
+
+class TestScipyKrylovRecycling(unittest.TestCase):
+
+    def _build_model(self, linear_solver=None, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p', om.IndepVarComp('b', np.ones(60)))
+        model.add_subsystem('comp', LinearSystemComp())
+        model.connect('p.b', 'comp.b')
+
+        if linear_solver is None:
+            linear_solver = om.ScipyKrylov(solver='gcrotmk', restart=5, **options)
+        model.linear_solver = linear_solver
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        model.run_linearize()
+
+        return prob
+
+    def _solve(self, prob, rhs, mode):
+        model = prob.model
+        d_inputs, d_outputs, d_residuals = model.get_linear_vectors()
+
+        if mode == 'fwd':
+            b_vec, x_vec = d_residuals, d_outputs
+        else:
+            b_vec, x_vec = d_outputs, d_residuals
+
+        b_vec._data[:] = rhs
+        x_vec.set_const(0.0)
+        model.run_solve_linear(['linear'], mode)
+
+        return x_vec._data.copy(), model.linear_solver._iter_count
+
+    def test_solve(self):
+        prob = self._build_model()
+        ref = self._build_model(linear_solver=om.DirectSolver())
+
+        np.random.seed(11)
+        rhs = np.random.random(120)
+
+        for mode in ('fwd', 'rev'):
+            x, _ = self._solve(prob, rhs, mode)
+            assert_rel_error(self, x, self._solve(ref, rhs, mode)[0], 1e-9)
+
+    def test_recycling(self):
+        # recycling pays off when later right hand sides are close to earlier ones
+        np.random.seed(11)
+        b0 = np.random.random(120)
+        rhs = [b0, b0 + 1e-3 * np.random.random(120), b0]
+
+        iter_counts = {}
+        for recycle in (False, True):
+            prob = self._build_model(recycle=recycle, recycle_size=20)
+            iter_counts[recycle] = [self._solve(prob, b, 'fwd')[1] for b in rhs]
+
+            # A new linearization keeps the recycled subspace.
+            prob.model.run_linearize()
+            iter_counts[recycle].append(self._solve(prob, rhs[0], 'fwd')[1])
+
+            if recycle:
+                self.assertEqual(len(prob.model.linear_solver._recycle_spaces), 1)
+            else:
+                self.assertEqual(prob.model.linear_solver._recycle_spaces, {})
+
+        # the first solve has nothing to recycle
+        self.assertEqual(iter_counts[True][0], iter_counts[False][0])
+
+        for i in range(1, 4):
+            self.assertLess(iter_counts[True][i], iter_counts[False][i])
+
+
+class TestScipyKrylovILU(unittest.TestCase):
+
+    def _build_model(self, linear_solver=None, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p', om.IndepVarComp('b', np.ones(60)))
+        model.add_subsystem('comp', LinearSystemComp())
+        model.connect('p.b', 'comp.b')
+
+        if linear_solver is None:
+            linear_solver = om.ScipyKrylov(**options)
+        model.linear_solver = linear_solver
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob
+
+    def _solve(self, prob, rhs, mode):
+        model = prob.model
+        model.run_linearize()
+        d_inputs, d_outputs, d_residuals = model.get_linear_vectors()
+
+        if mode == 'fwd':
+            b_vec, x_vec = d_residuals, d_outputs
+        else:
+            b_vec, x_vec = d_outputs, d_residuals
+
+        b_vec._data[:] = rhs
+        x_vec.set_const(0.0)
+        model.run_solve_linear(['linear'], mode)
+
+        return x_vec._data.copy(), model.linear_solver._iter_count
+
+    def test_solve(self):
+        np.random.seed(11)
+        rhs = np.random.random(120)
+
+        ref = self._build_model(linear_solver=om.DirectSolver())
+
+        iter_counts = {}
+        for use_ilu in (False, True):
+            prob = self._build_model(use_ilu=use_ilu, assemble_jac=True, ilu_drop_tol=1e-2)
+
+            for mode in ('fwd', 'rev'):
+                x, iter_counts[use_ilu, mode] = self._solve(prob, rhs, mode)
+                assert_rel_error(self, x, self._solve(ref, rhs, mode)[0], 1e-9)
+
+        self.assertLess(iter_counts[True, 'fwd'], iter_counts[False, 'fwd'])
+
+    def test_factor_once_per_linearization(self):
+        prob = self._build_model(use_ilu=True, assemble_jac=True)
+        solver = prob.model.linear_solver
+
+        prob.compute_totals(of=['comp.x'], wrt=['p.b'])
+        ilu = solver._ilu
+        self.assertIsNotNone(ilu)
+
+        # same jacobian, so the factorization is kept
+        prob.compute_totals(of=['comp.x'], wrt=['p.b'])
+        self.assertIs(solver._ilu, ilu)
+
+    def test_requires_assembled_jac(self):
+        prob = self._build_model(use_ilu=True)
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_totals(of=['comp.x'], wrt=['p.b'])
+
+        self.assertEqual(str(cm.exception),
+                         "ScipyKrylov in Group (<model>): Option 'use_ilu' requires the "
+                         "'assemble_jac' option to be True.")
+
+
 class TestScipyKrylovFeature(unittest.TestCase):
 
     def test_feature_simple(self):
@@ -4,6 +4,7 @@ Define the BroydenSolver class.
 Based on implementation in Scipy via OpenMDAO 0.8x with improvements based on NPSS solver.
 """
 from __future__ import print_function
+from collections import deque
 import warnings
 from six.moves import range
 
@@ -56,6 +57,12 @@ class BroydenSolver(NonlinearSolver):
         Number of consecutive iterations that failed to converge to the tol definied in options.
     _full_inverse : bool
         When True, Broyden considers the whole vector rather than a list of states.
+    _lm_linear_jac0 : bool
+        When True, the initial Jacobian of the limited-memory representation is applied with a
+        linear solve, otherwise it is identity scaled by alpha.
+    _lm_updates : deque of (ndarray, ndarray)
+        Low-rank corrections to the initial inverse Jacobian, used when the limited_memory
+        option is True.
     _recompute_jacobian : bool
         Flag that becomes True when Broyden detects it needs to recompute the inverse Jacobian.
     """
@@ -95,6 +102,9 @@ class BroydenSolver(NonlinearSolver):
         # This gets set to True if the user doesn't declare any states.
         self._full_inverse = False
 
+        self._lm_linear_jac0 = False
+        self._lm_updates = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -123,8 +133,15 @@ class BroydenSolver(NonlinearSolver):
         self.options.declare('max_converge_failures', default=3,
                              desc="The number of convergence failures before regenerating the "
                                   "Jacobian.")
+        self.options.declare('limited_memory', types=bool, default=False,
+                             desc="When True, store the inverse Jacobian as a list of low-rank "
+                                  "updates instead of a dense matrix, and apply a computed initial "
+                                  "Jacobian with linear solves instead of inverting it.")
         self.options.declare('max_jacobians', default=10,
                              desc="Maximum number of jacobians to compute.")
+        self.options.declare('memory_depth', types=int, default=10, lower=1,
+                             desc="Number of Broyden updates kept when limited_memory is True. "
+                                  "The oldest update is discarded when a new one is added.")
         self.options.declare('state_vars', [], desc="List of the state-variable/residuals that "
                                                     "are to be solved here.")
         self.options.declare('update_broyden', default=True,
@@ -184,17 +201,20 @@ class BroydenSolver(NonlinearSolver):
             n = len(outputs._data)
 
         self.n = n
-        self.Gm = np.empty((n, n))
+        self.Gm = None if self.options['limited_memory'] else np.empty((n, n))
         self.xm = np.empty((n, ))
         self.fxm = np.empty((n, ))
         self.delta_xm = None
         self.delta_fxm = None
+        self._lm_linear_jac0 = False
+        self._lm_updates = deque(maxlen=self.options['memory_depth'])
 
         if self._full_inverse:
 
-            # Can only use DirectSolver here.
+            # Can only use DirectSolver here, unless the Jacobian is never inverted.
             from openmdao.solvers.linear.direct import DirectSolver
-            if not isinstance(self.linear_solver, DirectSolver):
+            if not self.options['limited_memory'] and \
+                    not isinstance(self.linear_solver, DirectSolver):
                 msg = "{}: Linear solver must be DirectSolver when solving the full model."
                 raise ValueError(msg.format(self.msginfo, ', '.join(bad_names)))
 
@@ -285,16 +305,24 @@ class BroydenSolver(NonlinearSolver):
             self._err_cache['inputs'] = self._system._inputs._copy_views()
             self._err_cache['outputs'] = self._system._outputs._copy_views()
 
+        # The limited_memory option may have been turned off after setup.
+        if self.Gm is None and not self.options['limited_memory']:
+            self.Gm = np.empty((self.n, self.n), dtype=self.xm.dtype)
+
         # Convert local storage if we are under complex step.
         if system.under_complex_step:
             if np.iscomplex(self.xm[0]):
-                self.Gm = self.Gm.astype(np.complex)
+                if self.Gm is not None:
+                    self.Gm = self.Gm.astype(np.complex)
                 self.xm = self.xm.astype(np.complex)
                 self.fxm = self.fxm.astype(np.complex)
         elif np.iscomplex(self.xm[0]):
-            self.Gm = self.Gm.real
+            if self.Gm is not None:
+                self.Gm = self.Gm.real
             self.xm = self.xm.real
             self.fxm = self.fxm.real
+            self._lm_updates = deque([(u.real, v.real) for u, v in self._lm_updates],
+                                     maxlen=self._lm_updates.maxlen)
 
         self._converge_failures = 0
         self._computed_jacobians = 0
@@ -350,10 +378,14 @@ class BroydenSolver(NonlinearSolver):
         Perform the operations in the iteration loop.
         """
         system = self._system
-        Gm = self._update_inverse_jacobian()
         fxm = self.fxm
 
-        delta_xm = -Gm.dot(fxm)
+        if self.options['limited_memory']:
+            self._update_limited_memory_jacobian()
+            delta_xm = -self._apply_limited_memory_jacobian(fxm)
+        else:
+            self.Gm = self._update_inverse_jacobian()
+            delta_xm = -self.Gm.dot(fxm)
 
         if self.linesearch:
             self._solver_info.append_subsolver()
@@ -406,7 +438,6 @@ class BroydenSolver(NonlinearSolver):
         self.delta_fxm = delta_fxm
         self.fxm = fxm
         self.xm = xm
-        self.Gm = Gm
 
     def _update_inverse_jacobian(self):
         """
@@ -445,6 +476,119 @@ class BroydenSolver(NonlinearSolver):
 
         return Gm
 
+    def _update_limited_memory_jacobian(self):
+        """
+        Update the limited-memory inverse Jacobian for a new Broyden iteration.
+        """
+        updates = self._lm_updates
+
+        # Add the Broyden Update approximation as a rank one correction.
+        if self.options['update_broyden'] and not self._recompute_jacobian:
+            dfxm = self.delta_fxm
+            fact = np.linalg.norm(dfxm)
+
+            if fact > self.options['atol']:
+                u = self.delta_xm - self._apply_limited_memory_jacobian(dfxm)
+                u *= 1.0 / fact**2
+                updates.append((u, dfxm.copy()))
+
+        # Linearize the model so that the initial Jacobian can be applied with linear solves.
+        elif self.options['compute_jacobian']:
+            self._linearize_limited_memory_jacobian()
+            self._lm_linear_jac0 = True
+            updates.clear()
+
+            self._computed_jacobians += 1
+
+        # Start from identity scaled by alpha.
+        else:
+            self._lm_linear_jac0 = False
+            updates.clear()
+
+    def _apply_limited_memory_jacobian(self, vec):
+        """
+        Return the product of the limited-memory inverse Jacobian and a vector.
+
+        Parameters
+        ----------
+        vec : ndarray
+            Vector in the space of the residuals.
+
+        Returns
+        -------
+        ndarray
+            Product of the inverse Jacobian and vec.
+        """
+        if self._lm_linear_jac0:
+            result = self._linear_solve(vec)
+        else:
+            result = -self.options['alpha'] * vec
+
+        for u, v in self._lm_updates:
+            result += u * v.dot(vec)
+
+        return result
+
+    def _linear_solve(self, vec):
+        """
+        Solve the linearized model with the given residuals for the change in the states.
+
+        Parameters
+        ----------
+        vec : ndarray
+            Vector in the space of the residuals.
+
+        Returns
+        -------
+        ndarray
+            Solution of the linear system, in the space of the states.
+        """
+        system = self._system
+        d_res = system._vectors['residual']['linear']
+        d_out = system._vectors['output']['linear']
+
+        if self._full_inverse:
+            d_res._data[:] = vec
+            self.linear_solver.solve(['linear'], 'fwd')
+            return d_out._data.copy()
+
+        states = self.options['state_vars']
+        d_res.set_const(0.0)
+        for name in states:
+            i, j = self._idx[name]
+            d_res[name] = vec[i:j]
+
+        self.linear_solver.solve(['linear'], 'fwd')
+
+        result = np.empty(vec.shape, dtype=d_out._data.dtype)
+        for name in states:
+            i, j = self._idx[name]
+            result[i:j] = d_out[name]
+
+        return result
+
+    def _linearize_limited_memory_jacobian(self):
+        """
+        Linearize the model and the linear solver used to apply the initial Jacobian.
+        """
+        system = self._system
+
+        # Disable local fd
+        approx_status = system._owns_approx_jac
+        system._owns_approx_jac = False
+
+        # Linearize model.
+        ln_solver = self.linear_solver
+        do_sub_ln = ln_solver._linearize_children()
+        my_asm_jac = ln_solver._assembled_jac
+        system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+        if my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac:
+            my_asm_jac._update(system)
+        self._linearize()
+
+        # Enable local fd
+        system._owns_approx_jac = approx_status
+
     def get_states(self):
         """
         Return a vector containing the values of the states specified in options.
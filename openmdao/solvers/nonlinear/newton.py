@@ -22,6 +22,18 @@ class NewtonSolver(NonlinearSolver):
         is the parent system's linear solver.
     linesearch : NonlinearSolver
         Line search algorithm. Default is None for no line search.
+    _jac_age : int or None
+        Number of iterations that have reused the current linearization, or None if there is no
+        linearization that can be reused.
+    _prev_norm : float or None
+        Residual norm at the start of the previous iteration of the current solve.
+    _eta : float or None
+        Forcing term used for the previous linear solve when running as an inexact Newton solver.
+    _eta_norm : float or None
+        Residual norm at the start of the previous iteration, used to compute forcing terms.
+    _lin_norm : float or None
+        Norm of the linear residual at the end of the previous linear solve, used by the 'ew1'
+        forcing term.
     """
 
     SOLVER = 'NL: Newton'
@@ -43,6 +55,12 @@ class NewtonSolver(NonlinearSolver):
         # Slot for linesearch
         self.linesearch = None
 
+        self._jac_age = None
+        self._prev_norm = None
+        self._eta = None
+        self._eta_norm = None
+        self._lin_norm = None
+
     @property
     def line_search(self):
         """
@@ -74,6 +92,35 @@ class NewtonSolver(NonlinearSolver):
         self.options.declare('cs_reconverge', types=bool, default=True,
                              desc='When True, when this driver solves under a complex step, nudge '
                              'the Solution vector by a small amount so that it reconverges.')
+        self.options.declare('max_jac_reuse', types=int, default=0, lower=0,
+                             desc='Maximum number of consecutive iterations that can reuse the '
+                             'last linearization (and factorization) instead of relinearizing. '
+                             'The default of 0 relinearizes on every iteration.')
+        self.options.declare('reuse_ratio_limit', default=0.5, lower=0.0,
+                             desc='When reusing linearizations, the system is relinearized if the '
+                             'ratio of the current residual norm to the residual norm of the '
+                             'previous iteration is above this value.')
+        self.options.declare('reuse_across_solves', types=bool, default=False,
+                             desc='When True, the last linearization of a previous solve (e.g., '
+                             'from the previous run_model) can be reused at the start of the next '
+                             'solve, subject to max_jac_reuse.')
+        self.options.declare('forcing_term', default='fixed', values=['fixed', 'ew1', 'ew2'],
+                             desc="Set to 'ew1' or 'ew2' to run as an inexact Newton solver, where "
+                             "the relative tolerance of each linear solve is adapted from the "
+                             "residual history using Eisenstat-Walker choice 1 or 2.  With "
+                             "'fixed', the linear solver uses its own tolerances.  Only iterative "
+                             "linear solvers that support it (ScipyKrylov and PETScKrylov) are "
+                             "affected.")
+        self.options.declare('eta0', default=0.3, lower=0.0, upper=1.0,
+                             desc='Forcing term for the first linear solve when forcing_term is '
+                             'not fixed.')
+        self.options.declare('eta_max', default=0.9, lower=0.0, upper=1.0,
+                             desc='Upper limit of the forcing term.')
+        self.options.declare('ew_gamma', default=1.0, lower=0.0, upper=1.0,
+                             desc="Gamma parameter of the 'ew2' forcing term.")
+        self.options.declare('ew_alpha', default=0.5 * (1.0 + np.sqrt(5.0)), lower=1.0,
+                             upper=2.0,
+                             desc="Alpha parameter of the 'ew2' forcing term.")
 
         self.supports['gradients'] = True
         self.supports['implicit_components'] = True
@@ -92,6 +139,7 @@ class NewtonSolver(NonlinearSolver):
         super(NewtonSolver, self)._setup_solvers(system, depth)
 
         self._disallow_discrete_outputs()
+        self._jac_age = None
 
         if self.linear_solver is not None:
             self.linear_solver._setup_solvers(self._system, self._depth + 1)
@@ -172,6 +220,88 @@ class NewtonSolver(NonlinearSolver):
         if self.linesearch is not None:
             self.linesearch._linearize()
 
+    def _reuse_linearization(self):
+        """
+        Return True if this iteration can reuse the last linearization.
+
+        Returns
+        -------
+        bool
+            True if the last linearization should be reused.
+        """
+        max_reuse = self.options['max_jac_reuse']
+        if max_reuse == 0:
+            return False
+
+        norm = self._iter_get_norm()
+        prev_norm = self._prev_norm
+        self._prev_norm = norm
+
+        if self._jac_age is None or self._jac_age >= max_reuse or self._system.under_complex_step:
+            return False
+
+        # relinearize if convergence has slowed down too much with the lagged jacobian
+        if prev_norm is not None and norm > self.options['reuse_ratio_limit'] * prev_norm:
+            return False
+
+        return True
+
+    def _get_forcing_term(self):
+        """
+        Compute the relative tolerance for the next linear solve using Eisenstat-Walker.
+
+        Returns
+        -------
+        float
+            The forcing term.
+        """
+        options = self.options
+        norm = self._iter_get_norm()
+        prev_eta = self._eta
+        prev_norm = self._eta_norm
+
+        if prev_eta is None or not prev_norm:
+            eta = options['eta0']
+        else:
+            if options['forcing_term'] == 'ew1':
+                eta = abs(norm - self._lin_norm) / prev_norm
+                safeguard = prev_eta ** (0.5 * (1.0 + np.sqrt(5.0)))
+            else:  # ew2
+                gamma = options['ew_gamma']
+                alpha = options['ew_alpha']
+                eta = gamma * (norm / prev_norm) ** alpha
+                safeguard = gamma * prev_eta ** alpha
+
+            # keep the forcing term from dropping too fast when convergence is still slow
+            if safeguard > 0.1:
+                eta = max(eta, safeguard)
+            eta = min(eta, options['eta_max'])
+
+        self._eta = eta
+        self._eta_norm = norm
+
+        return eta
+
+    def _get_linear_residual_norm(self):
+        """
+        Compute the norm of the residual of the Newton linear system for the current step.
+
+        Returns
+        -------
+        float
+            Norm of the linear residual.
+        """
+        system = self._system
+        d_residuals = system._vectors['residual']['linear']
+
+        # the Newton system is J * step = -R, so the linear residual is R + J * step
+        scope_out, scope_in = system._get_scope()
+        system._apply_linear(self.linear_solver._assembled_jac, ['linear'], None, 'fwd',
+                             scope_out, scope_in)
+        d_residuals += system._residuals
+
+        return d_residuals.get_norm()
+
     def _iter_initialize(self):
         """
         Perform any necessary pre-processing operations.
@@ -189,6 +319,11 @@ class NewtonSolver(NonlinearSolver):
 
         system = self._system
 
+        self._prev_norm = None
+        self._eta = self._eta_norm = self._lin_norm = None
+        if not self.options['reuse_across_solves']:
+            self._jac_age = None
+
         # When under a complex step from higher in the hierarchy, sometimes the step is too small
         # to trigger reconvergence, so nudge the outputs slightly so that we always get at least
         # one iteration of Newton.
@@ -233,12 +368,27 @@ class NewtonSolver(NonlinearSolver):
         system._vectors['residual']['linear'] *= -1.0
         my_asm_jac = self.linear_solver._assembled_jac
 
-        system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
-        if (my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac):
-            my_asm_jac._update(system)
-        self._linearize()
+        if self._reuse_linearization():
+            self._jac_age += 1
+        else:
+            system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+            if (my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac):
+                my_asm_jac._update(system)
+            self._linearize()
+            self._jac_age = 0
+
+        forcing_term = self.options['forcing_term']
+        if forcing_term == 'fixed':
+            self.linear_solver.solve(['linear'], 'fwd')
+        else:
+            self.linear_solver._forcing_term = self._get_forcing_term()
+            try:
+                self.linear_solver.solve(['linear'], 'fwd')
+            finally:
+                self.linear_solver._forcing_term = None
 
-        self.linear_solver.solve(['linear'], 'fwd')
+            if forcing_term == 'ew1':
+                self._lin_norm = self._get_linear_residual_norm()
 
         if self.linesearch:
             self.linesearch._do_subsolve = do_subsolve
@@ -269,6 +419,9 @@ class NewtonSolver(NonlinearSolver):
         active : bool
             Complex mode flag; set to True prior to commencing complex step.
         """
+        # a linearization from before the switch can't be reused
+        self._jac_age = None
+
         if self.linear_solver is not None:
             self.linear_solver._set_complex_step_mode(active)
             if self.linear_solver._assembled_jac is not None:
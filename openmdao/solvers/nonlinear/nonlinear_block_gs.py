@@ -1,5 +1,7 @@
 """Define the NonlinearBlockGS class."""
 
+from collections import deque
+
 import numpy as np
 
 from openmdao.solvers.solver import NonlinearSolver
@@ -17,6 +19,16 @@ class NonlinearBlockGS(NonlinearSolver):
     _theta_n_1 : float
         Cached relaxation factor from previous iteration. Only used if the aitken acceleration
         option is turned on.
+    _anderson_dx : deque of ndarray
+        Differences between successive outputs at the start of the most recent iterations. Only
+        used if the anderson acceleration option is turned on.
+    _anderson_df : deque of ndarray
+        Differences between successive changes in the outputs over the most recent iterations.
+        Only used if the anderson acceleration option is turned on.
+    _anderson_x_1 : ndarray or None
+        Cached outputs at the start of the previous iteration.
+    _anderson_f_1 : ndarray or None
+        Cached change in the outputs over the previous iteration.
     """
 
     SOLVER = 'NL: NLBGS'
@@ -34,6 +46,10 @@ class NonlinearBlockGS(NonlinearSolver):
 
         self._theta_n_1 = 1.0
         self._delta_outputs_n_1 = None
+        self._anderson_dx = None
+        self._anderson_df = None
+        self._anderson_x_1 = None
+        self._anderson_f_1 = None
 
     def _setup_solvers(self, system, depth):
         """
@@ -64,6 +80,13 @@ class NonlinearBlockGS(NonlinearSolver):
                              desc='lower limit for Aitken relaxation factor')
         self.options.declare('aitken_max_factor', default=1.5,
                              desc='upper limit for Aitken relaxation factor')
+        self.options.declare('use_anderson', types=bool, default=False,
+                             desc='set to True to use Anderson acceleration')
+        self.options.declare('anderson_depth', types=int, default=5, lower=1,
+                             desc='number of previous iterations used by Anderson acceleration')
+        self.options.declare('anderson_beta', default=1.0, lower=0.0,
+                             desc='mixing factor for Anderson acceleration; 1.0 means the '
+                             'accelerated update is applied without damping')
         self.options.declare('cs_reconverge', types=bool, default=True,
                              desc='When True, when this driver solves under a complex step, nudge '
                              'the Solution vector by a small amount so that it reconverges.')
@@ -82,11 +105,26 @@ class NonlinearBlockGS(NonlinearSolver):
         float
             error at the first iteration.
         """
+        if self.options['use_aitken'] and self.options['use_anderson']:
+            raise RuntimeError("{}: Options 'use_aitken' and 'use_anderson' cannot both be "
+                               "True.".format(self.msginfo))
+
+        # Execute guess_nonlinear if specified.
+        if self._system._has_guess:
+            self._system._guess_nonlinear()
+
         if self.options['use_aitken']:
             outputs = self._system._outputs
             self._delta_outputs_n_1 = outputs._data.copy()
             self._theta_n_1 = 1.
 
+        if self.options['use_anderson']:
+            depth = self.options['anderson_depth']
+            self._anderson_dx = deque(maxlen=depth)
+            self._anderson_df = deque(maxlen=depth)
+            self._anderson_x_1 = None
+            self._anderson_f_1 = None
+
         # When under a complex step from higher in the hierarchy, sometimes the step is too small
         # to trigger reconvergence, so nudge the outputs slightly so that we always get at least
         # one iteration.
@@ -103,6 +141,11 @@ class NonlinearBlockGS(NonlinearSolver):
         outputs = system._outputs
         residuals = system._residuals
         use_aitken = self.options['use_aitken']
+        use_anderson = self.options['use_anderson']
+
+        if use_anderson:
+            # store a copy of the outputs, used to compute the change in outputs later
+            outputs_k = outputs._data.copy()
 
         if use_aitken:
 
@@ -165,11 +208,51 @@ class NonlinearBlockGS(NonlinearSolver):
             # save update to use in next iteration
             delta_outputs_n_1[:] = delta_outputs_n
 
+        if use_anderson:
+            self._anderson_update(outputs_k)
+
         if not self.options['use_apply_nonlinear']:
             # Residual is the change in the outputs vector.
             with system._unscaled_context(outputs=[outputs], residuals=[residuals]):
                 residuals._data[:] = outputs._data - outputs_n
 
+    def _anderson_update(self, outputs_k):
+        """
+        Replace the outputs of the NLBGS iteration with the Anderson accelerated outputs.
+
+        This is the type II Anderson mixing of Walker and Ni, "Anderson Acceleration for
+        Fixed-Point Iterations", SIAM J. Numer. Anal. 49(4), 2011.
+
+        Parameters
+        ----------
+        outputs_k : ndarray
+            Outputs at the start of the iteration.
+        """
+        outputs = self._system._outputs
+        beta = self.options['anderson_beta']
+
+        # change in the outputs over the NLBGS iteration
+        f_k = outputs._data - outputs_k
+
+        if self._anderson_f_1 is not None:
+            self._anderson_dx.append(outputs_k - self._anderson_x_1)
+            self._anderson_df.append(f_k - self._anderson_f_1)
+
+        self._anderson_x_1 = outputs_k
+        self._anderson_f_1 = f_k
+
+        if self._anderson_df:
+            # least squares combination of the previous changes that best cancels the current one
+            dx = np.array(self._anderson_dx).T
+            df = np.array(self._anderson_df).T
+            gamma = np.linalg.lstsq(df, f_k, rcond=-1)[0]
+
+            outputs._data[:] = outputs_k - dx.dot(gamma)
+            outputs._data += beta * (f_k - df.dot(gamma))
+
+        elif beta != 1.0:
+            outputs._data[:] = outputs_k + beta * f_k
+
     def _run_apply(self):
         """
         Run the apply_nonlinear method on the system.
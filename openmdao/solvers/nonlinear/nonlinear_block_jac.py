@@ -11,6 +11,16 @@ class NonlinearBlockJac(NonlinearSolver):
 
     SOLVER = 'NL: NLBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super(NonlinearBlockJac, self)._declare_options()
+
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc='Number of threads used to run the subsystems concurrently. '
+                             'Subsystems run in threads must not have case recorders attached.')
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
@@ -24,11 +34,9 @@ class NonlinearBlockJac(NonlinearSolver):
             # If this is a parallel group, check for analysis errors and reraise.
             if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
                 with multi_proc_fail_check(system.comm):
-                    for subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+                    self._solve_subsystems()
             else:
-                for subsys in system._subsystems_myproc:
-                    subsys._solve_nonlinear()
+                self._solve_subsystems()
 
             system._check_child_reconf()
             rec.abs = 0.0
@@ -36,6 +44,13 @@ class NonlinearBlockJac(NonlinearSolver):
 
         self._solver_info.pop()
 
+    def _solve_subsystems(self):
+        """
+        Run solve_nonlinear on the local subsystems, in a thread pool if requested.
+        """
+        self._run_threaded(lambda subsys: subsys._solve_nonlinear(),
+                           self._system._subsystems_myproc, self.options['num_threads'])
+
     def _mpi_print_header(self):
         """
         Print header text before solving.
@@ -25,6 +25,8 @@ class NonlinearRunOnce(NonlinearSolver):
         system = self._system
 
         with Recording('NLRunOnce', 0, self) as rec:
+            num_threads = self._parallel_num_threads()
+
             # If this is a parallel group, transfer all at once then run each subsystem.
             if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
                 system._transfer('nonlinear', 'fwd')
@@ -35,6 +37,13 @@ class NonlinearRunOnce(NonlinearSolver):
 
                 system._check_child_reconf()
 
+            # If this is a parallel group run in threads, do the same but in a thread pool.
+            elif num_threads > 1:
+                system._transfer('nonlinear', 'fwd')
+                self._run_threaded(lambda subsys: subsys._solve_nonlinear(),
+                                   system._subsystems_myproc, num_threads)
+                system._check_child_reconf()
+
             # If this is not a parallel group, transfer for each subsystem just prior to running it.
             else:
                 self._gs_iter()
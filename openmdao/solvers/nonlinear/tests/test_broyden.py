@@ -357,6 +357,61 @@ class TestBryoden(unittest.TestCase):
         # Jacobian.
         self.assertTrue(model.nonlinear_solver._iter_count < 6)
 
+    def test_mixed_limited_memory(self):
+        # Without eviction, the limited-memory updates match the dense inverse Jacobian.
+        iter_counts = []
+        for limited_memory in (False, True):
+            for compute_jacobian in (False, True):
+                prob = om.Problem()
+                model = prob.model
+
+                model.add_subsystem('p1', om.IndepVarComp('c', 0.01))
+                model.add_subsystem('mixed', MixedEquation())
+
+                model.connect('p1.c', 'mixed.c')
+
+                model.nonlinear_solver = om.BroydenSolver(limited_memory=limited_memory,
+                                                          compute_jacobian=compute_jacobian,
+                                                          memory_depth=20, maxiter=20)
+                model.nonlinear_solver.options['state_vars'] = ['mixed.x12', 'mixed.x3',
+                                                                'mixed.x45']
+                model.nonlinear_solver.linear_solver = om.DirectSolver()
+
+                prob.setup()
+                prob.run_model()
+
+                assert_rel_error(self, prob['mixed.x12'], np.zeros((2, )), 1e-6)
+                assert_rel_error(self, prob['mixed.x3'], 0.0, 1e-6)
+                assert_rel_error(self, prob['mixed.x45'], np.zeros((2, )), 1e-6)
+
+                iter_counts.append(model.nonlinear_solver._iter_count)
+
+                if limited_memory:
+                    self.assertIsNone(model.nonlinear_solver.Gm)
+
+        self.assertEqual(iter_counts[:2], iter_counts[2:])
+
+    def test_simple_sellar_full_limited_memory_krylov(self):
+        # A computed initial Jacobian only needs linear solves in limited-memory mode.
+
+        prob = om.Problem()
+        model = prob.model = SellarStateConnection(nonlinear_solver=om.BroydenSolver(),
+                                                   linear_solver=om.LinearRunOnce())
+
+        prob.setup()
+
+        model.nonlinear_solver.options['limited_memory'] = True
+        model.nonlinear_solver.options['memory_depth'] = 2
+        model.nonlinear_solver.linear_solver = om.ScipyKrylov()
+
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['state_eq.y2_command'], 12.05848819, .00001)
+
+        self.assertTrue(model.nonlinear_solver._iter_count < 5)
+        self.assertEqual(len(model.nonlinear_solver._lm_updates), 2)
+
     def test_simple_sellar_jacobian(self):
         # Test top level Sellar (i.e., not grouped).
 
@@ -15,6 +15,30 @@ from openmdao.test_suite.components.sellar import SellarDerivativesGrouped, \
 from openmdao.utils.assert_utils import assert_rel_error, assert_warning
 
 
+class CubicImplicit(om.ImplicitComponent):
+    # A y + y**3 = b, with a dense A so that Krylov solvers need many iterations
+    def initialize(self):
+        self.options.declare('size', default=40, types=int)
+
+    def setup(self):
+        n = self.options['size']
+        rand = np.random.RandomState(11)
+        self.A = np.diag(np.linspace(1., 20., n)) + 0.3 * rand.random_sample((n, n))
+
+        self.add_input('b', np.ones(n))
+        self.add_output('y', np.ones(n))
+
+        self.declare_partials('y', 'y')
+        self.declare_partials('y', 'b', rows=np.arange(n), cols=np.arange(n), val=-1.0)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        y = outputs['y']
+        residuals['y'] = self.A.dot(y) + y ** 3 - inputs['b']
+
+    def linearize(self, inputs, outputs, partials):
+        partials['y', 'y'] = self.A + np.diag(3.0 * outputs['y'] ** 2)
+
+
 class TestNewton(unittest.TestCase):
 
     def test_specify_newton_linear_solver_in_system(self):
@@ -801,6 +825,135 @@ class TestNewton(unittest.TestCase):
         msg = "Solver 'NL: Newton' on system '': residuals contain 'inf' or 'NaN' after 0 iterations."
         self.assertEqual(str(context.exception), msg)
 
+    def _count_linearizations(self, prob):
+        # count the factorizations done by the model's DirectSolver
+        solver = prob.model.linear_solver
+        counts = [0]
+        linearize = solver._linearize
+
+        def _linearize():
+            counts[0] += 1
+            linearize()
+
+        solver._linearize = _linearize
+        return counts
+
+    def _setup_sellar(self, **options):
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=om.NewtonSolver(**options),
+                                                  linear_solver=om.DirectSolver()))
+        prob.set_solver_print(level=0)
+        prob.setup()
+        return prob
+
+    def test_jac_reuse(self):
+        prob = self._setup_sellar(atol=1e-12, rtol=1e-12)
+        counts = self._count_linearizations(prob)
+        prob.run_model()
+        full_count = counts[0]
+        full_iters = prob.model.nonlinear_solver._iter_count
+
+        prob = self._setup_sellar(atol=1e-12, rtol=1e-12, max_jac_reuse=3, reuse_ratio_limit=0.9)
+        counts = self._count_linearizations(prob)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+        # every linearization is reused at least once until the reduction ratio degrades
+        self.assertLess(counts[0], full_count)
+        self.assertGreaterEqual(prob.model.nonlinear_solver._iter_count, full_iters)
+        self.assertEqual(full_count, full_iters)
+
+    def test_jac_reuse_ratio_limit(self):
+        # no residual reduction is good enough, so we always relinearize
+        prob = self._setup_sellar(max_jac_reuse=5, reuse_ratio_limit=0.0)
+        counts = self._count_linearizations(prob)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        self.assertEqual(counts[0], prob.model.nonlinear_solver._iter_count)
+
+    def test_jac_reuse_across_solves(self):
+        expected = self._setup_sellar()
+        expected['x'] = 1.01
+        expected.run_model()
+
+        for across in (False, True):
+            prob = self._setup_sellar(maxiter=50, max_jac_reuse=100, reuse_ratio_limit=0.9,
+                                      reuse_across_solves=across)
+            counts = self._count_linearizations(prob)
+            prob.run_model()
+            self.assertEqual(counts[0], 1)
+
+            prob['x'] = 1.01
+            prob.run_model()
+
+            assert_rel_error(self, prob['y1'], expected['y1'], 1e-8)
+            assert_rel_error(self, prob['y2'], expected['y2'], 1e-8)
+
+            # the second solve only reuses the previous linearization if we ask for it
+            self.assertEqual(counts[0], 1 if across else 2)
+
+    def _solve_cubic(self, forcing_term):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('b', 10.0 * np.ones(40)))
+        model.add_subsystem('comp', CubicImplicit())
+        model.connect('ivc.b', 'comp.b')
+
+        model.nonlinear_solver = om.NewtonSolver(forcing_term=forcing_term, maxiter=30,
+                                                 atol=1e-10, rtol=1e-10)
+        model.linear_solver = om.ScipyKrylov(restart=100)
+
+        prob.set_solver_print(level=0)
+        prob.setup()
+
+        # count the Krylov matvecs
+        linear_solver = model.linear_solver
+        counts = [0]
+        mat_vec = linear_solver._mat_vec
+
+        def _mat_vec(in_vec):
+            counts[0] += 1
+            return mat_vec(in_vec)
+
+        linear_solver._mat_vec = _mat_vec
+
+        # track the forcing terms
+        etas = []
+        newton = model.nonlinear_solver
+        get_forcing_term = newton._get_forcing_term
+
+        def _get_forcing_term():
+            etas.append(get_forcing_term())
+            return etas[-1]
+
+        newton._get_forcing_term = _get_forcing_term
+
+        prob['comp.y'] = 5.0
+        prob.run_model()
+
+        return prob, counts[0], etas
+
+    def test_inexact_newton(self):
+        prob, fixed_count, etas = self._solve_cubic('fixed')
+        self.assertEqual(etas, [])
+        expected = prob['comp.y']
+
+        for forcing_term in ('ew1', 'ew2'):
+            prob, count, etas = self._solve_cubic(forcing_term)
+
+            assert_rel_error(self, prob['comp.y'], expected, 1e-9)
+            self.assertLess(prob.model._residuals.get_norm(), 1e-9)
+
+            # linear solves are loose at first and tighten as Newton converges
+            self.assertLess(count, fixed_count)
+            self.assertEqual(etas[0], 0.3)
+            self.assertLessEqual(max(etas), 0.9)
+            self.assertLess(etas[-1], 1e-3)
+
+            self.assertIsNone(prob.model.linear_solver._forcing_term)
+
     def test_relevancy_for_newton(self):
 
         class TestImplCompSimple(om.ImplicitComponent):
@@ -1091,6 +1244,32 @@ class TestNewtonFeatures(unittest.TestCase):
         except om.AnalysisError:
             pass
 
+    def test_feature_jac_reuse(self):
+        import openmdao.api as om
+        from openmdao.test_suite.components.sellar import SellarDerivatives
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+
+        model.linear_solver = om.DirectSolver()
+
+        newton = model.nonlinear_solver = om.NewtonSolver()
+        newton.options['maxiter'] = 20
+        newton.options['max_jac_reuse'] = 4
+        newton.options['reuse_ratio_limit'] = 0.5
+        newton.options['reuse_across_solves'] = True
+
+        prob.setup()
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+        prob['x'] = 1.01
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.59810853, .00001)
+
     def test_solve_subsystems_basic(self):
         import openmdao.api as om
         from openmdao.test_suite.components.double_sellar import DoubleSellar
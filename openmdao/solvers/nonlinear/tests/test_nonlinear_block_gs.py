@@ -349,6 +349,59 @@ class TestNLBGaussSeidel(unittest.TestCase):
         J = prob.compute_totals(of=['y1'], wrt=['x'])
         assert_rel_error(self, J['y1', 'x'][0][0], 0.98061448, 1e-6)
 
+    def test_NLBGS_Anderson(self):
+        iter_counts = []
+        for use_anderson in (False, True):
+            nlbgs = om.NonlinearBlockGS(use_anderson=use_anderson, anderson_depth=3,
+                                        atol=1e-12, rtol=1e-12, maxiter=50)
+            prob = om.Problem(model=SellarDerivatives(nonlinear_solver=nlbgs))
+            model = prob.model
+
+            prob.setup()
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+            assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+            iter_counts.append(model.nonlinear_solver._iter_count)
+
+        self.assertLess(iter_counts[1], iter_counts[0])
+
+    def test_NLBGS_Anderson_cs(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+
+        model = prob.model
+        model.approx_totals(method='cs', step=1e-10)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        model.nonlinear_solver.options['use_anderson'] = True
+        model.nonlinear_solver.options['atol'] = 1e-15
+        model.nonlinear_solver.options['rtol'] = 1e-15
+
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+        J = prob.compute_totals(of=['y1'], wrt=['x'])
+        assert_rel_error(self, J['y1', 'x'][0][0], 0.98061448, 1e-6)
+
+    def test_NLBGS_Aitken_and_Anderson(self):
+
+        nlbgs = om.NonlinearBlockGS(use_aitken=True, use_anderson=True)
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=nlbgs))
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception),
+                         "NonlinearBlockGS in SellarDerivatives (<model>): Options 'use_aitken' and "
+                         "'use_anderson' cannot both be True.")
+
     def test_NLBGS_cs(self):
 
         prob = om.Problem(model=SellarDerivatives())
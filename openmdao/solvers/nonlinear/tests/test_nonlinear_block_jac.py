@@ -152,6 +152,41 @@ class TestNLBlockJacobi(unittest.TestCase):
         assert_rel_error(self, prob['y1'], 25.5886171567, .00001)
         assert_rel_error(self, prob['y2'], 12.05848819, .00001)
 
+    def test_threads(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.linear_solver = om.LinearBlockGS()
+        model.nonlinear_solver = om.NonlinearBlockJac(num_threads=2, atol=1e-12, rtol=1e-12,
+                                                      maxiter=100)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+        # the iteration stack of the main thread is left untouched by the threads
+        self.assertEqual(prob._recording_iter.stack, [])
+
+        # the pool is kept for later iterations
+        solver = model.nonlinear_solver
+        pool = solver._thread_pool
+        self.assertEqual(solver._thread_pool_size, 2)
+        prob.run_model()
+        self.assertIs(solver._thread_pool, pool)
+
+        prob.cleanup()
+        self.assertIsNone(solver._thread_pool)
+        self.assertEqual(solver._thread_pool_size, 0)
+
 
 @unittest.skipUnless(PETScVector, "PETSc is required.")
 class TestNonlinearBlockJacobiMPI(unittest.TestCase):
@@ -4,6 +4,8 @@ from __future__ import division, print_function
 
 from six import iteritems, reraise
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from threading import local
 import os
 import pprint
 import re
@@ -22,10 +24,13 @@ from openmdao.utils.record_util import create_local_meta, check_path
 _emptyset = set()
 
 
-class SolverInfo(object):
+class SolverInfo(local):
     """
     Communal object for storing some formatting for solver iprint.
 
+    The prefix and stack are kept separately for each thread, so that subsystems run in a
+    thread pool can print their iterations independently.
+
     Attributes
     ----------
     prefix : str
@@ -122,6 +127,8 @@ class Solver(object):
         'fwd' or 'rev', applicable to linear solvers only.
     _iter_count : int
         Number of iterations for the current invocation of the solver.
+    _converged : bool
+        True if the last iterative solve met the tolerances.
     _rec_mgr : <RecordingManager>
         object that manages all recorders added to this solver
     cite : str
@@ -140,6 +147,10 @@ class Solver(object):
         Normalization factor
     _solver_info : SolverInfo
         A stack-like object shared by all Solvers in the model.
+    _thread_pool : ThreadPool or None
+        Pool of threads used to run subsystems concurrently, created on first use.
+    _thread_pool_size : int
+        Number of threads in _thread_pool, or 0 if there is no pool.
     """
 
     # Object to store some formatting for iprint that is shared across all solvers.
@@ -159,7 +170,10 @@ class Solver(object):
         self._vec_names = None
         self._mode = 'fwd'
         self._iter_count = 0
+        self._converged = False
         self._solver_info = None
+        self._thread_pool = None
+        self._thread_pool_size = 0
 
         # Solver options
         self.options = OptionsDictionary(parent_name=self.msginfo)
@@ -405,6 +419,9 @@ class Solver(object):
                 norm0 = 1
             self._mpi_print(self._iter_count, norm, norm / norm0)
 
+        self._converged = not (np.isinf(norm) or np.isnan(norm) or
+                               (norm > atol and norm / norm0 > rtol))
+
         if self._system.comm.rank == 0 or os.environ.get('USE_PROC_FILES'):
             prefix = self._solver_info.prefix + self.SOLVER
 
@@ -560,6 +577,67 @@ class Solver(object):
 
         self._rec_mgr.record_iteration(self, data, metadata)
 
+    def _run_threaded(self, func, items, num_threads):
+        """
+        Call func on each item, using a pool of threads if num_threads is greater than one.
+
+        Each thread starts from the current iteration coordinate and iprint prefix, so
+        recording and printing done by the items is nested under this solver.
+
+        Parameters
+        ----------
+        func : function
+            Function called with a single item as its argument.
+        items : list
+            Items to call func on, typically subsystems.
+        num_threads : int
+            Maximum number of threads to use.
+        """
+        num_threads = min(num_threads, len(items))
+        if num_threads < 2:
+            for item in items:
+                func(item)
+            return
+
+        pool = self._thread_pool
+        if self._thread_pool_size < num_threads:
+            if pool is not None:
+                pool.close()
+            pool = self._thread_pool = ThreadPool(num_threads)
+            self._thread_pool_size = num_threads
+
+        rec_iter = self._recording_iter
+        rec_stack = list(rec_iter.stack)
+        rec_prefix = rec_iter.prefix
+        info_prefix, info_stack = self._solver_info.save_cache()
+        info_stack = list(info_stack)
+
+        def run(item):
+            rec_iter.stack = list(rec_stack)
+            rec_iter.prefix = rec_prefix
+            self._solver_info.restore_cache((info_prefix, list(info_stack)))
+            func(item)
+
+        pool.map(run, items, chunksize=1)
+
+    def _parallel_num_threads(self):
+        """
+        Return the number of threads used to run the subsystems of a ParallelGroup.
+
+        Returns
+        -------
+        int
+            The num_threads option of the system if it is a ParallelGroup whose subsystems are
+            all local to this process, otherwise 1.
+        """
+        from openmdao.core.parallel_group import ParallelGroup
+
+        system = self._system
+        if isinstance(system, ParallelGroup) and \
+                len(system._subsystems_myproc) == len(system._subsystems_allprocs):
+            return system.options['num_threads']
+        return 1
+
     def cleanup(self):
         """
         Clean up resources prior to exit.
@@ -567,6 +645,11 @@ class Solver(object):
         # shut down all recorders
         self._rec_mgr.shutdown()
 
+        if self._thread_pool is not None:
+            self._thread_pool.close()
+            self._thread_pool = None
+            self._thread_pool_size = 0
+
     def _set_complex_step_mode(self, active):
         """
         Turn on or off complex stepping mode.
@@ -725,6 +808,9 @@ class LinearSolver(Solver):
         Names of systems relevant to the current solve.
     _assembled_jac : AssembledJacobian or None
         If not None, the AssembledJacobian instance used by this solver.
+    _forcing_term : float or None
+        If not None, relative tolerance set by an inexact Newton solver that overrides the
+        tolerance options of iterative solvers that support it.
     """
 
     def __init__(self, **kwargs):
@@ -738,6 +824,7 @@ class LinearSolver(Solver):
         """
         self._rel_systems = None
         self._assembled_jac = None
+        self._forcing_term = None
         super(LinearSolver, self).__init__(**kwargs)
 
     def _assembled_jac_solver_iter(self):
@@ -919,6 +1006,56 @@ class BlockLinearSolver(LinearSolver):
 
         return norm ** 0.5
 
+    def _jacobi_iter(self, num_threads=1):
+        """
+        Perform a block Jacobi iteration over this Solver's subsystems.
+
+        Parameters
+        ----------
+        num_threads : int
+            Number of threads used to run the subsystems concurrently.
+        """
+        system = self._system
+        mode = self._mode
+        vec_names = self._vec_names
+        rel_systems = self._rel_systems
+
+        subs = [s for s in system._subsystems_myproc
+                if rel_systems is None or s.pathname in rel_systems]
+        scopes = dict((subsys.pathname, system._get_scope(subsys)) for subsys in subs)
+
+        def apply_linear(subsys):
+            scope_out, scope_in = scopes[subsys.pathname]
+            subsys._apply_linear(None, vec_names, rel_systems, mode, scope_out, scope_in)
+
+        def solve_linear(subsys):
+            subsys._solve_linear(vec_names, mode, rel_systems)
+
+        if mode == 'fwd':
+            for vec_name in vec_names:
+                system._transfer(vec_name, mode)
+
+            self._run_threaded(apply_linear, subs, num_threads)
+
+            for vec_name in vec_names:
+                b_vec = system._vectors['residual'][vec_name]
+                b_vec *= -1.0
+                b_vec._data += self._rhs_vecs[vec_name]
+
+            self._run_threaded(solve_linear, subs, num_threads)
+
+        else:  # rev
+            self._run_threaded(apply_linear, subs, num_threads)
+
+            for vec_name in vec_names:
+                system._transfer(vec_name, mode)
+
+                b_vec = system._vectors['output'][vec_name]
+                b_vec *= -1.0
+                b_vec._data += self._rhs_vecs[vec_name]
+
+            self._run_threaded(solve_linear, subs, num_threads)
+
     def solve(self, vec_names, mode, rel_systems=None):
         """
         Run the solver.
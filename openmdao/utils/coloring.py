@@ -12,16 +12,16 @@ import pickle
 import inspect
 import traceback
 from collections import OrderedDict, defaultdict
-from itertools import combinations, chain
-from distutils.version import LooseVersion
+from itertools import chain
 from contextlib import contextmanager
+from heapq import heapify, heappop, heappush
 from pprint import pprint
 
 from six import iteritems, string_types
 from six.moves import range
 
 import numpy as np
-from scipy.sparse.compressed import get_index_dtype
+from scipy.sparse import csc_matrix, csr_matrix, issparse
 
 from openmdao.jacobians.jacobian import Jacobian
 from openmdao.utils.array_utils import array_viz
@@ -66,6 +66,9 @@ _STD_COLORING_FNAME = object()
 # used to indicate that we should dynamically generate a coloring
 _DYN_COLORING = object()
 
+# default number of linear solves timed in each direction when selecting the coloring mode
+_DEF_MODE_SELECT_SOLVES = 5
+
 # default values related to the computation of a sparsity matrix
 _DEF_COMP_SPARSITY_ARGS = {
     'tol': 1e-25,
@@ -77,26 +80,6 @@ _DEF_COMP_SPARSITY_ARGS = {
 }
 
 
-# numpy versions before 1.12 don't use the 'axis' arg passed to count_nonzero and always
-# return an int instead of an array of ints, so create our own function for those versions.
-if LooseVersion(np.__version__) >= LooseVersion("1.12"):
-    _count_nonzeros = np.count_nonzero
-else:
-    def _count_nonzeros(arr, axis=None):
-        if axis == 1:  # rows
-            count = np.empty(arr.shape[0], dtype=int)
-            for row in range(arr.shape[0]):
-                count[row] = np.count_nonzero(arr[row])
-        elif axis == 0:  # cols
-            count = np.empty(arr.shape[1], dtype=int)
-            for col in range(arr.shape[1]):
-                count[col] = np.count_nonzero(arr[:, col])
-        else:
-            return np.count_nonzero(arr)
-
-        return count
-
-
 class Coloring(object):
     """
     Container for all information relevant to a coloring.
@@ -134,8 +117,8 @@ class Coloring(object):
 
         Parameters
         ----------
-        sparsity : ndarray
-            Full jacobian sparsity matrix (dense bool form).
+        sparsity : ndarray or sparse matrix
+            Full jacobian sparsity matrix (dense bool form or any scipy sparse format).
         row_vars : list of str or None
             Names of variables corresponding to rows.
         row_var_sizes : ndarray or None
@@ -146,9 +129,14 @@ class Coloring(object):
             Sizes of column variables.
         """
         # store the nonzero row and column indices if jac sparsity is provided
-        self._nzrows, self._nzcols = np.nonzero(sparsity)
+        if issparse(sparsity):
+            sparsity = _to_sparse_bool(sparsity, 'csr')
+            self._nzrows = np.repeat(np.arange(sparsity.shape[0]), np.diff(sparsity.indptr))
+            self._nzcols = sparsity.indices
+        else:
+            self._nzrows, self._nzcols = np.nonzero(sparsity)
         self._shape = sparsity.shape
-        self._pct_nonzero = np.count_nonzero(sparsity) / (self._shape[0] * self._shape[1]) * 100
+        self._pct_nonzero = self._nzrows.size / (self._shape[0] * self._shape[1]) * 100
 
         self._row_vars = row_vars
         self._row_var_sizes = row_var_sizes
@@ -524,6 +512,15 @@ class Coloring(object):
         if coloring_time is not None:
             print("Time to compute coloring: %f sec." % coloring_time)
 
+        selection = meta.get('mode_selection')
+        if selection is not None:
+            mode = 'bidirectional' if selection['mode'] == 'auto' else selection['mode']
+            print("Coloring mode selected from timed linear solves: %s" % mode)
+            times, costs = selection['solve_times'], selection['costs']
+            print("Linear solve times: fwd %g s, rev %g s." % (times['fwd'], times['rev']))
+            print("Estimated jacobian cost: fwd %g s, rev %g s, bidirectional %g s." %
+                  (costs['fwd'], costs['rev'], costs['auto']))
+
     def display_txt(self):
         """
         Print the structure of a boolean array with coloring info for each nonzero value.
@@ -899,43 +896,81 @@ class Coloring(object):
         return fwd_solves, rev_solves
 
 
-def _order_by_ID(col_matrix):
+def _to_sparse_bool(J, fmt='csc'):
+    """
+    Return the given jacobian sparsity as a boolean scipy sparse matrix with sorted indices.
+
+    Parameters
+    ----------
+    J : ndarray or sparse matrix
+        Jacobian sparsity matrix.
+    fmt : str
+        Sparse format of the returned matrix, either 'csc' or 'csr'.
+
+    Returns
+    -------
+    csc_matrix or csr_matrix
+        Boolean sparsity matrix containing no explicit zeros.
+    """
+    J = csc_matrix(J, dtype=bool) if fmt == 'csc' else csr_matrix(J, dtype=bool)
+    J.eliminate_zeros()
+    J.sort_indices()
+    return J
+
+
+def _order_by_ID(col_adj):
     """
     Return columns in order of incidence degree (ID).
 
-    ID is the number of already colored neighbors (neighbors are dependent columns).
+    ID is the number of already colored neighbors (neighbors are dependent columns).  Ties are
+    broken in favor of the lowest column index.
 
     Parameters
     ----------
-    col_matrix : ndarray
-        Boolean array of column dependencies.
+    col_adj : csr_matrix
+        Symmetric column adjacency matrix.
 
     Yields
     ------
     int
         Column index.
     """
-    degrees = _count_nonzeros(col_matrix, axis=0)
-    ncols = degrees.size
+    ncols = col_adj.shape[0]
 
     if ncols == 0:
         return
 
+    indptr = col_adj.indptr
+    indices = col_adj.indices
+
     # use max degree column as a starting point instead of just choosing a random column
     # since all have incidence degree of 0 when we start.
-    start = degrees.argmax()
-    yield start
+    start = int(np.diff(indptr).argmax())
+
+    colored_degrees = np.zeros(ncols, dtype=int)
+    uncolored = np.ones(ncols, dtype=bool)
 
-    colored_degrees = np.zeros(degrees.size, dtype=get_index_dtype(maxval=degrees[start]))
-    colored_degrees[col_matrix[start]] += 1
-    colored_degrees[start] = -ncols  # ensure that this col will never have max degree again
+    # heap of (-incidence degree, col).  Entries become stale when a column's degree goes up
+    # or the column is colored, and are skipped when popped.
+    heap = [(0, c) for c in range(ncols) if c != start]
+
+    col = start
+    for i in range(ncols):
+        if i > 0:
+            while True:
+                deg, col = heappop(heap)
+                if uncolored[col] and -deg == colored_degrees[col]:
+                    break
 
-    for i in range(ncols - 1):
-        col = colored_degrees.argmax()
-        colored_degrees[col_matrix[col]] += 1
-        colored_degrees[col] = -ncols  # ensure that this col will never have max degree again
         yield col
 
+        uncolored[col] = False
+        nbrs = indices[indptr[col]:indptr[col + 1]]
+        nbrs = nbrs[uncolored[nbrs]]
+        colored_degrees[nbrs] += 1
+        for c, deg in zip(nbrs.tolist(), colored_degrees[nbrs].tolist()):
+            heappush(heap, (-deg, c))
+
 
 def _J2col_matrix(J):
     """
@@ -943,28 +978,20 @@ def _J2col_matrix(J):
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         Boolean jacobian sparsity matrix.
 
     Returns
     -------
-    ndarray
+    csr_matrix
         Column adjacency matrix.
     """
-    nrows, ncols = J.shape
-
-    col_matrix = np.zeros((ncols, ncols), dtype=bool)
+    J = _to_sparse_bool(J).astype(np.int32)
 
-    # mark col_matrix entries as True when nonzero row entries make them dependent
-    for row in range(nrows):
-        nzro = np.nonzero(J[row])[0]
-        for col in nzro:
-            col_matrix[col, nzro] = True
+    # columns are adjacent when they have a nonzero in the same row
+    col_adj = J.T.dot(J).tocsr()
 
-    # zero out diagonal (column is not adjacent to itself)
-    np.fill_diagonal(col_matrix, False)
-
-    return col_matrix
+    return _strip_diagonal(col_adj)
 
 
 def _Jc2col_matrix_direct(J, Jc):
@@ -978,36 +1005,53 @@ def _Jc2col_matrix_direct(J, Jc):
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         Boolean jacobian sparsity matrix.
-    Jc : ndarray
+    Jc : ndarray or sparse matrix
         Boolean sparsity matrix of a partition of J.
 
     Returns
     -------
-    ndarray
+    csr_matrix
         Column adjacency matrix.
     """
     assert J.shape == Jc.shape
 
-    nrows, ncols = J.shape
+    J = _to_sparse_bool(J).astype(np.int32)
+    Jc = _to_sparse_bool(Jc).astype(np.int32)
 
-    col_matrix = np.zeros((ncols, ncols), dtype=bool)
+    # only columns having nonzeros in Jc take part
+    col_keep = np.diff(Jc.indptr) > 0
+    J.data[~np.repeat(col_keep, np.diff(J.indptr))] = 0
+    J.eliminate_zeros()
 
-    col_keep = _count_nonzeros(Jc, axis=0) > 0
+    # col1 and col2 are adjacent when, in the same row, J has nonzeros in both and Jc has a
+    # nonzero in either of them.
+    col_adj = Jc.T.dot(J).tocsr()
+    col_adj = (col_adj + col_adj.T).tocsr()
 
-    # mark col_matrix[col1, col2] as True when Jc[row, col1] is True OR Jc[row, col2] is True
-    for row in range(nrows):
-        nzro = np.nonzero(J[row] & col_keep)[0]
-        for col1, col2 in combinations(nzro, 2):
-            if Jc[row, col1] or Jc[row, col2]:
-                col_matrix[col1, col2] = True
-                col_matrix[col2, col1] = True
+    return _strip_diagonal(col_adj)
+
+
+def _strip_diagonal(col_adj):
+    """
+    Remove the diagonal from a column adjacency matrix (a column is not adjacent to itself).
 
-    # zero out diagonal (column is not adjacent to itself)
-    np.fill_diagonal(col_matrix, False)
+    Parameters
+    ----------
+    col_adj : csr_matrix
+        Column adjacency matrix.
 
-    return col_matrix
+    Returns
+    -------
+    csr_matrix
+        Column adjacency matrix without diagonal entries and with sorted indices.
+    """
+    rows = np.repeat(np.arange(col_adj.shape[0]), np.diff(col_adj.indptr))
+    col_adj.data[rows == col_adj.indices] = 0
+    col_adj.eliminate_zeros()
+    col_adj.sort_indices()
+    return col_adj
 
 
 def _get_full_disjoint_cols(J):
@@ -1016,7 +1060,7 @@ def _get_full_disjoint_cols(J):
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         The total jacobian.
 
     Returns
@@ -1027,13 +1071,13 @@ def _get_full_disjoint_cols(J):
     return _get_full_disjoint_col_matrix_cols(_J2col_matrix(J))
 
 
-def _get_full_disjoint_col_matrix_cols(col_matrix):
+def _get_full_disjoint_col_matrix_cols(col_adj):
     """
     Find sets of disjoint columns in a column intersection matrix.
 
     Parameters
     ----------
-    col_matrix : ndarray
+    col_adj : csr_matrix
         Column intersection matrix
 
     Returns
@@ -1042,21 +1086,29 @@ def _get_full_disjoint_col_matrix_cols(col_matrix):
         List of lists of disjoint columns
     """
     color_groups = []
-    _, ncols = col_matrix.shape
+    ncols = col_adj.shape[0]
+    indptr = col_adj.indptr
+    indices = col_adj.indices
 
     # -1 indicates that a column has not been colored
-    colors = np.full(ncols, -1, dtype=get_index_dtype(maxval=ncols))
-
-    for col in _order_by_ID(col_matrix):
-        neighbor_colors = set(colors[col_matrix[col]])
-        for color, grp in enumerate(color_groups):
-            if color not in neighbor_colors:
-                grp.append(col)
-                colors[col] = color
-                break
+    colors = np.full(ncols, -1, dtype=int)
+
+    # forbidden[color] == col when a neighbor of col already has that color
+    forbidden = np.full(ncols, -1, dtype=int)
+
+    for col in _order_by_ID(col_adj):
+        neighbor_colors = colors[indices[indptr[col]:indptr[col + 1]]]
+        forbidden[neighbor_colors[neighbor_colors >= 0]] = col
+
+        ncolors = len(color_groups)
+        free = np.nonzero(forbidden[:ncolors] != col)[0]
+        if free.size > 0:
+            color = free[0]
+            color_groups[color].append(col)
         else:
-            colors[col] = len(color_groups)
+            color = ncolors
             color_groups.append([col])
+        colors[col] = color
 
     return color_groups
 
@@ -1069,9 +1121,9 @@ def _color_partition(J, Jpart):
 
     Parameters
     ----------
-    J : ndarray
-        Dense jacobian sparsity matrix
-    Jpart : ndarray
+    J : csc_matrix
+        Jacobian sparsity matrix
+    Jpart : csc_matrix
         Partition of the jacobian sparsity matrix.
 
     Returns
@@ -1081,28 +1133,27 @@ def _color_partition(J, Jpart):
     list
         List of nonzero rows for each column.
     """
+    Jpart = _to_sparse_bool(Jpart)
     ncols = Jpart.shape[1]
-    col_nonzeros = _count_nonzeros(Jpart, axis=0)
-    row_nonzeros = _count_nonzeros(Jpart, axis=1)
-    col_keep = col_nonzeros > 0
-    row_keep = row_nonzeros > 0
+    indptr = Jpart.indptr
+    col_keep = np.diff(indptr) > 0
 
     # use this to map indices back to the full J indices.
     idxmap = np.arange(ncols, dtype=int)[col_keep]
 
     intersection_mat = _Jc2col_matrix_direct(J, Jpart)
-    intersection_mat = intersection_mat[col_keep]
-    intersection_mat = intersection_mat[:, col_keep]
+    intersection_mat = intersection_mat[idxmap][:, idxmap].tocsr()
+    intersection_mat.sort_indices()
 
     col_groups = _get_full_disjoint_col_matrix_cols(intersection_mat)
 
     for i, group in enumerate(col_groups):
-        col_groups[i] = sorted([idxmap[c] for c in group if col_keep[idxmap[c]]])
+        col_groups[i] = sorted(idxmap[group].tolist())
     col_groups = _split_groups(col_groups)
 
     col2row = [None] * ncols
     for col in idxmap:
-        col2row[col] = [r for r in np.nonzero(Jpart[:, col])[0] if row_keep[r]]
+        col2row[col] = Jpart.indices[indptr[col]:indptr[col + 1]]
 
     return [col_groups, col2row]
 
@@ -1117,8 +1168,8 @@ def MNCO_bidir(J):
 
     Parameters
     ----------
-    J : ndarray
-        Dense Jacobian sparsity matrix (boolean)
+    J : ndarray or sparse matrix
+        Jacobian sparsity matrix (boolean)
 
     Returns
     -------
@@ -1127,87 +1178,108 @@ def MNCO_bidir(J):
     """
     start_time = time.time()
 
-    nrows, ncols = J.shape
+    Jcsr = _to_sparse_bool(J, 'csr')
+    Jcsc = Jcsr.tocsc()
+    Jcsc.sort_indices()
+    nrows, ncols = Jcsr.shape
 
-    coloring = Coloring(sparsity=J)
+    coloring = Coloring(sparsity=Jcsr)
+
+    M_row_nonzeros = np.diff(Jcsr.indptr)
+    M_col_nonzeros = np.diff(Jcsc.indptr)
+
+    row_taken = np.zeros(nrows, dtype=bool)
+    col_taken = np.zeros(ncols, dtype=bool)
 
-    M_col_nonzeros = _count_nonzeros(J, axis=0)
-    M_row_nonzeros = _count_nonzeros(J, axis=1)
+    # lazy min heaps of (nonzero count, index), so the row or col with the fewest remaining
+    # nonzeros (lowest index on ties) is found without scanning all of them.
+    row_heap = [(n, i) for i, n in enumerate(M_row_nonzeros.tolist())]
+    col_heap = [(n, i) for i, n in enumerate(M_col_nonzeros.tolist())]
+    heapify(row_heap)
+    heapify(col_heap)
 
-    M_rows, M_cols = coloring._nzrows, coloring._nzcols
+    def _argmin(heap, counts, taken, sentinel):
+        while heap:
+            n, i = heap[0]
+            if not taken[i] and n == counts[i]:
+                return i, n
+            heappop(heap)
+        # everything has been taken
+        return 0, sentinel
 
     Jc_rows = [None] * nrows
     Jr_cols = [None] * ncols
 
     row_i = col_i = 0
+    remaining = Jcsr.nnz
 
     # partition J into Jc and Jr
     # We build Jc from bottom up and Jr from right to left.
-    r = M_row_nonzeros.argmin()
-    c = M_col_nonzeros.argmin()
-
-    nnz_r = M_row_nonzeros[r]
-    nnz_c = M_col_nonzeros[c]
+    r, nnz_r = _argmin(row_heap, M_row_nonzeros, row_taken, ncols + 1)
+    c, nnz_c = _argmin(col_heap, M_col_nonzeros, col_taken, nrows + 1)
 
     Jc_nz_max = 0   # max row nonzeros in Jc
     Jr_nz_max = 0   # max col nonzeros in Jr
 
-    while M_rows.size + M_cols.size > 0:
+    while remaining > 0:
         if Jr_nz_max + max(Jc_nz_max, nnz_r) < (Jc_nz_max + max(Jr_nz_max, nnz_c)):
-            Jc_rows[r] = M_cols[M_rows == r]
+            cols = Jcsr.indices[Jcsr.indptr[r]:Jcsr.indptr[r + 1]]
+            Jc_rows[r] = cols = cols[~col_taken[cols]]
             Jc_nz_max = max(nnz_r, Jc_nz_max)
 
-            M_row_nonzeros[r] = ncols + 1  # make sure we don't pick this one again
-            M_col_nonzeros[Jc_rows[r]] -= 1
+            row_taken[r] = True
+            M_col_nonzeros[cols] -= 1
+            for i, n in zip(cols.tolist(), M_col_nonzeros[cols].tolist()):
+                heappush(col_heap, (n, i))
+            remaining -= cols.size
 
-            keep = M_rows != r
-            r = M_row_nonzeros.argmin()
-            c = M_col_nonzeros.argmin()
-            nnz_r = M_row_nonzeros[r]
+            r, nnz_r = _argmin(row_heap, M_row_nonzeros, row_taken, ncols + 1)
+            c, _ = _argmin(col_heap, M_col_nonzeros, col_taken, nrows + 1)
 
             row_i += 1
         else:
-            Jr_cols[c] = M_rows[M_cols == c]
+            rows = Jcsc.indices[Jcsc.indptr[c]:Jcsc.indptr[c + 1]]
+            Jr_cols[c] = rows = rows[~row_taken[rows]]
             Jr_nz_max = max(nnz_c, Jr_nz_max)
 
-            M_col_nonzeros[c] = nrows + 1  # make sure we don't pick this one again
-            M_row_nonzeros[Jr_cols[c]] -= 1
+            col_taken[c] = True
+            M_row_nonzeros[rows] -= 1
+            for i, n in zip(rows.tolist(), M_row_nonzeros[rows].tolist()):
+                heappush(row_heap, (n, i))
+            remaining -= rows.size
 
-            keep = M_cols != c
-            r = M_row_nonzeros.argmin()
-            c = M_col_nonzeros.argmin()
-            nnz_c = M_col_nonzeros[c]
+            r, _ = _argmin(row_heap, M_row_nonzeros, row_taken, ncols + 1)
+            c, nnz_c = _argmin(col_heap, M_col_nonzeros, col_taken, nrows + 1)
 
             col_i += 1
 
-        M_rows = M_rows[keep]
-        M_cols = M_cols[keep]
-
     nnz_Jc = nnz_Jr = 0
-    jac = np.zeros(J.shape, dtype=bool)
 
     if row_i > 0:
-        Jc = jac
         # build Jc and do fwd coloring on it
-        for i, cols in enumerate(Jc_rows):
-            if cols is not None:
-                Jc[i][cols] = True
-                nnz_Jc += len(cols)
+        rows = [np.full(len(cols), i, dtype=int) for i, cols in enumerate(Jc_rows)
+                if cols is not None]
+        cols = [cols for cols in Jc_rows if cols is not None]
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=int)
+        cols = np.concatenate(cols) if cols else np.zeros(0, dtype=int)
+        nnz_Jc = rows.size
+        Jc = csc_matrix((np.ones(nnz_Jc, dtype=bool), (rows, cols)), shape=(nrows, ncols))
 
-        coloring._fwd = _color_partition(J, Jc)
-        jac[:] = False  # reset for use with Jr
+        coloring._fwd = _color_partition(Jcsc, Jc)
 
     if col_i > 0:
-        Jr = jac
         # build Jr and do rev coloring
-        for i, rows in enumerate(Jr_cols):
-            if rows is not None:
-                Jr[rows, i] = True
-                nnz_Jr += len(rows)
+        cols = [np.full(len(rows), i, dtype=int) for i, rows in enumerate(Jr_cols)
+                if rows is not None]
+        rows = [rows for rows in Jr_cols if rows is not None]
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=int)
+        cols = np.concatenate(cols) if cols else np.zeros(0, dtype=int)
+        nnz_Jr = rows.size
+        Jr = csr_matrix((np.ones(nnz_Jr, dtype=bool), (rows, cols)), shape=(nrows, ncols))
 
-        coloring._rev = _color_partition(J.T, Jr.T)
+        coloring._rev = _color_partition(Jcsr.T, Jr.T)
 
-    if np.count_nonzero(J) != nnz_Jc + nnz_Jr:
+    if Jcsr.nnz != nnz_Jc + nnz_Jr:
         raise RuntimeError("Nonzero mismatch for J vs. Jc and Jr")
 
     # check_coloring(J, coloring)
@@ -1556,7 +1628,7 @@ def _compute_coloring(J, mode):
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         The boolean total jacobian.
     mode : str
         The direction for solving for total derivatives.  Must be 'fwd', 'rev' or 'auto'.
@@ -1573,19 +1645,19 @@ def _compute_coloring(J, mode):
         return MNCO_bidir(J)
 
     rev = mode == 'rev'
-    nrows, ncols = J.shape
 
+    J = _to_sparse_bool(J)
     coloring = Coloring(sparsity=J)
 
     if rev:
-        J = J.T
+        J = _to_sparse_bool(J.T)
     col_groups = _split_groups(_get_full_disjoint_cols(J))
 
     full_slice = slice(None)
     col2rows = [full_slice] * J.shape[1]  # will contain list of nonzero rows for each column
     for lst in col_groups:
         for col in lst:
-            col2rows[col] = np.nonzero(J[:, col])[0]
+            col2rows[col] = J.indices[J.indptr[col]:J.indptr[col + 1]]
 
     if mode == 'fwd':
         coloring._fwd = (col_groups, col2rows)
@@ -1597,11 +1669,136 @@ def _compute_coloring(J, mode):
     return coloring
 
 
+def _time_linear_solves(problem, mode, num_solves=_DEF_MODE_SELECT_SOLVES):
+    """
+    Return the average time of the linear solves needed for the total jacobian in one direction.
+
+    A few of the actual seeded solves, spread evenly over the design variables (fwd) or
+    responses (rev), are timed.
+
+    Parameters
+    ----------
+    problem : Problem
+        The Problem being analyzed.
+    mode : str
+        The direction of the linear solves, either 'fwd' or 'rev'.
+    num_solves : int
+        Maximum number of linear solves to time.
+
+    Returns
+    -------
+    float
+        Average wall time of a single linear solve.
+    """
+    from openmdao.core.total_jac import _TotalJacInfo
+
+    driver = problem.driver
+    model = problem.model
+
+    # build an uncolored total jacobian in the requested direction just to get the seeds
+    save_mode = problem._mode
+    save_coloring = driver._coloring_info['coloring']
+    problem._mode = mode
+    driver._coloring_info['coloring'] = None
+    try:
+        total_jac = _TotalJacInfo(problem, None, None, True, 'array')
+    finally:
+        problem._mode = save_mode
+        driver._coloring_info['coloring'] = save_coloring
+
+    seeds = []
+    for imeta, idx_iter in total_jac.idx_iter_dict[mode].values():
+        for inds, input_setter, _, itermeta in idx_iter(imeta, mode):
+            seeds.append((inds, input_setter, itermeta))
+
+    if not seeds:
+        return 0.0
+
+    with model._scaled_context_all():
+        model._linearize(model._assembled_jac,
+                         sub_do_ln=model._linear_solver._linearize_children())
+    model._linear_solver._linearize()
+
+    elapsed = 0.0
+    picks = np.unique(np.linspace(0, len(seeds) - 1, num_solves).astype(int))
+    for i in picks:
+        inds, input_setter, itermeta = seeds[i]
+        rel_systems, _, _ = input_setter(inds, itermeta, mode)
+        start_time = time.time()
+        with model._scaled_context_all():
+            model._solve_linear(model._lin_vec_names, mode, rel_systems)
+        elapsed += time.time() - start_time
+
+    return elapsed / picks.size
+
+
+def _select_total_coloring(problem, J, num_solves=_DEF_MODE_SELECT_SOLVES):
+    """
+    Compute fwd, rev and bidirectional colorings and return the one that is cheapest to solve.
+
+    The cost of each coloring is its number of fwd and rev solves weighted by the measured time
+    of a linear solve in each direction.
+
+    Parameters
+    ----------
+    problem : Problem
+        The Problem being analyzed.
+    J : ndarray
+        The boolean total jacobian.
+    num_solves : int
+        Maximum number of linear solves to time in each direction.
+
+    Returns
+    -------
+    Coloring
+        The cheapest coloring. Its metadata contains the timings and costs used to select it.
+    """
+    solve_times = OrderedDict((mode, _time_linear_solves(problem, mode, num_solves))
+                              for mode in ('fwd', 'rev'))
+
+    colorings = OrderedDict()
+    costs = OrderedDict()
+    for mode in ('fwd', 'rev', 'auto'):
+        colorings[mode] = coloring = _compute_coloring(J, mode)
+        costs[mode] = (coloring.total_solves(do_rev=False) * solve_times['fwd'] +
+                       coloring.total_solves(do_fwd=False) * solve_times['rev'])
+
+    best = min(costs, key=lambda mode: costs[mode])
+
+    coloring = colorings[best]
+    coloring._meta['mode_selection'] = {
+        'mode': best,
+        'solve_times': solve_times,
+        'costs': costs,
+        'total_solves': OrderedDict((mode, c.total_solves()) for mode, c in iteritems(colorings)),
+    }
+
+    return coloring
+
+
+def _get_mode_selection_fname(fname):
+    """
+    Return the name of the file where the coloring mode selection is saved.
+
+    Parameters
+    ----------
+    fname : str
+        Name of the coloring file.
+
+    Returns
+    -------
+    str
+        Name of the mode selection file, next to the coloring file.
+    """
+    return os.path.splitext(fname)[0] + '_mode.json'
+
+
 def compute_total_coloring(problem, mode=None,
                            num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_jacs'],
                            tol=_DEF_COMP_SPARSITY_ARGS['tol'],
                            orders=_DEF_COMP_SPARSITY_ARGS['orders'],
-                           setup=False, run_model=False, bool_jac=None, fname=None):
+                           setup=False, run_model=False, bool_jac=None, fname=None,
+                           select_mode=False):
     """
     Compute simultaneous derivative colorings for the total jacobian of the given problem.
 
@@ -1625,6 +1822,10 @@ def compute_total_coloring(problem, mode=None,
         If problem is not supplied, a previously computed boolean jacobian can be used.
     fname : filename or None
         File where output coloring info will be written. If None, no info will be written.
+    select_mode : bool
+        If True and mode is 'auto', time some fwd and rev linear solves and use whichever of the
+        fwd, rev or bidirectional colorings is estimated to be cheapest. The selection is saved
+        to a json file next to fname.
 
     Returns
     -------
@@ -1669,7 +1870,13 @@ def compute_total_coloring(problem, mode=None,
             J, sparsity_info = _get_bool_total_jac(problem, num_full_jacs=num_full_jacs, tol=tol,
                                                    orders=orders, setup=setup,
                                                    run_model=run_model)
-            coloring = _compute_coloring(J, mode)
+            if select_mode and mode == 'auto':
+                coloring = _select_total_coloring(problem, J)
+            else:
+                if select_mode:
+                    simple_warning("Coloring mode selection was requested but the mode is fixed "
+                                   "to '%s'. Set mode='auto' in setup() to allow it." % mode)
+                coloring = _compute_coloring(J, mode)
             coloring._row_vars = ofs
             coloring._row_var_sizes = of_sizes
             coloring._col_vars = wrts
@@ -1685,6 +1892,9 @@ def compute_total_coloring(problem, mode=None,
                 if ((system._full_comm is not None and system._full_comm.rank == 0) or
                         (system._full_comm is None and system.comm.rank == 0)):
                     coloring.save(fname)
+                    if 'mode_selection' in coloring._meta:
+                        with open(_get_mode_selection_fname(fname), 'w') as f:
+                            json.dump(coloring._meta['mode_selection'], f, indent=4)
 
     elif bool_jac is not None:
         J = bool_jac
@@ -1761,8 +1971,11 @@ def dynamic_total_coloring(driver, run_model=True, fname=None):
     tol = driver._coloring_info.get('tol', _DEF_COMP_SPARSITY_ARGS['tol'])
     orders = driver._coloring_info.get('orders', _DEF_COMP_SPARSITY_ARGS['orders'])
 
+    select_mode = driver._coloring_info.get('select_mode', False)
+
     coloring = compute_total_coloring(problem, num_full_jacs=num_full_jacs, tol=tol, orders=orders,
-                                      setup=False, run_model=run_model, fname=fname)
+                                      setup=False, run_model=run_model, fname=fname,
+                                      select_mode=select_mode)
 
     if driver._coloring_info['show_sparsity']:
         coloring.display_txt()
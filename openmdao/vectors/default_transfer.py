@@ -7,6 +7,7 @@ from collections import defaultdict
 from six import iteritems, itervalues
 
 import numpy as np
+from scipy.sparse import coo_matrix
 
 from openmdao.vectors.vector import INT_DTYPE
 from openmdao.vectors.transfer import Transfer
@@ -14,12 +15,112 @@ from openmdao.utils.array_utils import convert_neg, _global2local_offsets, _flat
 
 _empty_idx_array = np.array([], dtype=INT_DTYPE)
 
+# contiguous runs shorter than this are left to fancy indexing, since for short runs
+# the per-slice python overhead outweighs the savings of a slice copy.
+_MIN_SLICE_RUN = 16
+
+
+def _get_slice_runs(in_inds, out_inds, min_run=_MIN_SLICE_RUN):
+    """
+    Split paired transfer indices into contiguous slices and leftover scattered indices.
+
+    Parameters
+    ----------
+    in_inds : int ndarray
+        input indices for the transfer.
+    out_inds : int ndarray
+        output indices for the transfer.
+    min_run : int
+        Minimum length of a run of consecutive indices that will be converted to a slice.
+
+    Returns
+    -------
+    list of (slice, slice)
+        (input slice, output slice) for each contiguous run.
+    int ndarray
+        input indices not covered by any slice.
+    int ndarray
+        output indices not covered by any slice.
+    """
+    size = in_inds.size
+    if size == 0:
+        return [], in_inds, out_inds
+
+    # a run is broken wherever either the input or the output index fails to increase by 1
+    breaks = np.nonzero((np.diff(in_inds) != 1) | (np.diff(out_inds) != 1))[0] + 1
+    starts = np.empty(breaks.size + 1, dtype=INT_DTYPE)
+    starts[0] = 0
+    starts[1:] = breaks
+    lens = np.diff(np.append(starts, size))
+
+    is_run = lens >= min_run
+    slices = [(slice(in_inds[i], in_inds[i] + n), slice(out_inds[i], out_inds[i] + n))
+              for i, n in zip(starts[is_run], lens[is_run])]
+
+    if not slices:
+        return slices, in_inds, out_inds
+
+    scattered = np.repeat(np.logical_not(is_run), lens)
+    return slices, in_inds[scattered], out_inds[scattered]
+
 
 class DefaultTransfer(Transfer):
     """
     Default NumPy transfer.
+
+    Attributes
+    ----------
+    _slices : list of (slice, slice)
+        (input slice, output slice) pairs for the contiguous runs of this transfer.
+    _scatter_in_inds : int ndarray
+        input indices not covered by _slices.
+    _scatter_out_inds : int ndarray
+        output indices not covered by _slices.
+    _rev_out_inds : int ndarray
+        unique entries of _scatter_out_inds, the targets of the reverse scatter-add.
+    _rev_sum_mtx : csr_matrix or None
+        matrix summing the scattered input entries into _rev_out_inds in reverse mode, or
+        None if _scatter_out_inds contains no duplicates.
+    _scatter_scaling : dict
+        Mapping of vector name to the (adder, scaler) input scaling factors gathered at
+        _scatter_in_inds, used by _scaled_transfer.
     """
 
+    def __init__(self, in_vec, out_vec, in_inds, out_inds, comm):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        out_vec : <Vector>
+            pointer to the output vector.
+        in_inds : int ndarray
+            input indices for the transfer.
+        out_inds : int ndarray
+            output indices for the transfer.
+        comm : MPI.Comm or <FakeComm>
+            communicator of the system that owns this transfer.
+        """
+        super(DefaultTransfer, self).__init__(in_vec, out_vec, in_inds, out_inds, comm)
+        self._slices, self._scatter_in_inds, self._scatter_out_inds = \
+            _get_slice_runs(self._in_inds, self._out_inds)
+
+        # Reverse transfers must sum the contributions of all inputs connected to the same
+        # output entry. Within a run the output indices are unique, so only the scattered
+        # entries need a reduction, which we precompute here as a sparse summation matrix.
+        scatter_out = self._scatter_out_inds
+        self._rev_out_inds, inv = np.unique(scatter_out, return_inverse=True)
+        if self._rev_out_inds.size < scatter_out.size:
+            nscatter = scatter_out.size
+            self._rev_sum_mtx = coo_matrix((np.ones(nscatter), (inv, np.arange(nscatter))),
+                                           shape=(self._rev_out_inds.size, nscatter)).tocsr()
+        else:
+            self._rev_sum_mtx = None
+
+        self._scatter_scaling = {}
+
     @staticmethod
     def _setup_transfers(group, recurse=True):
         """
@@ -198,9 +299,121 @@ class DefaultTransfer(Transfer):
             'fwd' or 'rev'.
 
         """
+        in_data = in_vec._data
+        out_data = out_vec._data
+
         if mode == 'fwd':
             # this works whether the vecs have multi columns or not due to broadcasting
-            in_vec._data[self._in_inds] = out_vec._data[self._out_inds]
+            for in_slice, out_slice in self._slices:
+                in_data[in_slice] = out_data[out_slice]
+
+            if self._scatter_in_inds.size > 0:
+                in_data[self._scatter_in_inds] = out_data[self._scatter_out_inds]
+
+        else:  # rev
+            for in_slice, out_slice in self._slices:
+                out_data[out_slice] += in_data[in_slice]
+
+            if self._scatter_in_inds.size > 0:
+                self._rev_scatter_add(out_data, in_data[self._scatter_in_inds])
+
+    def _scaled_transfer(self, in_vec, out_vec, mode='fwd'):
+        """
+        Perform transfer, converting the transferred values to the units/scaling of the inputs.
+
+        The input scaling is applied only to the transferred entries, so this costs a single
+        pass instead of scaling the full input vector before and after the transfer.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        out_vec : <Vector>
+            pointer to the output vector.
+        mode : str
+            'fwd' or 'rev'.
+        """
+        in_data = in_vec._data
+        out_data = out_vec._data
+
+        # Inputs are stored in physical units and transferred outputs are normalized, so in both
+        # directions the transferred entries only see the 'phys' input scaling factors.
+        adder, scaler = in_vec._scaling['phys']
+        if in_vec._ncol > 1:
+            scaler = scaler[:, np.newaxis]
+            if adder is not None:
+                adder = adder[:, np.newaxis]
+
+        if mode == 'fwd':
+            for in_slice, out_slice in self._slices:
+                in_view = in_data[in_slice]
+                np.multiply(out_data[out_slice], scaler[in_slice], out=in_view)
+                if adder is not None:
+                    in_view += adder[in_slice]
+
+            if self._scatter_in_inds.size > 0:
+                scat_adder, scat_scaler = self._get_scatter_scaling(in_vec, adder, scaler)
+                vals = out_data[self._scatter_out_inds] * scat_scaler
+                if scat_adder is not None:
+                    vals += scat_adder
+                in_data[self._scatter_in_inds] = vals
 
         else:  # rev
-            np.add.at(out_vec._data, self._out_inds, in_vec._data[self._in_inds])
+            for in_slice, out_slice in self._slices:
+                out_data[out_slice] += in_data[in_slice] * scaler[in_slice]
+                if adder is not None:
+                    out_data[out_slice] += adder[in_slice]
+
+            if self._scatter_in_inds.size > 0:
+                scat_adder, scat_scaler = self._get_scatter_scaling(in_vec, adder, scaler)
+                vals = in_data[self._scatter_in_inds] * scat_scaler
+                if scat_adder is not None:
+                    vals += scat_adder
+                self._rev_scatter_add(out_data, vals)
+
+    def _get_scatter_scaling(self, in_vec, adder, scaler):
+        """
+        Return the input scaling factors at the scattered input indices.
+
+        The factors are gathered on first use for each vector name and cached after that.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        adder : ndarray or None
+            'phys' adder of the input vector, or None for linear vectors.
+        scaler : ndarray
+            'phys' scaler of the input vector.
+
+        Returns
+        -------
+        ndarray or None
+            adder at the scattered input indices, or None for linear vectors.
+        ndarray
+            scaler at the scattered input indices.
+        """
+        try:
+            return self._scatter_scaling[in_vec._name]
+        except KeyError:
+            inds = self._scatter_in_inds
+            factors = (None if adder is None else adder[inds], scaler[inds])
+            self._scatter_scaling[in_vec._name] = factors
+            return factors
+
+    def _rev_scatter_add(self, out_data, vals):
+        """
+        Add the values for the scattered entries into the output data in reverse mode.
+
+        Parameters
+        ----------
+        out_data : ndarray
+            data array of the output vector.
+        vals : ndarray
+            values at the scattered input indices.
+        """
+        if self._rev_sum_mtx is None:
+            out_data[self._scatter_out_inds] += vals
+        else:
+            # works for multi column vecs since the matrix sums along the rows
+            out_data[self._rev_out_inds] += self._rev_sum_mtx.dot(vals)
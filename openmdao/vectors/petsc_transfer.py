@@ -294,6 +294,24 @@ class PETScTransfer(DefaultTransfer):
             # and get rid of recv list because allprocs_recv has the necessary info.
             transfers[tgt_sys] = (xfers, send.intersection(allprocs_recv[tgt_sys]))
 
+    def _scaled_transfer(self, in_vec, out_vec, mode='fwd'):
+        """
+        Perform transfer, converting the transferred values to the units/scaling of the inputs.
+
+        The scatter works on the full PETSc vectors, so the input vector is scaled before
+        and unscaled after the transfer.
+
+        Parameters
+        ----------
+        in_vec : <PETScVector>
+            pointer to the input vector.
+        out_vec : <PETScVector>
+            pointer to the output vector.
+        mode : str
+            'fwd' or 'rev'.
+        """
+        Transfer._scaled_transfer(self, in_vec, out_vec, mode)
+
     def _transfer(self, in_vec, out_vec, mode='fwd'):
         """
         Perform transfer.
@@ -0,0 +1,264 @@
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.vectors.default_transfer import DefaultTransfer, _get_slice_runs
+from openmdao.vectors.transfer import Transfer
+from openmdao.utils.assert_utils import assert_rel_error
+
+
+class TestSliceRuns(unittest.TestCase):
+
+    def test_all_contiguous(self):
+        in_inds = np.arange(10, 50)
+        out_inds = np.arange(100, 140)
+        slices, scat_in, scat_out = _get_slice_runs(in_inds, out_inds)
+
+        self.assertEqual(slices, [(slice(10, 50), slice(100, 140))])
+        self.assertEqual(scat_in.size, 0)
+        self.assertEqual(scat_out.size, 0)
+
+    def test_all_scattered(self):
+        in_inds = np.arange(10)
+        out_inds = np.arange(10)[::-1]
+        slices, scat_in, scat_out = _get_slice_runs(in_inds, out_inds)
+
+        self.assertEqual(slices, [])
+        np.testing.assert_array_equal(scat_in, in_inds)
+        np.testing.assert_array_equal(scat_out, out_inds)
+
+    def test_empty(self):
+        empty = np.array([], dtype=int)
+        slices, scat_in, scat_out = _get_slice_runs(empty, empty)
+
+        self.assertEqual(slices, [])
+        self.assertEqual(scat_in.size, 0)
+        self.assertEqual(scat_out.size, 0)
+
+    def test_mixed(self):
+        # run of 20, 3 scattered entries, run of 5 (too short), run of 30 broken on the output
+        in_inds = np.concatenate([np.arange(20), [20, 21, 22], np.arange(23, 28),
+                                  np.arange(28, 58)])
+        out_inds = np.concatenate([np.arange(100, 120), [7, 3, 5], np.arange(40, 45),
+                                   np.arange(200, 230)])
+        slices, scat_in, scat_out = _get_slice_runs(in_inds, out_inds, min_run=10)
+
+        self.assertEqual(slices, [(slice(0, 20), slice(100, 120)),
+                                  (slice(28, 58), slice(200, 230))])
+        np.testing.assert_array_equal(scat_in, np.arange(20, 28))
+        np.testing.assert_array_equal(scat_out, [7, 3, 5, 40, 41, 42, 43, 44])
+
+        # applying the slices plus the leftover indices must match a fancy indexed copy
+        src = np.random.random(300)
+        expected = np.zeros(58)
+        expected[in_inds] = src[out_inds]
+
+        actual = np.zeros(58)
+        for in_slice, out_slice in slices:
+            actual[in_slice] = src[out_slice]
+        actual[scat_in] = src[scat_out]
+
+        np.testing.assert_array_equal(actual, expected)
+
+
+class _DataHolder(object):
+    # minimal stand-in for a vector, since transfers only touch _data
+    def __init__(self, data):
+        self._data = data
+
+
+class TestScatterAdd(unittest.TestCase):
+
+    def _check_rev(self, ncol, dtype=float):
+        # contiguous run, then scattered entries with repeated output indices
+        in_inds = np.arange(40)
+        out_inds = np.concatenate([np.arange(5, 25), [0, 3, 3, 0, 7, 1, 3, 24, 24, 2],
+                                   np.arange(10, 20)[::-1]])
+        shape = (40,) if ncol == 1 else (40, ncol)
+        in_data = np.random.random(shape).astype(dtype)
+        if dtype == complex:
+            in_data += 1j * np.random.random(shape)
+
+        out_shape = (30,) if ncol == 1 else (30, ncol)
+        expected = np.ones(out_shape, dtype=dtype)
+        np.add.at(expected, out_inds, in_data[in_inds])
+
+        in_vec = _DataHolder(in_data)
+        out_vec = _DataHolder(np.ones(out_shape, dtype=dtype))
+        xfer = DefaultTransfer(in_vec, out_vec, in_inds, out_inds, None)
+        self.assertIsNotNone(xfer._rev_sum_mtx)
+        xfer._transfer(in_vec, out_vec, mode='rev')
+
+        np.testing.assert_allclose(out_vec._data, expected)
+
+    def test_rev(self):
+        self._check_rev(1)
+
+    def test_rev_multi_col(self):
+        self._check_rev(3)
+
+    def test_rev_complex(self):
+        self._check_rev(1, complex)
+        self._check_rev(3, complex)
+
+    def test_rev_no_duplicates(self):
+        in_inds = np.arange(6)
+        out_inds = np.array([5, 1, 4, 0, 2, 3])
+        in_vec = _DataHolder(np.arange(6, dtype=float))
+        out_vec = _DataHolder(np.ones(6))
+        xfer = DefaultTransfer(in_vec, out_vec, in_inds, out_inds, None)
+        self.assertIsNone(xfer._rev_sum_mtx)
+        xfer._transfer(in_vec, out_vec, mode='rev')
+
+        np.testing.assert_array_equal(out_vec._data, [4., 2., 5., 6., 3., 1.])
+
+
+class TestDefaultTransfer(unittest.TestCase):
+
+    def _build_model(self, vectorize=False):
+        size = 50
+        # long contiguous run followed by a scattered tail
+        src_indices = np.concatenate([np.arange(5, 45), [3, 0, 49, 2, 48, 1, 47, 4, 46, 45]])
+
+        p = om.Problem()
+        model = p.model
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('x', np.arange(size, dtype=float))
+        ivc.add_output('y', np.arange(size, dtype=float) * 2.)
+
+        model.add_subsystem('full', om.ExecComp('z = 3.0 * x', x=np.zeros(size),
+                                                z=np.zeros(size)))
+        model.add_subsystem('part', om.ExecComp('z = 2.0 * x + y', x=np.zeros(size),
+                                                y=np.zeros(size), z=np.zeros(size)))
+
+        model.connect('ivc.x', 'full.x')
+        model.connect('ivc.x', 'part.x', src_indices=src_indices)
+        model.connect('ivc.y', 'part.y')
+
+        model.add_design_var('ivc.x', vectorize_derivs=vectorize)
+        model.add_design_var('ivc.y', vectorize_derivs=vectorize)
+        model.add_constraint('full.z', lower=0., vectorize_derivs=vectorize)
+        model.add_constraint('part.z', lower=0., vectorize_derivs=vectorize)
+
+        return p, src_indices
+
+    def _check(self, mode, vectorize):
+        p, src_indices = self._build_model(vectorize)
+        p.setup(mode=mode)
+        p.run_model()
+
+        x = np.arange(50, dtype=float)
+        assert_rel_error(self, p['full.x'], x)
+        assert_rel_error(self, p['part.x'], x[src_indices])
+        assert_rel_error(self, p['part.z'], 2.0 * x[src_indices] + 2.0 * x)
+
+        J = p.compute_totals()
+        assert_rel_error(self, J['full.z', 'ivc.x'], 3.0 * np.eye(50))
+
+        expected = np.zeros((50, 50))
+        expected[np.arange(50), src_indices] = 2.0
+        assert_rel_error(self, J['part.z', 'ivc.x'], expected)
+        assert_rel_error(self, J['part.z', 'ivc.y'], np.eye(50))
+
+    def test_fwd(self):
+        self._check('fwd', False)
+
+    def test_rev(self):
+        self._check('rev', False)
+
+    def test_fwd_vectorized(self):
+        self._check('fwd', True)
+
+    def test_rev_vectorized(self):
+        self._check('rev', True)
+
+
+class TestScaledTransfer(unittest.TestCase):
+
+    def _build_model(self, vectorize=False, ref=1., ref0=0.):
+        size = 50
+        src_indices = np.concatenate([np.arange(5, 45), [3, 0, 49, 2, 48, 1, 47, 4, 46, 45]])
+
+        p = om.Problem()
+        model = p.model
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('x', np.arange(size, dtype=float), units='m', ref=ref, ref0=ref0)
+
+        model.add_subsystem('full', om.ExecComp('z = 3.0 * x',
+                                                x={'value': np.zeros(size), 'units': 'cm'},
+                                                z=np.zeros(size)))
+        model.add_subsystem('part', om.ExecComp('z = 2.0 * x',
+                                                x={'value': np.zeros(size), 'units': 'mm'},
+                                                z=np.zeros(size)))
+
+        model.connect('ivc.x', 'full.x')
+        model.connect('ivc.x', 'part.x', src_indices=src_indices)
+
+        model.add_design_var('ivc.x', vectorize_derivs=vectorize)
+        model.add_constraint('full.z', lower=0., vectorize_derivs=vectorize)
+        model.add_constraint('part.z', lower=0., vectorize_derivs=vectorize)
+
+        return p, src_indices
+
+    def _check(self, mode, vectorize):
+        p, src_indices = self._build_model(vectorize)
+        p.setup(mode=mode)
+        p.run_model()
+
+        x = np.arange(50, dtype=float)
+        assert_rel_error(self, p['full.x'], 100. * x)
+        assert_rel_error(self, p['part.x'], 1000. * x[src_indices])
+
+        J = p.compute_totals()
+        assert_rel_error(self, J['full.z', 'ivc.x'], 300.0 * np.eye(50))
+
+        expected = np.zeros((50, 50))
+        expected[np.arange(50), src_indices] = 2000.0
+        assert_rel_error(self, J['part.z', 'ivc.x'], expected)
+
+    def test_fwd(self):
+        self._check('fwd', False)
+
+    def test_rev(self):
+        self._check('rev', False)
+
+    def test_fwd_vectorized(self):
+        self._check('fwd', True)
+
+    def test_rev_vectorized(self):
+        self._check('rev', True)
+
+    def test_matches_unfused(self):
+        p, _ = self._build_model(ref=5., ref0=1.)
+        p.setup(mode='rev')
+        p.run_model()
+
+        model = p.model
+        xfer = model._transfers['linear']['rev', None]
+
+        for vec_name in ('nonlinear', 'linear'):
+            inputs = model._vectors['input'][vec_name]
+            outputs = model._vectors['output'][vec_name]
+            for mode in ('fwd', 'rev'):
+                inputs._data[:] = np.random.random(inputs._data.size)
+                outputs._data[:] = np.random.random(outputs._data.size)
+                in_start = inputs._data.copy()
+                out_start = outputs._data.copy()
+
+                Transfer._scaled_transfer(xfer, inputs, outputs, mode)
+                expected_in = inputs._data.copy()
+                expected_out = outputs._data.copy()
+
+                inputs._data[:] = in_start
+                outputs._data[:] = out_start
+                xfer._scaled_transfer(inputs, outputs, mode)
+
+                assert_rel_error(self, inputs._data, expected_in, 1e-12)
+                assert_rel_error(self, outputs._data, expected_out, 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -52,6 +52,31 @@ class Transfer(object):
         except Exception as err:
             return "<error during call to Transfer.__str__: %s" % err
 
+    def _scaled_transfer(self, in_vec, out_vec, mode='fwd'):
+        """
+        Perform transfer, converting the transferred values to the units/scaling of the inputs.
+
+        The input vector is scaled before and unscaled after the transfer. Subclasses may
+        override this to apply the scaling as part of the transfer itself.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        out_vec : <Vector>
+            pointer to the output vector.
+        mode : str
+            'fwd' or 'rev'.
+        """
+        if mode == 'fwd':
+            in_vec.scale('norm')
+            self._transfer(in_vec, out_vec, mode)
+            in_vec.scale('phys')
+        else:  # rev
+            in_vec.scale('phys')
+            self._transfer(in_vec, out_vec, mode)
+            in_vec.scale('norm')
+
     def __call__(self, in_vec, out_vec, mode='fwd'):
         """
         Perform transfer.